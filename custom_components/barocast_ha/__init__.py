@@ -10,9 +10,10 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 
 from .const import DOMAIN
-from .coordinator import BarocastHACoordinator
+from .coordinator import BarocastHACoordinator, async_remove_history
+from .scheduler import BarocastScheduler
 
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.WEATHER]
 LOGGER = logging.getLogger(__name__)
 
 ENTITY_ID_BY_KEY: dict[str, str] = {
@@ -33,10 +34,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: BarocastHAConfigEntry) -
     """Set up Barocast HA from a config entry."""
     _async_migrate_sensor_entity_ids(hass, entry)
 
-    coordinator = BarocastHACoordinator(hass, entry)
+    # One scheduler drives every station, see BarocastScheduler.
+    scheduler: BarocastScheduler | None = hass.data.get(DOMAIN)
+    if scheduler is None:
+        scheduler = hass.data[DOMAIN] = BarocastScheduler(hass)
+
+    coordinator = BarocastHACoordinator(hass, entry, scheduler)
+    await coordinator.async_prepare_engine()
+    await coordinator.async_restore_history()
     await coordinator.async_config_entry_first_refresh()
 
     entry.runtime_data = coordinator
+    entry.async_on_unload(scheduler.async_add(coordinator))
+    entry.async_on_unload(coordinator.async_track_source_entities())
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     return True
@@ -44,7 +54,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: BarocastHAConfigEntry) -
 
 async def async_unload_entry(hass: HomeAssistant, entry: BarocastHAConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        scheduler: BarocastScheduler = hass.data[DOMAIN]
+        scheduler.async_remove(entry.runtime_data)
+        if not scheduler:
+            # Last station gone: do not leave a timer behind in hass.data.
+            scheduler.async_shutdown()
+            hass.data.pop(DOMAIN)
+        # Flush pending history writes so a reload starts from fresh samples.
+        await entry.runtime_data.async_save_history()
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: BarocastHAConfigEntry) -> None:
+    """Remove persisted data of a deleted config entry."""
+    await async_remove_history(hass, entry.entry_id)
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: BarocastHAConfigEntry) -> None:
@@ -66,6 +91,10 @@ def _async_migrate_sensor_entity_ids(hass: HomeAssistant, entry: ConfigEntry) ->
                 continue
             if entity.entity_id == new_entity_id:
                 break
+            # Additional stations keep their own IDs once the canonical
+            # ones are taken by another entry.
+            if entity_registry.async_get(new_entity_id) is not None:
+                break
             try:
                 entity_registry.async_update_entity(entity.entity_id, new_entity_id=new_entity_id)
                 LOGGER.info("Renamed %s -> %s", entity.entity_id, new_entity_id)
@@ -9,21 +9,43 @@ from homeassistant import config_entries
 from homeassistant.helpers import selector
 
 from .const import (
+    ATTRIBUTE_MODE_COMPACT,
+    ATTRIBUTE_MODE_LEGACY,
+    ATTRIBUTE_MODE_UNRECORDED,
     CONF_ALTITUDE,
+    CONF_ATTRIBUTE_MODE,
+    CONF_EVENT_DRIVEN,
+    CONF_EXTREMES_WINDOWS,
     CONF_HEMISPHERE,
+    CONF_KALMAN_TREND,
     CONF_LANGUAGE,
     CONF_PRESSURE_ENTITY,
+    CONF_PRESSURE_HORIZONS,
     CONF_PRESSURE_IS_SEA_LEVEL,
+    CONF_SPIKE_FILTER,
+    CONF_SPIKE_FILTER_MIN_DEVIATION,
+    CONF_SPIKE_FILTER_WINDOW,
     CONF_TEMPERATURE_ENTITY,
     CONF_UPDATE_INTERVAL,
+    CONF_UPDATE_TIMINGS,
     CONF_WIND_DIRECTION_ENTITY,
     CONF_WIND_SPEED_ENTITY,
     DEFAULT_ALTITUDE,
+    DEFAULT_ATTRIBUTE_MODE,
+    DEFAULT_EVENT_DRIVEN,
+    DEFAULT_EXTREMES_WINDOWS,
     DEFAULT_HEMISPHERE,
+    DEFAULT_KALMAN_TREND,
     DEFAULT_LANGUAGE,
+    DEFAULT_PRESSURE_HORIZONS,
     DEFAULT_PRESSURE_IS_SEA_LEVEL,
+    DEFAULT_SPIKE_FILTER,
+    DEFAULT_SPIKE_FILTER_MIN_DEVIATION,
+    DEFAULT_SPIKE_FILTER_WINDOW,
     DEFAULT_UPDATE_INTERVAL_SECONDS,
+    DEFAULT_UPDATE_TIMINGS,
     DOMAIN,
+    EXTREMES_WINDOW_HOURS,
     HEMISPHERE_NORTH,
     HEMISPHERE_SOUTH,
     LANG_DE,
@@ -31,6 +53,7 @@ from .const import (
     LANG_EN,
     LANG_FR,
     LANG_IT,
+    PRESSURE_HORIZON_HOURS,
 )
 
 LANGUAGE_OPTIONS = [
@@ -46,6 +69,15 @@ HEMISPHERE_OPTIONS = [
     {"value": HEMISPHERE_SOUTH, "label": "Southern hemisphere"},
 ]
 
+PRESSURE_HORIZON_OPTIONS = [{"value": str(hours), "label": f"{hours} h"} for hours in PRESSURE_HORIZON_HOURS]
+EXTREMES_WINDOW_OPTIONS = [{"value": str(hours), "label": f"{hours} h"} for hours in EXTREMES_WINDOW_HOURS]
+
+ATTRIBUTE_MODE_OPTIONS = [
+    {"value": ATTRIBUTE_MODE_UNRECORDED, "label": "Full attributes, not recorded"},
+    {"value": ATTRIBUTE_MODE_LEGACY, "label": "Full attributes, recorded (legacy)"},
+    {"value": ATTRIBUTE_MODE_COMPACT, "label": "Compact numeric codes"},
+]
+
 
 class BarocastHAConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Barocast HA."""
@@ -59,9 +91,6 @@ class BarocastHAConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> config_entries.ConfigFlowResult:
         """Handle first step."""
-        if self._async_current_entries():
-            return self.async_abort(reason="single_instance_allowed")
-
         errors: dict[str, str] = {}
         if user_input is not None:
             clean_input = _clean_input(user_input)
@@ -70,7 +99,7 @@ class BarocastHAConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if not errors:
                 await self.async_set_unique_id(f"{DOMAIN}_{clean_input[CONF_PRESSURE_ENTITY]}")
                 self._abort_if_unique_id_configured()
-                return self.async_create_entry(title="Barocast HA", data=clean_input)
+                return self.async_create_entry(title=self._entry_title(clean_input), data=clean_input)
 
         return self.async_show_form(
             step_id="user",
@@ -78,6 +107,15 @@ class BarocastHAConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    def _entry_title(self, user_input: dict[str, Any]) -> str:
+        """Return the entry title, naming the station after the first one."""
+        if not self._async_current_entries():
+            return "Barocast HA"
+        pressure_entity = user_input[CONF_PRESSURE_ENTITY]
+        state = self.hass.states.get(pressure_entity)
+        station = state.name if state is not None else pressure_entity
+        return f"Barocast HA ({station})"
+
     def _validate_input(self, user_input: dict[str, Any]) -> dict[str, str]:
         """Validate form values."""
         errors: dict[str, str] = {}
@@ -129,7 +167,16 @@ class BarocastHAOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             clean_input = _clean_input(user_input)
             errors = _validate_with_hass(self.hass, clean_input)
+            pressure_entity = clean_input.get(CONF_PRESSURE_ENTITY)
+            if not errors and self._pressure_entity_taken(pressure_entity):
+                errors[CONF_PRESSURE_ENTITY] = "already_configured"
             if not errors:
+                unique_id = f"{DOMAIN}_{pressure_entity}"
+                if self._config_entry.unique_id != unique_id:
+                    # Options go in the same update so the entry reloads once.
+                    self.hass.config_entries.async_update_entry(
+                        self._config_entry, unique_id=unique_id, options=clean_input
+                    )
                 return self.async_create_entry(title="", data=clean_input)
         else:
             errors = {}
@@ -140,6 +187,18 @@ class BarocastHAOptionsFlow(config_entries.OptionsFlow):
             errors=errors,
         )
 
+    def _pressure_entity_taken(self, pressure_entity: str) -> bool:
+        """Return whether another station already reads this pressure entity."""
+        unique_id = f"{DOMAIN}_{pressure_entity}"
+        for entry in self.hass.config_entries.async_entries(DOMAIN):
+            if entry.entry_id == self._config_entry.entry_id:
+                continue
+            if entry.unique_id == unique_id:
+                return True
+            if {**entry.data, **entry.options}.get(CONF_PRESSURE_ENTITY) == pressure_entity:
+                return True
+        return False
+
 
 def _build_schema(defaults: dict[str, Any] | None) -> vol.Schema:
     """Build configuration schema for setup and options."""
@@ -214,6 +273,74 @@ def _build_schema(defaults: dict[str, Any] | None) -> vol.Schema:
                 unit_of_measurement="s",
             )
         ),
+        vol.Required(
+            CONF_EVENT_DRIVEN,
+            default=defaults.get(CONF_EVENT_DRIVEN, DEFAULT_EVENT_DRIVEN),
+        ): selector.BooleanSelector(),
+        vol.Required(
+            CONF_ATTRIBUTE_MODE,
+            default=defaults.get(CONF_ATTRIBUTE_MODE, DEFAULT_ATTRIBUTE_MODE),
+        ): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=ATTRIBUTE_MODE_OPTIONS,
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            )
+        ),
+        vol.Required(
+            CONF_SPIKE_FILTER,
+            default=defaults.get(CONF_SPIKE_FILTER, DEFAULT_SPIKE_FILTER),
+        ): selector.BooleanSelector(),
+        vol.Required(
+            CONF_SPIKE_FILTER_WINDOW,
+            default=defaults.get(CONF_SPIKE_FILTER_WINDOW, DEFAULT_SPIKE_FILTER_WINDOW),
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=5,
+                max=60,
+                step=1,
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Required(
+            CONF_SPIKE_FILTER_MIN_DEVIATION,
+            default=defaults.get(CONF_SPIKE_FILTER_MIN_DEVIATION, DEFAULT_SPIKE_FILTER_MIN_DEVIATION),
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0.5,
+                max=20,
+                step=0.1,
+                mode=selector.NumberSelectorMode.BOX,
+                unit_of_measurement="hPa",
+            )
+        ),
+        vol.Required(
+            CONF_KALMAN_TREND,
+            default=defaults.get(CONF_KALMAN_TREND, DEFAULT_KALMAN_TREND),
+        ): selector.BooleanSelector(),
+        vol.Required(
+            CONF_PRESSURE_HORIZONS,
+            default=[str(hours) for hours in defaults.get(CONF_PRESSURE_HORIZONS, DEFAULT_PRESSURE_HORIZONS)],
+        ): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=PRESSURE_HORIZON_OPTIONS,
+                multiple=True,
+                mode=selector.SelectSelectorMode.LIST,
+            )
+        ),
+        vol.Required(
+            CONF_EXTREMES_WINDOWS,
+            default=[str(hours) for hours in defaults.get(CONF_EXTREMES_WINDOWS, DEFAULT_EXTREMES_WINDOWS)],
+        ): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=EXTREMES_WINDOW_OPTIONS,
+                multiple=True,
+                mode=selector.SelectSelectorMode.LIST,
+            )
+        ),
+        vol.Required(
+            CONF_UPDATE_TIMINGS,
+            default=defaults.get(CONF_UPDATE_TIMINGS, DEFAULT_UPDATE_TIMINGS),
+        ): selector.BooleanSelector(),
         temp_field: selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor")),
         wind_speed_field: selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor")),
         wind_direction_field: selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor")),
@@ -239,6 +366,16 @@ def _clean_input(user_input: dict[str, Any]) -> dict[str, Any]:
 
     clean[CONF_ALTITUDE] = float(clean.get(CONF_ALTITUDE, DEFAULT_ALTITUDE))
     clean[CONF_UPDATE_INTERVAL] = int(clean.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL_SECONDS))
+    clean[CONF_PRESSURE_HORIZONS] = sorted(
+        {int(hours) for hours in clean.get(CONF_PRESSURE_HORIZONS, DEFAULT_PRESSURE_HORIZONS)}
+    )
+    clean[CONF_EXTREMES_WINDOWS] = sorted(
+        {int(hours) for hours in clean.get(CONF_EXTREMES_WINDOWS, DEFAULT_EXTREMES_WINDOWS)}
+    )
+    clean[CONF_SPIKE_FILTER_WINDOW] = int(clean.get(CONF_SPIKE_FILTER_WINDOW, DEFAULT_SPIKE_FILTER_WINDOW))
+    clean[CONF_SPIKE_FILTER_MIN_DEVIATION] = float(
+        clean.get(CONF_SPIKE_FILTER_MIN_DEVIATION, DEFAULT_SPIKE_FILTER_MIN_DEVIATION)
+    )
     return clean
 
 
@@ -15,10 +15,27 @@ CONF_PRESSURE_IS_SEA_LEVEL = "pressure_is_sea_level"
 CONF_ALTITUDE = "altitude"
 CONF_HEMISPHERE = "hemisphere"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_EVENT_DRIVEN = "event_driven"
+CONF_ATTRIBUTE_MODE = "attribute_mode"
+CONF_UPDATE_TIMINGS = "update_timings"
+CONF_SPIKE_FILTER = "spike_filter"
+CONF_SPIKE_FILTER_WINDOW = "spike_filter_window"
+CONF_SPIKE_FILTER_MIN_DEVIATION = "spike_filter_min_deviation"
+CONF_KALMAN_TREND = "kalman_trend"
+CONF_PRESSURE_HORIZONS = "pressure_horizons"
+CONF_EXTREMES_WINDOWS = "extremes_windows"
 
 HEMISPHERE_NORTH = "north"
 HEMISPHERE_SOUTH = "south"
 
+# How the forecast sensors publish their attributes:
+# - unrecorded: full legacy payload, heavy attributes excluded from the recorder
+# - legacy: full legacy payload, everything recorded (previous behavior)
+# - compact: numeric codes only, cards expand texts and icons client-side
+ATTRIBUTE_MODE_UNRECORDED = "unrecorded"
+ATTRIBUTE_MODE_LEGACY = "legacy"
+ATTRIBUTE_MODE_COMPACT = "compact"
+
 LANG_DE = "de"
 LANG_EN = "en"
 LANG_EL = "el"
@@ -33,11 +50,97 @@ DEFAULT_ALTITUDE = 0.0
 DEFAULT_HEMISPHERE = HEMISPHERE_NORTH
 DEFAULT_UPDATE_INTERVAL_SECONDS = 300
 DEFAULT_UPDATE_INTERVAL = timedelta(seconds=DEFAULT_UPDATE_INTERVAL_SECONDS)
+DEFAULT_EVENT_DRIVEN = False
+DEFAULT_ATTRIBUTE_MODE = ATTRIBUTE_MODE_UNRECORDED
+DEFAULT_UPDATE_TIMINGS = False
+DEFAULT_SPIKE_FILTER = False
+DEFAULT_SPIKE_FILTER_WINDOW = 15
+DEFAULT_SPIKE_FILTER_MIN_DEVIATION = 2.0
+DEFAULT_KALMAN_TREND = False
+DEFAULT_PRESSURE_HORIZONS: list[int] = []
+DEFAULT_EXTREMES_WINDOWS: list[int] = []
+
+# In event-driven mode, source changes arriving within this cooldown are merged
+# into a single recompute and the periodic timer only acts as a watchdog.
+EVENT_DEBOUNCE_SECONDS = 5.0
+EVENT_WATCHDOG_INTERVAL = timedelta(minutes=15)
+
+SUN_ENTITY_ID = "sun.sun"
+
+# Stations due within this window of each other are recomputed together.
+SCHEDULER_BATCH_WINDOW_SECONDS = 1.0
+
+PRESSURE_HISTORY_WINDOW = timedelta(hours=3)
+TEMPERATURE_HISTORY_WINDOW = timedelta(hours=2)
+TEMPERATURE_CHANGE_HORIZON = timedelta(hours=1)
+# Hard cap per rolling history, whatever the update or event rate.
+HISTORY_MAX_SAMPLES = 2048
+# Readings are averaged into buckets of this length before entering history.
+HISTORY_BUCKET_SECONDS = 60
+# Extra pressure change horizons (hours) that can be enabled, each exposed
+# as a sensor. The pressure history is then kept for the longest horizon
+# plus a margin, so samples bracket its start without relying on the anchor.
+PRESSURE_HORIZON_HOURS = (1, 3, 6, 12, 24)
+PRESSURE_HORIZON_MARGIN = timedelta(minutes=15)
+# Rolling pressure/temperature minimum and maximum windows (hours) that can
+# be enabled; any of them also enables the daily high/low since midnight.
+EXTREMES_WINDOW_HOURS = (1, 3, 6, 12, 24, 48)
+
+# Window changes are read at exactly "now - horizon"; the newest sample older
+# than a window is kept as its anchor. A change is "partial" when the history
+# does not reach back that far (it is then the change since the oldest
+# sample) and "gap" when the samples around the window start are further
+# apart than the maximum gap (downtime, sparse updates).
+COVERAGE_FULL = "full"
+COVERAGE_PARTIAL = "partial"
+COVERAGE_GAP = "gap"
+HISTORY_MAX_GAP = timedelta(minutes=30)
+
+# Hourly forecast of the weather entity. Temperatures are extrapolated from
+# the short-term slope only up to the first detail window.
+WEATHER_FORECAST_HOURS = 12
+WEATHER_TEMPERATURE_HORIZON_HOURS = 3
+
+# Pressure spike filter (Hampel): a reading is replaced by the median of the
+# last readings when it deviates from it by more than this many robust
+# sigmas (and by more than the configured minimum deviation).
+SPIKE_FILTER_THRESHOLD_SIGMAS = 3.0
+SPIKE_FILTER_MIN_SAMPLES = 5
+
+# Kalman pressure trend: level/rate state with a constant-rate model. The
+# rate follows a random walk of this spectral density ((hPa/h)^2 per hour),
+# readings carry this much noise, and a first reading starts with this rate
+# uncertainty. The state is restarted after a gap longer than the 3h window.
+KALMAN_RATE_NOISE = 0.001
+KALMAN_PRESSURE_NOISE_HPA = 0.1
+KALMAN_INITIAL_RATE_SIGMA_HPA_PER_HOUR = 1.0
+
+# Per-stage update timings (diagnostics) keep this many recent updates.
+UPDATE_TIMINGS_WINDOW = 256
+
+# Rolling histories are persisted so restarts do not reset the 3h trend.
+# Writes are delayed so consecutive updates are batched into one disk write.
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY_SECONDS = 300
+
+# Cold starts without persisted history are seeded from the recorder. The
+# query is bounded in time and its result thinned so boot stays fast.
+RECORDER_BACKFILL_TIMEOUT_SECONDS = 10
+RECORDER_BACKFILL_MAX_SAMPLES = 720
 
 PRESSURE_TREND_THRESHOLD = 1.6
+# WMO pressure tendency: half-window changes within this many hPa count as
+# steady, and a half changing more than this ratio times the other one is a
+# "more rapidly" / "more slowly" change.
+PRESSURE_TENDENCY_STEADY_HPA = 0.2
+PRESSURE_TENDENCY_RATE_RATIO = 2.0
+# A fall of this much in 3h ("falling rapidly"), or an accelerating fall past
+# the trend threshold, is reported as a deepening low.
+DEEPENING_LOW_FALL_HPA = 3.6
 WIND_CALM_THRESHOLD_KMH = 1.0
 TEMPERATURE_STANDARD_ATMOSPHERE_C = 15.0
 TEMPERATURE_MAX_FORECAST_SLOPE_C_PER_H = 4.0
+TEMPERATURE_SLOPE_WINDOW_SECONDS = 90 * 60
 
 TITLE_BY_LANG = {
     LANG_DE: "Lokale Wettervorhersage",
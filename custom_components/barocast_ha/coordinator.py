@@ -2,55 +2,113 @@
 
 from __future__ import annotations
 
-from collections import deque
-from dataclasses import dataclass
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
 import logging
-from typing import Any
+from math import ceil, inf
+from typing import TYPE_CHECKING, Any
 
+from homeassistant.components.recorder import get_instance, history as recorder_history
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import EventStateChangedData, async_track_state_change_event
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    ATTRIBUTE_MODE_COMPACT,
     CONF_ALTITUDE,
+    CONF_ATTRIBUTE_MODE,
+    CONF_EVENT_DRIVEN,
+    CONF_EXTREMES_WINDOWS,
     CONF_HEMISPHERE,
+    CONF_KALMAN_TREND,
     CONF_LANGUAGE,
     CONF_PRESSURE_ENTITY,
+    CONF_PRESSURE_HORIZONS,
     CONF_PRESSURE_IS_SEA_LEVEL,
+    CONF_SPIKE_FILTER,
+    CONF_SPIKE_FILTER_MIN_DEVIATION,
+    CONF_SPIKE_FILTER_WINDOW,
     CONF_TEMPERATURE_ENTITY,
     CONF_UPDATE_INTERVAL,
+    CONF_UPDATE_TIMINGS,
     CONF_WIND_DIRECTION_ENTITY,
     CONF_WIND_SPEED_ENTITY,
     DEFAULT_ALTITUDE,
+    DEFAULT_ATTRIBUTE_MODE,
+    DEFAULT_EVENT_DRIVEN,
+    DEFAULT_EXTREMES_WINDOWS,
     DEFAULT_HEMISPHERE,
+    DEFAULT_KALMAN_TREND,
     DEFAULT_LANGUAGE,
+    DEFAULT_PRESSURE_HORIZONS,
     DEFAULT_PRESSURE_IS_SEA_LEVEL,
+    DEFAULT_SPIKE_FILTER,
+    DEFAULT_SPIKE_FILTER_MIN_DEVIATION,
+    DEFAULT_SPIKE_FILTER_WINDOW,
     DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_UPDATE_TIMINGS,
+    DOMAIN,
+    EVENT_DEBOUNCE_SECONDS,
+    EVENT_WATCHDOG_INTERVAL,
     HEMISPHERE_NORTH,
+    HISTORY_MAX_GAP,
+    RECORDER_BACKFILL_MAX_SAMPLES,
+    RECORDER_BACKFILL_TIMEOUT_SECONDS,
+    STORAGE_SAVE_DELAY_SECONDS,
+    STORAGE_VERSION,
+    SUN_ENTITY_ID,
+    TEMPERATURE_HISTORY_WINDOW,
     TEMPERATURE_STANDARD_ATMOSPHERE_C,
     TITLE_BY_LANG,
 )
+from .estimators import RollingExtremes, SpikeFilter
 from .forecast_engine import (
-    estimate_temperature_slope_c_per_hour,
+    ForecastInputs,
+    compact_detail,
+    compute_all,
     get_language_index,
+    is_deepening_low,
     neg_zam_detail,
-    neg_zam_forecast,
+    pressure_tendency_code,
     pressure_to_sea_level,
-    pressure_trend_output,
     short_temperature_forecast,
-    short_term_conditions,
-    wind_compass_text,
-    wind_factor,
-    wind_speed_factor,
     zambretti_detail,
-    zambretti_forecast,
 )
+from .history import HistoryBuffer, StationHistory
+from .scheduler import StateReader
+from .texts import TextBundle, get_text_bundle
+from .timings import (
+    STAGE_DETAILS,
+    STAGE_FORECAST,
+    STAGE_HISTORY,
+    STAGE_SEA_LEVEL,
+    STAGE_SLOPE,
+    STAGE_STATE_READS,
+    UpdateTimings,
+)
+
+if TYPE_CHECKING:
+    from .scheduler import BarocastScheduler
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _history_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the storage helper holding the rolling histories of an entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.history")
+
+
+async def async_remove_history(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete persisted histories of a removed config entry."""
+    await _history_store(hass, entry_id).async_remove()
+
+
 @dataclass(slots=True)
 class BarocastHAData:
     """Runtime forecast snapshot used by entities."""
@@ -58,40 +116,140 @@ class BarocastHAData:
     main_state: str
     main_attributes: dict[str, Any]
     zambretti_state: str
-    zambretti_attributes: dict[str, Any]
+    # Detail payloads may be the engine's shared read-only mappings.
+    zambretti_attributes: Mapping[str, Any]
     neg_zam_state: str
-    neg_zam_attributes: dict[str, Any]
+    neg_zam_attributes: Mapping[str, Any]
     pressure: float
     temperature: float | None
     pressure_change: float
     temperature_change: float | None
+    temperature_slope: float | None = None
+    wind_speed: float | None = None
+    wind_bearing: float | None = None
+    is_night: bool = False
+    # Pressure change by configured horizon (hours), None until covered.
+    pressure_changes: dict[int, float | None] = field(default_factory=dict)
+    # Rolling and daily extremes by sensor key, as (value, ISO time).
+    extremes: dict[str, tuple[float, str] | None] = field(default_factory=dict)
 
 
 class BarocastHACoordinator(DataUpdateCoordinator[BarocastHAData]):
-    """Handle periodic forecast updates."""
+    """Handle periodic and event-driven forecast updates."""
 
     config_entry: ConfigEntry
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, scheduler: BarocastScheduler) -> None:
         """Initialize coordinator."""
         self.config_entry = entry
+        self._scheduler = scheduler
+        self._event_driven = bool(self._cfg(CONF_EVENT_DRIVEN, DEFAULT_EVENT_DRIVEN))
         # We keep local rolling histories to emulate HA statistics sensors
         # (3h pressure delta / 1h temperature delta) without extra entities.
-        self._pressure_history: deque[tuple[datetime, float]] = deque()
-        self._temperature_history: deque[tuple[datetime, float]] = deque()
+        self._history = StationHistory(
+            kalman_trend=bool(self._cfg(CONF_KALMAN_TREND, DEFAULT_KALMAN_TREND)),
+            pressure_horizons=[int(hours) for hours in self._cfg(CONF_PRESSURE_HORIZONS, DEFAULT_PRESSURE_HORIZONS)],
+            # Consecutive updates are up to one refresh interval apart.
+            max_gap_seconds=max(HISTORY_MAX_GAP, 2 * self.refresh_interval).total_seconds(),
+        )
+        self._store = _history_store(hass, entry.entry_id)
+        # async_delay_save restarts its delay on every call, so it is only
+        # called when no write is pending; otherwise frequent updates would
+        # postpone the write indefinitely.
+        self._save_pending = False
+        self._language = self._cfg(CONF_LANGUAGE, DEFAULT_LANGUAGE)
+        # Texts of the configured language, loaded by async_prepare_engine.
+        self._texts: TextBundle | None = None
+        self._compact_attributes = self._cfg(CONF_ATTRIBUTE_MODE, DEFAULT_ATTRIBUTE_MODE) == ATTRIBUTE_MODE_COMPACT
+        # Stage timings are opt-in; when disabled every hook is a None check.
+        self.timings = UpdateTimings() if self._cfg(CONF_UPDATE_TIMINGS, DEFAULT_UPDATE_TIMINGS) else None
+        # Sea-level pressure spikes (sensor reboots reporting 0 or 1013.25)
+        # are replaced by the recent median before they reach the history.
+        self.pressure_filter = (
+            SpikeFilter(
+                int(self._cfg(CONF_SPIKE_FILTER_WINDOW, DEFAULT_SPIKE_FILTER_WINDOW)),
+                float(self._cfg(CONF_SPIKE_FILTER_MIN_DEVIATION, DEFAULT_SPIKE_FILTER_MIN_DEVIATION)),
+            )
+            if self._cfg(CONF_SPIKE_FILTER, DEFAULT_SPIKE_FILTER)
+            else None
+        )
+        # Rolling minimum/maximum of p0 and temperature per configured window,
+        # plus the daily high/low, replacing statistics/min_max helpers.
+        self._extremes_windows = sorted(
+            {int(hours) for hours in self._cfg(CONF_EXTREMES_WINDOWS, DEFAULT_EXTREMES_WINDOWS)}
+        )
+        self.extremes: dict[str, RollingExtremes] = (
+            {"pressure": RollingExtremes(), "temperature": RollingExtremes()} if self._extremes_windows else {}
+        )
+        # Periodic refreshes are driven by the shared scheduler, which batches
+        # every station into one callback, so no per-coordinator timer is set.
         super().__init__(
             hass,
             logger=LOGGER,
-            name="Barocast HA",
-            update_interval=self._update_interval,
+            name=entry.title,
+            update_interval=None,
         )
 
     @property
-    def _update_interval(self) -> timedelta:
+    def refresh_interval(self) -> timedelta:
         """Return update interval from config."""
         interval_seconds = int(self._cfg(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL.total_seconds()))
         interval_seconds = min(max(interval_seconds, 30), 3600)
-        return timedelta(seconds=interval_seconds)
+        interval = timedelta(seconds=interval_seconds)
+        if self._event_driven:
+            # Source changes drive updates; the timer only keeps history
+            # sampled and recovers from missed events.
+            return max(interval, EVENT_WATCHDOG_INTERVAL)
+        return interval
+
+    @property
+    def history(self) -> StationHistory:
+        """Return the rolling windows of the station."""
+        return self._history
+
+    @property
+    def extremes_windows(self) -> list[int]:
+        """Return the configured extremes windows in hours."""
+        return self._extremes_windows
+
+    @property
+    def _source_entity_ids(self) -> list[str]:
+        """Return configured source entities that feed the forecast."""
+        entity_ids = [
+            self._cfg(key)
+            for key in (
+                CONF_PRESSURE_ENTITY,
+                CONF_TEMPERATURE_ENTITY,
+                CONF_WIND_SPEED_ENTITY,
+                CONF_WIND_DIRECTION_ENTITY,
+            )
+        ]
+        return [entity_id for entity_id in entity_ids if entity_id]
+
+    @callback
+    def async_track_source_entities(self) -> CALLBACK_TYPE:
+        """Recompute on source entity changes when event-driven mode is enabled."""
+        if not self._event_driven:
+            return lambda: None
+        return async_track_state_change_event(
+            self.hass,
+            [*self._source_entity_ids, SUN_ENTITY_ID],
+            self._async_handle_source_event,
+        )
+
+    @callback
+    def _async_handle_source_event(self, event: Event[EventStateChangedData]) -> None:
+        """Schedule a debounced refresh when a source state actually changed."""
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        if new_state is None:
+            return
+        # Attribute-only updates (e.g. sun elevation) do not affect the forecast.
+        if old_state is not None and old_state.state == new_state.state:
+            return
+        # Bursts of source changes (e.g. pressure + temperature published
+        # together by one weather station) collapse into one recompute.
+        self._scheduler.async_request(self, EVENT_DEBOUNCE_SECONDS)
 
     def _cfg(self, key: str, default: Any = None) -> Any:
         """Get option value with fallback to data and then default."""
@@ -99,68 +257,301 @@ class BarocastHACoordinator(DataUpdateCoordinator[BarocastHAData]):
             return self.config_entry.options[key]
         return self.config_entry.data.get(key, default)
 
-    def _state_as_float(self, entity_id: str, *, required: bool) -> float | None:
+    @staticmethod
+    def _state_as_float(reader: StateReader, entity_id: str, *, required: bool) -> float | None:
         """Read entity state as float."""
-        state = self.hass.states.get(entity_id)
-        if state is None:
-            if required:
+        value = reader.number(entity_id)
+        if value is None and required:
+            if reader.state(entity_id) is None:
                 raise UpdateFailed(f"Entity not found: {entity_id}")
-            return None
+            raise UpdateFailed(f"Entity state is not numeric: {entity_id}")
+        return value
+
+    async def async_prepare_engine(self) -> None:
+        """Load forecast texts off the event loop."""
+        self._texts = await self.hass.async_add_executor_job(get_text_bundle, self._language)
+
+    async def async_restore_history(self) -> None:
+        """Restore rolling histories persisted before the last restart or reload.
+
+        Without a usable persisted buffer, histories are seeded from the recorder.
+        """
+        stored = await self._store.async_load()
+        # Histories of another source or reduction (entity, altitude, sea
+        # level flag) would read as a jump; older snapshots carry no key.
+        if stored and stored.get("config", self._history_config()) != self._history_config():
+            LOGGER.debug("Discarding stored histories recorded with another source configuration")
+            stored = None
+        if stored:
+            now = dt_util.now()
+            self._restore_samples(
+                self._history.pressure,
+                stored.get("pressure"),
+                now,
+                timedelta(seconds=self._history.pressure_retention),
+            )
+            self._restore_samples(
+                self._history.temperature,
+                stored.get("temperature"),
+                now,
+                TEMPERATURE_HISTORY_WINDOW,
+            )
+            LOGGER.debug(
+                "Restored %s pressure and %s temperature samples",
+                len(self._history.pressure),
+                len(self._history.temperature),
+            )
+            for quantity, extremes in self.extremes.items():
+                for sample in stored.get(f"{quantity}_extremes") or ():
+                    try:
+                        timestamp, value = float(sample[0]), float(sample[1])
+                    except (TypeError, ValueError, IndexError):
+                        continue
+                    if timestamp <= now.timestamp():
+                        extremes.add(timestamp, value)
+
+        if not self._history.pressure:
+            self._history.temperature.clear()
+            await self._async_backfill_from_recorder()
+        self._history.temperature_slope.extend(self._history.temperature)
+        self._history.pressure_tendency.extend(self._history.pressure)
+        if self._history.pressure_trend is not None:
+            self._history.pressure_trend.extend(self._history.pressure)
+        if self.pressure_filter is not None:
+            # Seed the filter so a spike right after a restart is caught.
+            self.pressure_filter.extend(list(self._history.pressure.values)[-self.pressure_filter.window :])
+        buffers = {"pressure": self._history.pressure, "temperature": self._history.temperature}
+        for quantity, extremes in self.extremes.items():
+            if not extremes:
+                extremes.extend(buffers[quantity])
+
+    async def _async_backfill_from_recorder(self) -> None:
+        """Seed empty histories from recorder states of the source entities.
+
+        States are reduced with the current settings, so the seeded series
+        always match ``_history_config``, and go through the same bucket
+        aggregation as live readings.
+        """
+        pressure_entity = self._cfg(CONF_PRESSURE_ENTITY)
+        if not pressure_entity or "recorder" not in self.hass.config.components:
+            return
 
+        temp_entity = self._cfg(CONF_TEMPERATURE_ENTITY)
+        entity_ids = [pressure_entity, temp_entity] if temp_entity else [pressure_entity]
+        # Recorder queries expect UTC bounds: local-time ones select nothing.
+        end = dt_util.utcnow()
+        start = end - max(timedelta(seconds=self._history.pressure_retention), TEMPERATURE_HISTORY_WINDOW)
+
+        # One query for all entities, run in the recorder executor and bounded
+        # in time: a slow database must never hold up Home Assistant startup.
         try:
-            return float(state.state)
-        except (TypeError, ValueError):
-            if required:
-                raise UpdateFailed(f"Entity state is not numeric: {entity_id}")
-            return None
+            async with asyncio.timeout(RECORDER_BACKFILL_TIMEOUT_SECONDS):
+                states: dict[str, list[State]] = await get_instance(self.hass).async_add_executor_job(
+                    partial(
+                        recorder_history.get_significant_states,
+                        self.hass,
+                        start,
+                        end,
+                        entity_ids,
+                        significant_changes_only=False,
+                        no_attributes=True,
+                    )
+                )
+        except TimeoutError:
+            LOGGER.warning("Recorder backfill timed out, starting with an empty history")
+            return
+        except Exception:  # noqa: BLE001 - backfill is best effort
+            LOGGER.warning("Recorder backfill failed, starting with an empty history", exc_info=True)
+            return
+
+        temperature_samples = self._numeric_samples(states.get(temp_entity, []) if temp_entity else [], start)
+        pressure_samples = self._numeric_samples(states.get(pressure_entity, []), start)
+
+        pressure_is_sea_level = bool(self._cfg(CONF_PRESSURE_IS_SEA_LEVEL, DEFAULT_PRESSURE_IS_SEA_LEVEL))
+        altitude = float(self._cfg(CONF_ALTITUDE, DEFAULT_ALTITUDE))
+        temperature_index = 0
+        correction_temperature = TEMPERATURE_STANDARD_ATMOSPHERE_C
+        for timestamp, pressure_raw in pressure_samples:
+            # Reduce with the temperature that was current at the sample time.
+            while (
+                temperature_index < len(temperature_samples)
+                and temperature_samples[temperature_index][0] <= timestamp
+            ):
+                correction_temperature = temperature_samples[temperature_index][1]
+                temperature_index += 1
+            p0 = (
+                pressure_raw
+                if pressure_is_sea_level
+                else pressure_to_sea_level(pressure_raw, correction_temperature, altitude)
+            )
+            self._history.seed_pressure(timestamp, p0)
+
+        temperature_cutoff = (end - TEMPERATURE_HISTORY_WINDOW).timestamp()
+        for timestamp, temperature in temperature_samples:
+            if timestamp >= temperature_cutoff:
+                self._history.seed_temperature(timestamp, temperature)
+        LOGGER.debug(
+            "Backfilled %s pressure and %s temperature buckets from the recorder",
+            len(self._history.pressure),
+            len(self._history.temperature),
+        )
 
     @staticmethod
-    def _append_and_prune(
-        history: deque[tuple[datetime, float]],
+    def _numeric_samples(states: list[State], start: datetime) -> list[tuple[float, float]]:
+        """Convert recorder states to (epoch, value) samples capped in count."""
+        samples: list[tuple[float, float]] = []
+        for state in states:
+            try:
+                value = float(state.state)
+            except (TypeError, ValueError):
+                continue
+            # The state active at the start of the window is reported with its
+            # original timestamp; clamp it so it anchors the window start.
+            timestamp = max(state.last_updated, start).timestamp()
+            if samples and timestamp <= samples[-1][0]:
+                samples[-1] = (timestamp, value)
+                continue
+            samples.append((timestamp, value))
+
+        if len(samples) <= RECORDER_BACKFILL_MAX_SAMPLES:
+            return samples
+        stride = ceil(len(samples) / RECORDER_BACKFILL_MAX_SAMPLES)
+        thinned = samples[::stride]
+        if thinned[-1] is not samples[-1]:
+            thinned.append(samples[-1])
+        return thinned
+
+    async def async_save_history(self) -> None:
+        """Write rolling histories to storage immediately."""
+        await self._store.async_save(self._history_snapshot())
+
+    @staticmethod
+    def _restore_samples(
+        history: HistoryBuffer,
+        samples: Any,
         now: datetime,
-        value: float,
         max_age: timedelta,
     ) -> None:
-        """Add point and prune old values."""
-        history.append((now, value))
-        cutoff = now - max_age
-        while history and history[0][0] < cutoff:
-            history.popleft()
-
-    @staticmethod
-    def _change_from_history(history: deque[tuple[datetime, float]], current: float) -> float:
-        """Compute change between current value and oldest sample in window."""
-        if not history:
-            return 0.0
-        return current - history[0][1]
+        """Load stored [epoch, value] pairs, dropping samples outside the window.
+
+        The newest expired sample is kept as the anchor of the window start.
+        """
+        cutoff = (now - max_age).timestamp()
+        last_timestamp = -inf
+        anchor: tuple[float, float] | None = None
+        for sample in samples or ():
+            try:
+                timestamp, value = float(sample[0]), float(sample[1])
+            except (TypeError, ValueError, IndexError):
+                continue
+            # Skip out-of-order and future samples so the buffer stays sorted.
+            if timestamp < last_timestamp or timestamp > now.timestamp():
+                continue
+            last_timestamp = timestamp
+            if timestamp < cutoff:
+                anchor = (timestamp, value)
+                continue
+            if anchor is not None:
+                history.append(*anchor)
+                anchor = None
+            history.append(timestamp, value)
+        if anchor is not None:
+            history.append(*anchor)
+
+    def _history_config(self) -> list[Any]:
+        """Return the settings the stored p0 and temperature series depend on."""
+        return [
+            self._cfg(CONF_PRESSURE_ENTITY),
+            self._cfg(CONF_TEMPERATURE_ENTITY) or None,
+            float(self._cfg(CONF_ALTITUDE, DEFAULT_ALTITUDE)),
+            bool(self._cfg(CONF_PRESSURE_IS_SEA_LEVEL, DEFAULT_PRESSURE_IS_SEA_LEVEL)),
+        ]
+
+    @callback
+    def _history_snapshot(self) -> dict[str, Any]:
+        """Return rolling histories in their storage format."""
+        self._save_pending = False
+        snapshot = {
+            "config": self._history_config(),
+            "pressure": [[round(ts, 3), value] for ts, value in self._history.pressure],
+            "temperature": [[round(ts, 3), value] for ts, value in self._history.temperature],
+        }
+        for quantity, extremes in self.extremes.items():
+            snapshot[f"{quantity}_extremes"] = [[round(ts, 3), value] for ts, value in extremes.samples()]
+        return snapshot
+
+    def _update_extremes(
+        self, now: datetime, p0: float, temperature: float | None
+    ) -> dict[str, tuple[float, str] | None]:
+        """Feed the rolling extremes and read every window and today's high/low."""
+        now_ts = now.timestamp()
+        midnight = dt_util.start_of_local_day(now).timestamp()
+        periods = [(f"min_{hours}h", f"max_{hours}h", now_ts - hours * 3600) for hours in self._extremes_windows]
+        periods.append(("daily_low", "daily_high", midnight))
+
+        result: dict[str, tuple[float, str] | None] = {}
+        for quantity, value in (("pressure", p0), ("temperature", temperature)):
+            extremes = self.extremes[quantity]
+            if value is not None:
+                extremes.add(now_ts, value)
+            extremes.evict_before(min(now_ts - self._extremes_windows[-1] * 3600, midnight))
+            for low_key, high_key, since in periods:
+                result[f"{quantity}_{low_key}"] = _extreme_output(extremes.minimum(since))
+                result[f"{quantity}_{high_key}"] = _extreme_output(extremes.maximum(since))
+        return result
+
+    @callback
+    def async_refresh_from_scheduler(self, reader: StateReader) -> None:
+        """Recompute from states shared with the other stations of a batch."""
+        try:
+            data = self._compute(reader)
+        except UpdateFailed as err:
+            self.async_set_update_error(err)
+        except Exception as err:  # noqa: BLE001 - keep the scheduler running
+            LOGGER.exception("Unexpected error updating %s", self.name)
+            self.async_set_update_error(err)
+        else:
+            self.async_set_updated_data(data)
 
     async def _async_update_data(self) -> BarocastHAData:
         """Fetch and calculate forecast data."""
+        return self._compute(StateReader(self.hass.states))
+
+    def _compute(self, reader: StateReader) -> BarocastHAData:
+        """Calculate forecast data from source states."""
+        timings = self.timings
+        if timings is not None:
+            timings.start()
+
         pressure_entity = self._cfg(CONF_PRESSURE_ENTITY)
         if not pressure_entity:
             raise UpdateFailed("Pressure entity is not configured")
 
-        language = self._cfg(CONF_LANGUAGE, DEFAULT_LANGUAGE)
-        language_index = get_language_index(language)
+        texts = self._texts
+        if texts is None:
+            raise UpdateFailed("Forecast texts are not loaded")
 
-        pressure_raw = self._state_as_float(pressure_entity, required=True)
+        pressure_raw = self._state_as_float(reader, pressure_entity, required=True)
         assert pressure_raw is not None
 
         temp_entity = self._cfg(CONF_TEMPERATURE_ENTITY)
         wind_speed_entity = self._cfg(CONF_WIND_SPEED_ENTITY)
         wind_direction_entity = self._cfg(CONF_WIND_DIRECTION_ENTITY)
 
-        temperature = self._state_as_float(temp_entity, required=False) if temp_entity else None
-        wind_speed = self._state_as_float(wind_speed_entity, required=False) if wind_speed_entity else None
+        temperature = self._state_as_float(reader, temp_entity, required=False) if temp_entity else None
+        wind_speed = self._state_as_float(reader, wind_speed_entity, required=False) if wind_speed_entity else None
         wind_direction = (
-            self._state_as_float(wind_direction_entity, required=False) if wind_direction_entity else None
+            self._state_as_float(reader, wind_direction_entity, required=False) if wind_direction_entity else None
         )
 
+        wind_speed_reading, wind_bearing_reading = wind_speed, wind_direction
         wind_speed = 0.0 if wind_speed is None else wind_speed
         wind_direction = 0.0 if wind_direction is None else wind_direction
         correction_temperature = (
             temperature if temperature is not None else TEMPERATURE_STANDARD_ATMOSPHERE_C
         )
+        if timings is not None:
+            timings.mark(STAGE_STATE_READS)
 
         pressure_is_sea_level = bool(self._cfg(CONF_PRESSURE_IS_SEA_LEVEL, DEFAULT_PRESSURE_IS_SEA_LEVEL))
         altitude = float(self._cfg(CONF_ALTITUDE, DEFAULT_ALTITUDE))
@@ -171,59 +562,56 @@ class BarocastHACoordinator(DataUpdateCoordinator[BarocastHAData]):
             if pressure_is_sea_level
             else pressure_to_sea_level(pressure_raw, correction_temperature, altitude)
         )
+        if self.pressure_filter is not None:
+            p0 = self.pressure_filter.filter(p0)
+        if timings is not None:
+            timings.mark(STAGE_SEA_LEVEL)
 
         now = dt_util.now()
+        now_ts = now.timestamp()
 
-        self._append_and_prune(self._pressure_history, now, p0, timedelta(hours=3))
-        if temperature is None:
-            self._temperature_history.clear()
-        else:
-            self._append_and_prune(self._temperature_history, now, temperature, timedelta(hours=2))
-
-        pressure_change = self._change_from_history(self._pressure_history, p0)
-        temperature_change = (
-            self._change_from_history(self._temperature_history, temperature)
-            if temperature is not None
-            else None
+        pressure_change, temperature_change, pressure_coverage, temperature_coverage = (
+            self._history.update_windows(now_ts, p0, temperature)
         )
-        temperature_slope = (
-            estimate_temperature_slope_c_per_hour(
-                tuple(self._temperature_history),
-                now,
-                temperature_change if temperature_change is not None else 0.0,
+        half_changes = self._history.pressure_half_changes(now_ts)
+        pressure_tendency = pressure_tendency_code(*half_changes) if half_changes is not None else None
+        pressure_changes = {
+            hours: round(change, 2) if change is not None else None
+            for hours, change in zip(
+                self._history.pressure_horizons,
+                self._history.pressure_horizon_changes(now_ts, p0),
             )
-            if temperature is not None
-            else None
-        )
+        }
+        extremes = self._update_extremes(now, p0, temperature) if self.extremes else {}
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._history_snapshot, STORAGE_SAVE_DELAY_SECONDS)
+        if timings is not None:
+            timings.mark(STAGE_HISTORY)
+        temperature_slope = self._history.update_slope(now_ts, temperature, temperature_change)
+        if timings is not None:
+            timings.mark(STAGE_SLOPE)
 
-        wind_speed_flag = wind_speed_factor(wind_speed)
-        wind_direction_factor = wind_factor(wind_direction)
-        wind_direction_text = wind_compass_text(wind_direction)
         hemisphere = self._cfg(CONF_HEMISPHERE, DEFAULT_HEMISPHERE)
-        is_northern_hemisphere = hemisphere == HEMISPHERE_NORTH
-
-        short_condition, pressure_system = short_term_conditions(p0, language_index)
-        zambretti_text, zambretti_type, zambretti_letter = zambretti_forecast(
-            p0,
-            pressure_change,
-            wind_direction,
-            wind_speed,
-            is_northern_hemisphere,
-            language_index,
-            now,
-        )
-
-        neg_zam_text, neg_zam_number, neg_zam_letter = neg_zam_forecast(
-            p0,
-            pressure_change,
-            wind_direction,
-            wind_speed,
-            is_northern_hemisphere,
-            language_index,
-            now,
+        deepening_low = is_deepening_low(pressure_tendency, pressure_change)
+        forecast = compute_all(
+            ForecastInputs(
+                p0,
+                pressure_change,
+                wind_direction,
+                wind_speed,
+                hemisphere == HEMISPHERE_NORTH,
+                now,
+                deepening_low,
+            ),
+            texts,
         )
+        zambretti_type = forecast.zambretti_type
+        neg_zam_number = forecast.neg_zam_number
+        if timings is not None:
+            timings.mark(STAGE_FORECAST)
 
-        sun_state = self.hass.states.get("sun.sun")
+        sun_state = reader.state(SUN_ENTITY_ID)
         is_night = bool(sun_state and sun_state.state == "below_horizon")
 
         zambretti_detail_payload = zambretti_detail(zambretti_type, is_night, now)
@@ -237,30 +625,44 @@ class BarocastHACoordinator(DataUpdateCoordinator[BarocastHAData]):
             temperature_slope,
         )
 
-        trend_text, trend_code = pressure_trend_output(pressure_change, language_index)
-
         main_attributes = {
-            "language": language_index,
+            "language": get_language_index(self._language),
             "temperature": round(temperature, 1) if temperature is not None else None,
             "p0": round(p0, 1),
             "wind_direction": [
-                wind_direction_factor,
+                forecast.wind_factor,
                 round(wind_direction, 1),
-                wind_direction_text,
-                wind_speed_flag,
+                forecast.wind_compass,
+                forecast.wind_speed_factor,
             ],
-            "forecast_short_term": [short_condition, pressure_system],
-            "forecast_zambretti": [zambretti_text, zambretti_type, zambretti_letter],
-            "forecast_neg_zam": [neg_zam_text, neg_zam_number, neg_zam_letter],
-            "forecast_pressure_trend": [trend_text, trend_code],
+            "forecast_short_term": [forecast.short_term_condition_text, forecast.pressure_system_text],
+            "forecast_zambretti": [forecast.zambretti_text, zambretti_type, forecast.zambretti_letter],
+            "forecast_neg_zam": [forecast.neg_zam_text, neg_zam_number, forecast.neg_zam_letter],
+            "forecast_pressure_trend": [forecast.trend_text, forecast.trend_code],
             "forecast_temp_short": [forecast_temp_value, forecast_temp_interval],
             "pressure_change_3h": round(pressure_change, 2),
+            "pressure_tendency": pressure_tendency,
+            "deepening_low": deepening_low,
+            "pressure_change_coverage": pressure_coverage,
             "temperature_change_1h": round(temperature_change, 2) if temperature_change is not None else None,
+            "temperature_change_coverage": temperature_coverage,
             "temperature_trend_slope_1h": round(temperature_slope, 2) if temperature_slope is not None else None,
         }
 
-        return BarocastHAData(
-            main_state=TITLE_BY_LANG.get(language, TITLE_BY_LANG[DEFAULT_LANGUAGE]),
+        if self._compact_attributes:
+            # Same keys, numeric codes instead of translated texts and icons.
+            main_attributes.update(
+                wind_direction=[forecast.wind_factor, round(wind_direction, 1), forecast.wind_speed_factor],
+                forecast_short_term=[forecast.short_term_condition, forecast.pressure_system],
+                forecast_zambretti=zambretti_type,
+                forecast_neg_zam=[neg_zam_number, int(forecast.neg_zam_exceptional)],
+                forecast_pressure_trend=int(forecast.trend_code),
+            )
+            zambretti_detail_payload = compact_detail(zambretti_detail_payload, is_night)
+            neg_zam_detail_payload = compact_detail(neg_zam_detail_payload, is_night)
+
+        data = BarocastHAData(
+            main_state=TITLE_BY_LANG.get(self._language, TITLE_BY_LANG[DEFAULT_LANGUAGE]),
             main_attributes=main_attributes,
             zambretti_state=f"More details on zambretti forecast ({zambretti_type + 1})",
             zambretti_attributes=zambretti_detail_payload,
@@ -270,4 +672,28 @@ class BarocastHACoordinator(DataUpdateCoordinator[BarocastHAData]):
             temperature=round(temperature, 1) if temperature is not None else None,
             pressure_change=round(pressure_change, 2),
             temperature_change=round(temperature_change, 2) if temperature_change is not None else None,
+            temperature_slope=temperature_slope,
+            wind_speed=wind_speed_reading,
+            wind_bearing=wind_bearing_reading,
+            is_night=is_night,
+            pressure_changes=pressure_changes,
+            extremes=extremes,
         )
+        if timings is not None:
+            timings.mark(STAGE_DETAILS)
+            timings.finish()
+        return data
+
+
+def _extreme_output(extreme: tuple[float, float] | None) -> tuple[float, str] | None:
+    """Return a (timestamp, value) extreme as (rounded value, local ISO time)."""
+    if extreme is None:
+        return None
+    timestamp, value = extreme
+    return round(value, 1), _local_isoformat(timestamp)
+
+
+@lru_cache(maxsize=64)
+def _local_isoformat(timestamp: float) -> str:
+    """Format an epoch as local ISO time; extremes repeat across updates."""
+    return dt_util.as_local(dt_util.utc_from_timestamp(timestamp)).isoformat()
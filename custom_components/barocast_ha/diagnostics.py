@@ -0,0 +1,89 @@
+"""Diagnostics support for Barocast HA."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from . import BarocastHAConfigEntry
+from .history import HistoryBuffer, SampleBucket
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: BarocastHAConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data
+    history = coordinator.history
+    now = dt_util.utcnow().timestamp()
+    timings = coordinator.timings
+    pressure_filter = coordinator.pressure_filter
+    pressure_trend = history.pressure_trend
+
+    return {
+        "entry": {
+            "title": entry.title,
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "refresh_interval_seconds": coordinator.refresh_interval.total_seconds(),
+        },
+        "history": {
+            "pressure": _buffer_diagnostics(history.pressure, now),
+            "pressure_retention_seconds": history.pressure_retention,
+            "temperature": _buffer_diagnostics(history.temperature, now),
+            "temperature_slope_samples": len(history.temperature_slope),
+            "pressure_bucket": _bucket_diagnostics(history.pressure_bucket),
+            "temperature_bucket": _bucket_diagnostics(history.temperature_bucket),
+        },
+        "pressure_filter": (
+            {
+                "window": pressure_filter.window,
+                "samples": len(pressure_filter),
+                "rejected": pressure_filter.rejected,
+            }
+            if pressure_filter is not None
+            else None
+        ),
+        "pressure_trend": (
+            {
+                "level": round(pressure_trend.level, 2),
+                "rate_hpa_per_hour": round(pressure_trend.rate, 3),
+                "rate_sigma_hpa_per_hour": round(pressure_trend.rate_sigma, 3),
+            }
+            if pressure_trend is not None and pressure_trend.rate_sigma is not None
+            else None
+        ),
+        "extremes": (
+            {
+                "windows_hours": coordinator.extremes_windows,
+                **{f"{quantity}_pairs": len(extremes) for quantity, extremes in coordinator.extremes.items()},
+            }
+            if coordinator.extremes
+            else None
+        ),
+        "timings": timings.summary() if timings is not None else None,
+    }
+
+
+def _buffer_diagnostics(buffer: HistoryBuffer, now: float) -> dict[str, Any]:
+    """Return size and sample ages of a rolling history."""
+    return {
+        "samples": len(buffer),
+        "capacity": buffer.capacity,
+        "oldest_age_seconds": round(now - buffer.first_timestamp, 1) if buffer else None,
+        "newest_age_seconds": round(now - buffer.last_timestamp, 1) if buffer else None,
+    }
+
+
+def _bucket_diagnostics(bucket: SampleBucket) -> dict[str, Any]:
+    """Return the aggregation state of the open bucket."""
+    if not bucket.count:
+        return {"seconds": bucket.seconds, "samples": 0}
+    return {
+        "seconds": bucket.seconds,
+        "samples": bucket.count,
+        "mean": round(bucket.mean, 3),
+    }
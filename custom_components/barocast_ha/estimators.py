@@ -0,0 +1,625 @@
+"""Streaming estimators for Barocast HA."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from collections.abc import Iterable, Sequence
+from math import isfinite
+
+from .const import (
+    KALMAN_INITIAL_RATE_SIGMA_HPA_PER_HOUR,
+    KALMAN_PRESSURE_NOISE_HPA,
+    KALMAN_RATE_NOISE,
+    PRESSURE_HISTORY_WINDOW,
+    SPIKE_FILTER_MIN_SAMPLES,
+    SPIKE_FILTER_THRESHOLD_SIGMAS,
+    TEMPERATURE_MAX_FORECAST_SLOPE_C_PER_H,
+    TEMPERATURE_SLOPE_WINDOW_SECONDS,
+)
+from .forecast_engine import estimate_temperature_slope_c_per_hour
+
+# Recency weights are linear in sample age until they reach this floor.
+_RECENCY_FLOOR = 0.2
+_DURATION_FULL_WEIGHT_SECONDS = 1200
+# Interquartile range of a normal distribution, in standard deviations.
+_IQR_PER_SIGMA = 1.349
+
+
+class TemperatureSlopeEstimator:
+    """Incremental version of ``estimate_temperature_slope_c_per_hour``.
+
+    Each segment between consecutive samples contributes
+    ``slope * duration_weight * recency_weight``. The recency weight is
+    ``1 - (now - midpoint) / window`` until it reaches its 0.2 floor, so the
+    weighted sums of "linear" segments can be kept as running sums of
+    ``w``, ``w * midpoint``, ``w * slope`` and ``w * slope * midpoint`` and
+    evaluated for any ``now`` in O(1). Segments move to the floored group and
+    then leave the window in time order, so every update is amortized O(1).
+    """
+
+    __slots__ = (
+        "_window",
+        "_linear",
+        "_floored",
+        "_last",
+        "_previous",
+        "_tail",
+        "_origin",
+        "_updates",
+        "_lin_w",
+        "_lin_wm",
+        "_lin_ws",
+        "_lin_wsm",
+        "_floor_w",
+        "_floor_ws",
+    )
+
+    def __init__(self, window_seconds: float = TEMPERATURE_SLOPE_WINDOW_SECONDS) -> None:
+        """Initialize an empty estimator."""
+        self._window = float(window_seconds)
+        # Segments are (start, midpoint, slope, duration weight), oldest first.
+        self._linear: deque[tuple[float, float, float, float]] = deque()
+        self._floored: deque[tuple[float, float, float, float]] = deque()
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all samples."""
+        self._linear.clear()
+        self._floored.clear()
+        self._last: tuple[float, float] | None = None
+        self._previous: tuple[float, float] | None = None
+        # Segment ending at the newest sample, while it is still tracked.
+        self._tail: tuple[float, float, float, float] | None = None
+        self._origin = 0.0
+        self._updates = 0
+        self._zero_sums()
+
+    def _zero_sums(self) -> None:
+        """Reset running sums."""
+        self._lin_w = 0.0
+        self._lin_wm = 0.0
+        self._lin_ws = 0.0
+        self._lin_wsm = 0.0
+        self._floor_w = 0.0
+        self._floor_ws = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of tracked segments."""
+        return len(self._linear) + len(self._floored)
+
+    @property
+    def last_timestamp(self) -> float | None:
+        """Return the timestamp of the newest sample."""
+        return self._last[0] if self._last is not None else None
+
+    def extend(self, samples: Iterable[tuple[float, float]]) -> None:
+        """Add (epoch, value) samples in time order."""
+        for timestamp, value in samples:
+            self.add(timestamp, value)
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add a sample newer than every previous one."""
+        last = self._last
+        self._last = (timestamp, value)
+        self._previous = last
+        self._tail = None
+        if last is None:
+            if not len(self):
+                self._origin = timestamp
+            return
+        self._append_segment(last, timestamp, value)
+
+        # Midpoints are summed relative to a moving origin; re-basing once per
+        # "buffer length" updates keeps rounding drift bounded at O(1) amortized.
+        self._updates += 1
+        if self._updates > max(64, len(self)):
+            self._rebase(timestamp)
+
+    def replace_last(self, value: float) -> None:
+        """Replace the value of the newest sample, e.g. an open aggregation bucket."""
+        last = self._last
+        if last is None:
+            raise IndexError("estimator is empty")
+        self._last = (last[0], value)
+        tail = self._tail
+        self._tail = None
+        if tail is not None:
+            # The newest segment is last of the linear group, or of the
+            # floored group when no linear segment is left.
+            if self._linear and self._linear[-1] is tail:
+                self._add_linear(self._linear.pop(), -1.0)
+            elif self._floored and self._floored[-1] is tail:
+                self._floored.pop()
+                self._floor_w -= tail[3]
+                self._floor_ws -= tail[3] * tail[2]
+        if self._previous is not None:
+            self._append_segment(self._previous, last[0], value)
+
+    def _append_segment(self, start: tuple[float, float], timestamp: float, value: float) -> None:
+        """Track the segment from a previous sample to the newest one."""
+        segment_seconds = timestamp - start[0]
+        if segment_seconds <= 0:
+            return
+
+        segment = (
+            start[0],
+            start[0] + segment_seconds / 2,
+            (value - start[1]) / (segment_seconds / 3600),
+            min(1.0, segment_seconds / _DURATION_FULL_WEIGHT_SECONDS),
+        )
+        self._tail = segment
+        self._linear.append(segment)
+        self._add_linear(segment, 1.0)
+
+    def _add_linear(self, segment: tuple[float, float, float, float], sign: float) -> None:
+        """Add or remove a segment from the linear running sums."""
+        _, midpoint, slope, weight = segment
+        weight *= sign
+        offset = midpoint - self._origin
+        self._lin_w += weight
+        self._lin_wm += weight * offset
+        self._lin_ws += weight * slope
+        self._lin_wsm += weight * slope * offset
+
+    def _rebase(self, origin: float) -> None:
+        """Recompute running sums from stored segments around a new origin."""
+        self._origin = origin
+        self._updates = 0
+        self._zero_sums()
+        for segment in self._linear:
+            self._add_linear(segment, 1.0)
+        for _, _, slope, weight in self._floored:
+            self._floor_w += weight
+            self._floor_ws += weight * slope
+
+    def _advance(self, now: float) -> None:
+        """Expire segments and move aged ones to the floored group."""
+        cutoff = now - self._window
+        while self._floored and self._floored[0][0] < cutoff:
+            _, _, slope, weight = self._floored.popleft()
+            self._floor_w -= weight
+            self._floor_ws -= weight * slope
+        while self._linear and self._linear[0][0] < cutoff:
+            self._add_linear(self._linear.popleft(), -1.0)
+
+        floor_age = (1.0 - _RECENCY_FLOOR) * self._window
+        while self._linear and now - self._linear[0][1] > floor_age:
+            segment = self._linear.popleft()
+            self._add_linear(segment, -1.0)
+            self._floored.append(segment)
+            self._floor_w += segment[3]
+            self._floor_ws += segment[3] * segment[2]
+
+        if not self._linear and not self._floored:
+            self._zero_sums()
+
+    def slope(self, now: float, fallback_change_1h: float) -> float:
+        """Return the blended, clamped slope in °C/h at ``now``.
+
+        ``now`` must not go backwards between calls nor precede the newest sample.
+        """
+        self._advance(now)
+
+        # Recency weight of a linear segment: 1 - (now - midpoint) / window.
+        base = 1.0 - (now - self._origin) / self._window
+        weighted_total = (
+            base * self._lin_w + self._lin_wm / self._window + _RECENCY_FLOOR * self._floor_w
+        )
+        weighted_slope = (
+            base * self._lin_ws + self._lin_wsm / self._window + _RECENCY_FLOOR * self._floor_ws
+        )
+
+        if not (self._linear or self._floored) or weighted_total <= 0:
+            blended_slope = fallback_change_1h
+        else:
+            smoothed_slope = weighted_slope / weighted_total
+            blended_slope = (smoothed_slope * 0.7) + (fallback_change_1h * 0.3)
+
+        return max(
+            -TEMPERATURE_MAX_FORECAST_SLOPE_C_PER_H,
+            min(TEMPERATURE_MAX_FORECAST_SLOPE_C_PER_H, blended_slope),
+        )
+
+    def check(
+        self,
+        timestamps: Sequence[float],
+        values: Sequence[float],
+        now: float,
+        fallback_change_1h: float,
+        tolerance: float = 1e-6,
+    ) -> bool:
+        """Compare the streaming slope with the batch estimate over the same samples."""
+        expected = estimate_temperature_slope_c_per_hour(timestamps, values, now, fallback_change_1h)
+        return abs(self.slope(now, fallback_change_1h) - expected) <= tolerance
+
+
+class SpikeFilter:
+    """Streaming Hampel-style outlier filter over the last ``window`` readings.
+
+    A reading is rejected when it is further from the window median than
+    ``threshold`` robust sigmas (estimated from the interquartile range) and
+    than ``min_deviation``; the median is returned in its place. The window
+    is kept sorted with ``bisect`` next to a FIFO of arrival order, so a
+    reading costs O(log N) comparisons. Rejected readings still enter the
+    window, so a genuine level shift is accepted once it dominates it.
+    """
+
+    __slots__ = ("_window", "_threshold", "_min_deviation", "_fifo", "_sorted", "rejected")
+
+    def __init__(
+        self,
+        window: int,
+        min_deviation: float,
+        threshold: float = SPIKE_FILTER_THRESHOLD_SIGMAS,
+    ) -> None:
+        """Initialize an empty filter."""
+        if window < SPIKE_FILTER_MIN_SAMPLES:
+            raise ValueError(f"window must hold at least {SPIKE_FILTER_MIN_SAMPLES} readings")
+        self._window = window
+        self._threshold = threshold
+        self._min_deviation = min_deviation
+        self._fifo: deque[float] = deque()
+        self._sorted: list[float] = []
+        self.rejected = 0
+
+    def __len__(self) -> int:
+        """Return the number of readings in the window."""
+        return len(self._fifo)
+
+    @property
+    def window(self) -> int:
+        """Return the maximum number of readings in the window."""
+        return self._window
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Seed the window with trusted readings, oldest first."""
+        for value in values:
+            if isfinite(value):
+                self._push(value)
+
+    def filter(self, value: float) -> float:
+        """Return the reading, or the window median when it is a spike."""
+        ordered = self._sorted
+        size = len(ordered)
+        if not isfinite(value):
+            if not size:
+                return value
+            self.rejected += 1
+            return ordered[size // 2]
+
+        accepted = value
+        if size >= SPIKE_FILTER_MIN_SAMPLES:
+            median = ordered[size // 2]
+            sigma = (ordered[(3 * size) // 4] - ordered[size // 4]) / _IQR_PER_SIGMA
+            if abs(value - median) > max(self._threshold * sigma, self._min_deviation):
+                self.rejected += 1
+                accepted = median
+        self._push(value)
+        return accepted
+
+    def _push(self, value: float) -> None:
+        """Add a reading, dropping the oldest one when the window is full."""
+        if len(self._fifo) == self._window:
+            oldest = self._fifo.popleft()
+            del self._sorted[bisect_left(self._sorted, oldest)]
+        self._fifo.append(value)
+        insort(self._sorted, value)
+
+
+class PressureTrendKalman:
+    """Constant-time Kalman estimate of the pressure level and rate.
+
+    The state is the level (hPa) and its rate (hPa/h) under a constant-rate
+    model whose rate drifts as a random walk. Each reading is one predict and
+    update step on a 2x2 covariance, so the smoothed 3h change (rate times
+    the window) no longer hangs on the single oldest sample of the history.
+    Readings not newer than the last one only correct the state.
+    """
+
+    __slots__ = (
+        "_rate_noise",
+        "_measurement_variance",
+        "_initial_rate_variance",
+        "_max_gap_hours",
+        "_timestamp",
+        "level",
+        "rate",
+        "_p00",
+        "_p01",
+        "_p11",
+    )
+
+    def __init__(
+        self,
+        rate_noise: float = KALMAN_RATE_NOISE,
+        pressure_noise: float = KALMAN_PRESSURE_NOISE_HPA,
+        initial_rate_sigma: float = KALMAN_INITIAL_RATE_SIGMA_HPA_PER_HOUR,
+    ) -> None:
+        """Initialize an empty estimator."""
+        self._rate_noise = rate_noise
+        self._measurement_variance = pressure_noise * pressure_noise
+        self._initial_rate_variance = initial_rate_sigma * initial_rate_sigma
+        self._max_gap_hours = PRESSURE_HISTORY_WINDOW.total_seconds() / 3600
+        self.reset()
+
+    @property
+    def timestamp(self) -> float | None:
+        """Return the time of the last reading, None before a reading."""
+        return self._timestamp
+
+    @property
+    def rate_sigma(self) -> float | None:
+        """Return the standard deviation of the rate (hPa/h), None before a reading."""
+        return self._p11**0.5 if self._timestamp is not None else None
+
+    def reset(self) -> None:
+        """Forget the state."""
+        self._timestamp: float | None = None
+        self.level = 0.0
+        self.rate = 0.0
+        self._p00 = self._p01 = self._p11 = 0.0
+
+    def extend(self, samples: Iterable[tuple[float, float]]) -> None:
+        """Feed ``(timestamp, value)`` samples, oldest first."""
+        for timestamp, value in samples:
+            self.update(timestamp, value)
+
+    def update(self, timestamp: float, value: float) -> None:
+        """Predict the state up to ``timestamp`` and correct it with a reading."""
+        if not isfinite(value):
+            return
+        previous = self._timestamp
+        if previous is None or (timestamp - previous) / 3600 > self._max_gap_hours:
+            self._timestamp = timestamp
+            self.level = value
+            self.rate = 0.0
+            self._p00 = self._measurement_variance
+            self._p01 = 0.0
+            self._p11 = self._initial_rate_variance
+            return
+
+        dt = (timestamp - previous) / 3600
+        if dt > 0:
+            self._timestamp = timestamp
+            # Predict: level += rate * dt, P = F P F^T + Q.
+            q = self._rate_noise
+            self.level += self.rate * dt
+            self._p00 += dt * (2 * self._p01 + dt * self._p11) + q * dt * dt * dt / 3
+            self._p01 += dt * self._p11 + q * dt * dt / 2
+            self._p11 += q * dt
+
+        # Correct with the reading (the level is observed directly).
+        p00, p01 = self._p00, self._p01
+        innovation = value - self.level
+        gain_level = p00 / (p00 + self._measurement_variance)
+        gain_rate = p01 / (p00 + self._measurement_variance)
+        self.level += gain_level * innovation
+        self.rate += gain_rate * innovation
+        self._p00 = p00 - gain_level * p00
+        self._p01 = p01 - gain_level * p01
+        self._p11 -= gain_rate * p01
+
+    def change(self, hours: float) -> float:
+        """Return the smoothed pressure change over ``hours`` (hPa)."""
+        return self.rate * hours
+
+
+class PressureTendencyFit:
+    """Running least-squares fits over both halves of the 3h pressure window.
+
+    Samples enter the second half, move to the first half once older than
+    the middle of the window and leave at its start. Each half keeps running
+    sums of ``n``, ``t``, ``p``, ``t * t`` and ``t * p`` (relative to a moving
+    origin), updated as samples move, so a sample costs amortized O(1)
+    whatever the number of samples in the window.
+    """
+
+    __slots__ = (
+        "_half",
+        "_first",
+        "_second",
+        "_first_sums",
+        "_second_sums",
+        "_origin",
+        "_reference",
+        "_updates",
+    )
+
+    def __init__(self, window_seconds: float = PRESSURE_HISTORY_WINDOW.total_seconds()) -> None:
+        """Initialize an empty estimator."""
+        self._half = window_seconds / 2
+        self._first: deque[tuple[float, float]] = deque()
+        self._second: deque[tuple[float, float]] = deque()
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all samples."""
+        self._first.clear()
+        self._second.clear()
+        # [n, sum t, sum p, sum t * t, sum t * p] of the first and second half.
+        self._first_sums = [0.0] * 5
+        self._second_sums = [0.0] * 5
+        self._origin = 0.0
+        self._reference = 0.0
+        self._updates = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self._first) + len(self._second)
+
+    @property
+    def last_timestamp(self) -> float | None:
+        """Return the timestamp of the newest sample."""
+        newest = self._second or self._first
+        return newest[-1][0] if newest else None
+
+    def extend(self, samples: Iterable[tuple[float, float]]) -> None:
+        """Add (epoch, value) samples in time order."""
+        for timestamp, value in samples:
+            self.add(timestamp, value)
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add a sample newer than every previous one."""
+        if not self:
+            self._origin = timestamp
+            self._reference = value
+        self._second.append((timestamp, value))
+        self._sum(self._second_sums, timestamp, value, 1)
+
+        # Same drift bound as ``TemperatureSlopeEstimator``: re-base the sums
+        # once per "window length" updates.
+        self._updates += 1
+        if self._updates > max(64, len(self)):
+            self._rebase(timestamp, value)
+
+    def replace_last(self, value: float) -> None:
+        """Replace the value of the newest sample, e.g. an open aggregation bucket."""
+        if self._second:
+            samples, sums = self._second, self._second_sums
+        elif self._first:
+            samples, sums = self._first, self._first_sums
+        else:
+            raise IndexError("estimator is empty")
+        timestamp, previous = samples.pop()
+        self._sum(sums, timestamp, previous, -1)
+        samples.append((timestamp, value))
+        self._sum(sums, timestamp, value, 1)
+
+    def half_changes(self, now: float) -> tuple[float, float] | None:
+        """Return the fitted changes over the first and second half at ``now``.
+
+        Each change is the least-squares slope of its half times the half
+        length; None while a half holds fewer than two distinct times.
+        ``now`` must not go backwards between calls.
+        """
+        self._advance(now)
+        first = self._fitted_change(self._first_sums)
+        second = self._fitted_change(self._second_sums)
+        if first is None or second is None:
+            return None
+        return first, second
+
+    def _advance(self, now: float) -> None:
+        """Move samples past the middle to the first half and expire old ones."""
+        middle = now - self._half
+        start = middle - self._half
+        first, second = self._first, self._second
+        while second and second[0][0] < middle:
+            timestamp, value = second.popleft()
+            self._sum(self._second_sums, timestamp, value, -1)
+            if timestamp >= start:
+                first.append((timestamp, value))
+                self._sum(self._first_sums, timestamp, value, 1)
+        while first and first[0][0] < start:
+            timestamp, value = first.popleft()
+            self._sum(self._first_sums, timestamp, value, -1)
+
+    def _sum(self, sums: list[float], timestamp: float, value: float, sign: float) -> None:
+        """Add (sign 1) or remove (sign -1) a sample from running sums."""
+        x = timestamp - self._origin
+        y = value - self._reference
+        sums[0] += sign
+        sums[1] += sign * x
+        sums[2] += sign * y
+        sums[3] += sign * x * x
+        sums[4] += sign * x * y
+
+    def _fitted_change(self, sums: list[float]) -> float | None:
+        """Return the least-squares slope of running sums times the half length."""
+        count, sum_x, sum_y, sum_xx, sum_xy = sums
+        if count < 2:
+            return None
+        denominator = count * sum_xx - sum_x * sum_x
+        # Rounding of the running sums leaves a tiny residue for equal times.
+        if denominator <= 1e-9 * count * sum_xx:
+            return None
+        return (count * sum_xy - sum_x * sum_y) / denominator * self._half
+
+    def _rebase(self, origin: float, reference: float) -> None:
+        """Recompute running sums from stored samples around a new origin."""
+        self._origin = origin
+        self._reference = reference
+        self._updates = 0
+        for samples, sums in ((self._first, self._first_sums), (self._second, self._second_sums)):
+            sums[:] = [0.0] * 5
+            for timestamp, value in samples:
+                self._sum(sums, timestamp, value, 1)
+
+
+class RollingExtremes:
+    """Minimum and maximum since any time of a rolling window.
+
+    Two monotonic deques of ``(timestamp, value)`` pairs are kept: a sample
+    drops the older samples it is lower than from ``_minima`` (higher than
+    from ``_maxima``), so values never decrease (increase) from oldest to
+    newest and the extreme since a time ``t`` is the first pair not older
+    than ``t``, i.e. its first occurrence. Every sample enters and leaves
+    each deque once, so adding one is amortized O(1) and a lookup is a
+    binary search. Samples older than the last one are ignored.
+    """
+
+    __slots__ = ("_minima", "_maxima")
+
+    def __init__(self) -> None:
+        """Initialize empty deques."""
+        self._minima: deque[tuple[float, float]] = deque()
+        self._maxima: deque[tuple[float, float]] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of retained pairs (both deques)."""
+        return len(self._minima) + len(self._maxima)
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add a reading."""
+        minima, maxima = self._minima, self._maxima
+        if not isfinite(value) or (minima and timestamp < minima[-1][0]):
+            return
+        while minima and minima[-1][1] > value:
+            minima.pop()
+        minima.append((timestamp, value))
+        while maxima and maxima[-1][1] < value:
+            maxima.pop()
+        maxima.append((timestamp, value))
+
+    def extend(self, samples: Iterable[tuple[float, float]]) -> None:
+        """Feed ``(timestamp, value)`` samples, oldest first."""
+        for timestamp, value in samples:
+            self.add(timestamp, value)
+
+    def evict_before(self, cutoff: float) -> None:
+        """Drop pairs older than ``cutoff``; the newest reading is always kept."""
+        for pairs in (self._minima, self._maxima):
+            while len(pairs) > 1 and pairs[0][0] < cutoff:
+                pairs.popleft()
+
+    def minimum(self, since: float) -> tuple[float, float] | None:
+        """Return the ``(timestamp, value)`` of the lowest reading since ``since``."""
+        return self._first_since(self._minima, since)
+
+    def maximum(self, since: float) -> tuple[float, float] | None:
+        """Return the ``(timestamp, value)`` of the highest reading since ``since``."""
+        return self._first_since(self._maxima, since)
+
+    @staticmethod
+    def _first_since(pairs: deque[tuple[float, float]], since: float) -> tuple[float, float] | None:
+        """Return the first pair not older than ``since``."""
+        index = bisect_left(pairs, since, key=_timestamp)
+        return pairs[index] if index < len(pairs) else None
+
+    def samples(self) -> list[tuple[float, float]]:
+        """Return the retained pairs of both deques, oldest first.
+
+        Feeding them back to an empty instance rebuilds the same deques.
+        """
+        return sorted(set(self._minima).union(self._maxima))
+
+    def clear(self) -> None:
+        """Forget every reading."""
+        self._minima.clear()
+        self._maxima.clear()
+
+
+def _timestamp(pair: tuple[float, float]) -> float:
+    """Return the timestamp of a ``(timestamp, value)`` pair."""
+    return pair[0]
@@ -0,0 +1,175 @@
+"""Vectorized forecast engine for offline replays of station data.
+
+This module mirrors ``zambretti_forecast`` and ``neg_zam_forecast`` over NumPy
+arrays. It is never imported by the integration itself, so NumPy is only
+loaded when the batch API is used (backtesting, threshold tuning).
+"""
+
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .const import PRESSURE_TREND_THRESHOLD, WIND_CALM_THRESHOLD_KMH
+from .forecast_engine import (
+    FALL_OPT,
+    RISE_OPT,
+    STEADY_OPT,
+    TYPE_LETTERS,
+    WIND_SECTOR_EDGES,
+    WIND_SECTORS,
+    Z_TO_TYPE,
+    forecast_letter_from_number,
+)
+
+# Negretti and Zambra barometer scale, see ``neg_zam_forecast``.
+_BAR_TOP = 1050.0
+_BAR_BOTTOM = 950.0
+_BAR_RANGE = _BAR_TOP - _BAR_BOTTOM
+_BAR_CONSTANT = _BAR_RANGE / 22
+
+# Columns of the engine's wind sector table. The correction keeps the scalar
+# operation order (pct / 100 * range) so results match exactly.
+_SECTOR_EDGES = np.array(WIND_SECTOR_EDGES)
+_SECTOR_COMPASS = np.array([sector.compass for sector in WIND_SECTORS])
+_SECTOR_CORRECTION = np.array([sector.correction_pct / 100 * _BAR_RANGE for sector in WIND_SECTORS])
+_SECTOR_FACTOR = np.array([sector.factor for sector in WIND_SECTORS], dtype=np.int8)
+
+_Z_TYPE = np.array([Z_TO_TYPE.get(z_value, 9) for z_value in range(max(Z_TO_TYPE) + 1)], dtype=np.int8)
+_TYPE_LETTERS = np.array(TYPE_LETTERS)
+_NUMBER_LETTERS = np.array([forecast_letter_from_number(z_number) for z_number in range(len(TYPE_LETTERS))])
+_RISE_OPT = np.array(RISE_OPT, dtype=np.int8)
+_STEADY_OPT = np.array(STEADY_OPT, dtype=np.int8)
+_FALL_OPT = np.array(FALL_OPT, dtype=np.int8)
+
+
+class BatchForecast(NamedTuple):
+    """Forecast arrays, one element per input sample."""
+
+    zambretti_type: NDArray[np.int8]
+    zambretti_letter: NDArray[np.str_]
+    neg_zam_number: NDArray[np.int8]
+    neg_zam_letter: NDArray[np.str_]
+    neg_zam_exceptional: NDArray[np.bool_]
+
+
+def wind_sector_indices(wind_direction_deg: ArrayLike) -> NDArray[np.intp]:
+    """Vectorized ``wind_sector_index``; NaN maps to row 0 like ``bisect_left``."""
+    direction = np.asarray(wind_direction_deg, dtype=np.float64)
+    return np.where(np.isnan(direction), 0, np.searchsorted(_SECTOR_EDGES, direction, side="left"))
+
+
+def wind_factor_batch(wind_direction_deg: ArrayLike) -> NDArray[np.int8]:
+    """Vectorized ``wind_factor``."""
+    direction = np.asarray(wind_direction_deg, dtype=np.float64)
+    return np.where(np.isnan(direction), 1, _SECTOR_FACTOR[wind_sector_indices(direction)]).astype(np.int8)
+
+
+def wind_compass_batch(wind_direction_deg: ArrayLike) -> NDArray[np.str_]:
+    """Vectorized ``wind_compass_text``."""
+    with np.errstate(invalid="ignore"):
+        direction = np.mod(np.asarray(wind_direction_deg, dtype=np.float64), 360)
+    return _SECTOR_COMPASS[wind_sector_indices(direction)]
+
+
+def _months(timestamps: ArrayLike) -> NDArray[np.int64]:
+    """Return calendar months (1..12) of wall-clock timestamps."""
+    return np.asarray(timestamps, dtype="datetime64[M]").astype(np.int64) % 12 + 1
+
+
+def forecast_batch(
+    p0_hpa: ArrayLike,
+    pressure_change_3h: ArrayLike,
+    wind_direction_deg: ArrayLike,
+    wind_speed_kmh: ArrayLike,
+    timestamps: ArrayLike,
+    is_northern_hemisphere: ArrayLike = True,
+    trend_threshold: float = PRESSURE_TREND_THRESHOLD,
+) -> BatchForecast:
+    """Compute Zambretti and Negretti/Zambra forecasts for equal-length arrays.
+
+    ``timestamps`` are converted with ``numpy.datetime64`` and their month is
+    read as given, so pass local wall-clock times (naive datetimes, ISO strings
+    or ``datetime64`` values) to match the scalar functions.
+    ``is_northern_hemisphere`` may be a scalar or a per-sample array and
+    ``trend_threshold`` overrides the 3h change that counts as a trend. Results
+    are identical to ``zambretti_forecast`` and ``neg_zam_forecast``.
+    """
+    p0 = np.asarray(p0_hpa, dtype=np.float64)
+    change = np.asarray(pressure_change_3h, dtype=np.float64)
+    direction = np.asarray(wind_direction_deg, dtype=np.float64)
+    speed = np.asarray(wind_speed_kmh, dtype=np.float64)
+    northern = np.broadcast_to(np.asarray(is_northern_hemisphere, dtype=bool), p0.shape)
+    months = _months(timestamps)
+
+    trend = np.where(
+        change <= -trend_threshold,
+        -1,
+        np.where(change >= trend_threshold, 1, 0),
+    )
+    northern_summer = (months > 2) & (months < 11)
+    is_summer = np.where(northern, northern_summer, ~northern_summer)
+    windy = ~(speed < WIND_CALM_THRESHOLD_KMH)
+
+    zambretti_type = _zambretti_types(p0, trend, is_summer, direction, windy)
+    neg_zam_number, exceptional = _neg_zam_numbers(p0, trend, is_summer, direction, windy, northern)
+
+    return BatchForecast(
+        zambretti_type=zambretti_type,
+        zambretti_letter=_TYPE_LETTERS[zambretti_type],
+        neg_zam_number=neg_zam_number,
+        neg_zam_letter=_NUMBER_LETTERS[neg_zam_number],
+        neg_zam_exceptional=exceptional,
+    )
+
+
+def _zambretti_types(
+    p0: NDArray[np.float64],
+    trend: NDArray[Any],
+    is_summer: NDArray[np.bool_],
+    direction: NDArray[np.float64],
+    windy: NDArray[np.bool_],
+) -> NDArray[np.int8]:
+    """Vectorized body of ``zambretti_forecast`` returning forecast types."""
+    # np.round and round() both round half to even.
+    z_falling = np.round(127 - 0.12 * p0)
+    z_steady = np.round(144 - 0.13 * p0) - ~is_summer
+    z_rising = np.round(185 - 0.16 * p0) + is_summer
+    z_raw = np.where(trend < 0, z_falling, np.where(trend == 0, z_steady, z_rising)).astype(np.int64)
+
+    z_raw += wind_factor_batch(direction) * windy
+
+    known = (z_raw >= 0) & (z_raw < len(_Z_TYPE))
+    return np.where(known, _Z_TYPE[np.where(known, z_raw, 0)], 9).astype(np.int8)
+
+
+def _neg_zam_numbers(
+    p0: NDArray[np.float64],
+    trend: NDArray[Any],
+    is_summer: NDArray[np.bool_],
+    direction: NDArray[np.float64],
+    windy: NDArray[np.bool_],
+    northern: NDArray[np.bool_],
+) -> tuple[NDArray[np.int8], NDArray[np.bool_]]:
+    """Vectorized body of ``neg_zam_forecast`` returning numbers and prefix flags."""
+    with np.errstate(invalid="ignore"):
+        adjusted = np.where(northern, direction, np.mod(direction + 180, 360))
+    z_hp = np.where(windy, p0 + _SECTOR_CORRECTION[wind_sector_indices(adjusted)], p0)
+
+    seasonal = 7 / 100 * _BAR_RANGE
+    z_hp = np.where(is_summer & (trend > 0), z_hp + seasonal, z_hp)
+    z_hp = np.where(is_summer & (trend < 0), z_hp - seasonal, z_hp)
+    z_hp = np.where(z_hp == _BAR_TOP, _BAR_TOP - 1, z_hp)
+
+    z_option = np.floor((z_hp - _BAR_BOTTOM) / _BAR_CONSTANT).astype(np.int64)
+    exceptional = (z_option < 0) | (z_option > 21)
+    z_option = np.clip(z_option, 0, 21)
+
+    z_number = np.where(
+        trend > 0,
+        _RISE_OPT[z_option],
+        np.where(trend < 0, _FALL_OPT[z_option], _STEADY_OPT[z_option]),
+    )
+    return z_number.astype(np.int8), exceptional
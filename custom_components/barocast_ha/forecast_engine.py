@@ -2,236 +2,26 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from datetime import datetime, timedelta
-from math import floor
-from typing import Sequence
+from math import floor, nextafter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping, NamedTuple, Sequence
 
 from .const import (
+    DEEPENING_LOW_FALL_HPA,
     DEFAULT_LANGUAGE,
     LANGUAGE_INDEX,
+    PRESSURE_TENDENCY_RATE_RATIO,
+    PRESSURE_TENDENCY_STEADY_HPA,
     PRESSURE_TREND_THRESHOLD,
     TEMPERATURE_MAX_FORECAST_SLOPE_C_PER_H,
+    TEMPERATURE_SLOPE_WINDOW_SECONDS,
     WIND_CALM_THRESHOLD_KMH,
 )
 
-SHORT_CONDITIONS: tuple[tuple[str, ...], ...] = (
-    ("stürmisch", "Stormy", "θυελλώδης", "Tempestoso", "Orageux"),
-    ("regnerisch", "Rainy", "Βροχερός", "Piovoso", "Pluvieux"),
-    ("wechselhaft", "Mixed", "Μεταβλητός", "Variabile", "Variable"),
-    ("sonnig", "Sunny", "Ηλιόλουστος", "Soleggiato", "Ensoleillé"),
-    ("sehr trocken", "Extra Dry", "Πολύ ξηρός", "Molto Secco", "Très Sec"),
-)
-
-PRESSURE_SYSTEMS: tuple[tuple[str, ...], ...] = (
-    (
-        "Tiefdruckgebiet",
-        "Low Pressure System",
-        "σύστημα χαμηλής πίεσης",
-        "Bassa Pressione",
-        "Système de basse pression",
-    ),
-    ("Normal", "Normal", "φυσιολογικός", "Normale", "Normal"),
-    (
-        "Hochdruckgebiet",
-        "High Pressure System",
-        "σύστημα υψηλής πίεσης",
-        "Zona Alta Pressione",
-        "Système de haute pression",
-    ),
-)
-
-FORECAST_TEXTS: tuple[tuple[str, ...], ...] = (
-    (
-        "Beständiges Schönwetter!",
-        "Settled Fine",
-        "Σταθερός καλός καιρός!",
-        "Bel tempo stabile!",
-        "Beau temps stable!",
-    ),
-    ("Schönes Wetter!", "Fine", "Ωραίος καιρός!", "Bel tempo!", "Beau temps!"),
-    (
-        "Es wird schöner.",
-        "Becoming Fine",
-        "Θα καλυτερεύσει.",
-        "Miglioramento in corso.",
-        "Le temps s'améliore.",
-    ),
-    (
-        "Schön, wird wechselhaft.",
-        "Fine, Becoming Less Settled",
-        "Μεταβλητός.",
-        "Bello, ma diventa instabile.",
-        "Beau, devient instable.",
-    ),
-    (
-        "Schön, Regenschauer möglich.",
-        "Fine, Possibly Showers",
-        "Πιθανή βροχή.",
-        "Bello, possibili rovesci.",
-        "Beau, averses possibles.",
-    ),
-    (
-        "Heiter bis wolkig, Besserung zu erwarten.",
-        "Fairly Fine, Improving",
-        "Αίθριος έως νεφελώδης, αναμένεται βελτίωση.",
-        "Sereno con nuvole, miglioramento atteso.",
-        "Éclaircies avec nuages, amélioration attendue.",
-    ),
-    (
-        "Heiter bis wolkig, anfangs evtl. Schauer.",
-        "Fairly Fine, Possibly Showers, Early",
-        "Αίθριος έως συννεφιασμένος, πιθανώς βροχές στην αρχή.",
-        "Sereno con nuvole, possibili rovesci all'inizio.",
-        "Éclaircies avec nuages, averses possibles au début.",
-    ),
-    (
-        "Heiter bis wolkig, später Regen.",
-        "Fairly Fine, Showery Later",
-        "Αίθριος έως συννεφιασμένος, αργότερα βροχή.",
-        "Sereno con nuvole, pioggia in arrivo.",
-        "Éclaircies avec nuages, pluie plus tard.",
-    ),
-    (
-        "Anfangs noch Schauer, dann Besserung.",
-        "Showery Early, Improving",
-        "Βροχόπτωση στην αρχή και μετά βελτίωση.",
-        "Rovesci iniziali, poi miglioramento.",
-        "Averses au début, puis amélioration.",
-    ),
-    (
-        "Wechselhaft mit Schauern",
-        "Changeable, Mending",
-        "Εναλλαγή με βροχόπτωση.",
-        "Variabile con rovesci.",
-        "Variable avec averses.",
-    ),
-    (
-        "Heiter bis wolkig, vereinzelt Regen.",
-        "Fairly Fine, Showers Likely",
-        "Αίθριος έως συννεφιασμένος, κατά διαστήματα βροχή.",
-        "Sereno con nuvole, pioggia probabile.",
-        "Éclaircies avec nuages, averses probables.",
-    ),
-    (
-        "Unbeständig, später Aufklarung.",
-        "Rather Unsettled, Clearing Later",
-        "Ασταθής, αργότερα καθάρος.",
-        "Instabile, schiarite più tardi.",
-        "Instable, éclaircies plus tard.",
-    ),
-    (
-        "Unbeständig, evtl. Besserung.",
-        "Unsettled, Probably Improving",
-        "Ασταθής, πιθανώς βελτίωση.",
-        "Instabile, probabile miglioramento.",
-        "Instable, amélioration possible.",
-    ),
-    (
-        "Regnerisch mit heiteren Phasen.",
-        "Showery, Bright Intervals",
-        "Καθαρός με διαστήματα βροχής.",
-        "Rovesci con schiarite.",
-        "Pluvieux avec éclaircies.",
-    ),
-    (
-        "Regnerisch, wird unbeständiger.",
-        "Showery, Becoming More Unsettled",
-        "Βροχερό, όλο και πιο ασταθές.",
-        "Rovesci, sempre più instabile.",
-        "Pluvieux, devient plus instable.",
-    ),
-    (
-        "Wechselhaft mit etwas Regen.",
-        "Changeable, Some Rain",
-        "Αλλάζει με λίγη βροχή.",
-        "Variabile con qualche pioggia.",
-        "Variable avec un peu de pluie.",
-    ),
-    (
-        "Unbeständig mit heiteren Phasen.",
-        "Unsettled, Short Fine Intervals",
-        "Άστατα, μικρά καθαρά διαστήματα",
-        "Instabile con brevi schiarite.",
-        "Instable avec courtes éclaircies.",
-    ),
-    (
-        "Unbeständig, später Regen.",
-        "Unsettled, Rain Later",
-        "Άστατη, αργότερα βροχή.",
-        "Instabile, pioggia più tardi.",
-        "Instable, pluie plus tard.",
-    ),
-    (
-        "Unbeständig mit etwas Regen.",
-        "Unsettled, Rain At Times",
-        "Άστατος με λίγη βροχή.",
-        "Instabile con qualche pioggia.",
-        "Instable avec quelques pluies.",
-    ),
-    (
-        "Wechselhaft und regnerisch",
-        "Very Unsettled, Finer At Times",
-        "Μεταβλητός και βροχερός.",
-        "Variabile e piovoso.",
-        "Variable et pluvieux.",
-    ),
-    (
-        "Gelegentlich Regen, Verschlechterung.",
-        "Rain At Times, Worse Later",
-        "Περιστασιακές βροχές, επιδείνωση.",
-        "Pioggia occasionale, peggiora più tardi.",
-        "Pluie occasionnelle, dégradation ensuite.",
-    ),
-    (
-        "Zuweilen Regen, sehr unbeständig.",
-        "Rain At Times, Becoming Very Unsettled",
-        "Βροχή κατά περιόδους, πολύ ασταθής.",
-        "Pioggia a tratti, molto instabile.",
-        "Pluie par moments, devient très instable.",
-    ),
-    (
-        "Häufiger Regen.",
-        "Rain At Frequent Intervals",
-        "Συχνή βροχή.",
-        "Pioggia frequente.",
-        "Pluie fréquente.",
-    ),
-    (
-        "Regen, sehr unbeständig.",
-        "Very Unsettled, Rain",
-        "Βροχή, πολύ ασταθής.",
-        "Molto instabile, pioggia.",
-        "Très instable, pluie.",
-    ),
-    (
-        "Stürmisch, evtl. Besserung.",
-        "Stormy, Possibly Improving",
-        "Θυελλώδης, πιθανώς βελτίωση.",
-        "Tempestoso, possibile miglioramento.",
-        "Orageux, amélioration possible.",
-    ),
-    (
-        "Stürmisch mit viel Regen.",
-        "Stormy, Much Rain",
-        "Καταιγίδα με πολλές βροχές.",
-        "Tempestoso con molta pioggia.",
-        "Orageux avec beaucoup de pluie.",
-    ),
-)
-
-EXCEPTIONAL_TEXT = (
-    "außergewöhnliches Wetter,",
-    "Exceptional Weather,",
-    "Εξαιρετικός καιρός,",
-    "Tempo eccezionale,",
-    "Temps exceptionnel,",
-)
-
-TREND_TEXTS = (
-    ("fallend", "Falling", "πέφτοντας", "in calo", "en baisse"),
-    ("steigend", "Rising", "αυξανόμενη", "in aumento", "en hausse"),
-    ("stabil", "Steady", "σταθερή", "stabile", "stable"),
-)
+if TYPE_CHECKING:
+    from .texts import TextBundle
 
 # Map "severity type" (0..25 used by the legacy card) to classical
 # Zambretti numbers. This preserves compatibility with the original YAML.
@@ -364,6 +154,74 @@ NEG_ZAM_FORECAST_BY_CODE = {
 }
 
 
+class WindSector(NamedTuple):
+    """Precomputed wind classification for one direction interval."""
+
+    compass: str
+    correction_pct: float
+    factor: int
+
+
+def _build_wind_sectors() -> tuple[tuple[float, ...], tuple[WindSector, ...]]:
+    """Merge compass sectors and wind-factor ranges into one lookup table.
+
+    Row ``i`` covers directions ``d`` with ``edges[i - 1] < d <= edges[i]``,
+    which is exactly what ``bisect_left(edges, d)`` returns. The 16 compass
+    sectors are right-closed ``(a, b]`` intervals of 22.5°; the Zambretti wind
+    factor uses ``d <= 45``, ``135 <= d <= 225`` and ``d >= 315``. Left-closed
+    bounds become the previous float, so ``d <= nextafter(135, -inf)`` is the
+    same test as ``d < 135``.
+    """
+    sector_edges = tuple(11.25 + 22.5 * index for index in range(16))
+    factor_edges = (45.0, nextafter(135.0, float("-inf")), 225.0, nextafter(315.0, float("-inf")))
+    factors = (0, 1, 2, 1, 0)
+    edges = tuple(sorted({*sector_edges, *factor_edges}))
+    rows = tuple(
+        WindSector(
+            compass=_COMPASS_BY_SECTOR[bisect_left(sector_edges, upper)],
+            correction_pct=_NEG_ZAM_CORRECTION_PCT_BY_SECTOR[bisect_left(sector_edges, upper)],
+            factor=factors[bisect_left(factor_edges, upper)],
+        )
+        for upper in (*edges, float("inf"))
+    )
+    return edges, rows
+
+
+# The legacy template labels (11.25°, 33.75°] as "N", so labels are shifted
+# by one sector relative to the usual compass rose.
+_COMPASS_BY_SECTOR = (
+    "N",
+    "N",
+    "NE",
+    "ENE",
+    "E",
+    "ESE",
+    "SE",
+    "SSE",
+    "S",
+    "SSW",
+    "SW",
+    "WSW",
+    "W",
+    "WNW",
+    "NW",
+    "NNW",
+    "N",
+)
+# Negretti and Zambra correction in percent of the barometer range.
+_NEG_ZAM_CORRECTION_PCT_BY_SECTOR = (0, 5, 4.6, 2, -0.5, -3.2, -5, -8.5, -11.2, -10, -6, -4.5, -3, -0.5, 1.5, 3, 6)
+
+WIND_SECTOR_EDGES, WIND_SECTORS = _build_wind_sectors()
+# Correction of each row as a fraction of the barometer range, same rounding
+# as the legacy ``pct / 100 * bar_range``.
+_SECTOR_CORRECTIONS = tuple(sector.correction_pct / 100 for sector in WIND_SECTORS)
+
+# Legacy trend codes by ``pressure_trend_index`` + 1 (falling, steady, rising),
+# also the index of the trend text in a language bundle.
+_TREND_CODES = (0, 2, 1)
+_TREND_CODE_TEXTS = ("0", "1", "2")
+
+
 def get_language_index(language_code: str) -> int:
     """Return the language index from language code."""
     return LANGUAGE_INDEX.get(language_code, LANGUAGE_INDEX[DEFAULT_LANGUAGE])
@@ -376,23 +234,88 @@ def pressure_to_sea_level(pressure_hpa: float, temp_c: float, altitude_m: float)
     )
 
 
-def pressure_trend_index(pressure_change_3h: float) -> int:
+def pressure_trend_index(
+    pressure_change_3h: float,
+    trend_threshold: float = PRESSURE_TREND_THRESHOLD,
+) -> int:
     """Return trend index: -1 falling, 0 steady, 1 rising."""
-    if pressure_change_3h <= -PRESSURE_TREND_THRESHOLD:
+    if pressure_change_3h <= -trend_threshold:
         return -1
-    if pressure_change_3h >= PRESSURE_TREND_THRESHOLD:
+    if pressure_change_3h >= trend_threshold:
         return 1
     return 0
 
 
-def pressure_trend_output(pressure_change_3h: float, language_index: int) -> tuple[str, str]:
+def pressure_trend_output(
+    pressure_change_3h: float,
+    texts: TextBundle,
+    trend_threshold: float = PRESSURE_TREND_THRESHOLD,
+) -> tuple[str, str]:
     """Return text and trend code used by the legacy card."""
-    trend = pressure_trend_index(pressure_change_3h)
-    if trend < 0:
-        return TREND_TEXTS[0][language_index], "0"
-    if trend > 0:
-        return TREND_TEXTS[1][language_index], "1"
-    return TREND_TEXTS[2][language_index], "2"
+    code = _TREND_CODES[pressure_trend_index(pressure_change_3h, trend_threshold) + 1]
+    return texts.trends[code], _TREND_CODE_TEXTS[code]
+
+
+def _tendency_sign(change: float) -> int:
+    """Return -1, 0 or 1 for a falling, steady or rising pressure change."""
+    if change <= -PRESSURE_TENDENCY_STEADY_HPA:
+        return -1
+    if change >= PRESSURE_TENDENCY_STEADY_HPA:
+        return 1
+    return 0
+
+
+def pressure_tendency_code(first_half_change: float, second_half_change: float) -> int:
+    """Return the WMO pressure tendency characteristic (code table 0200, 0..8).
+
+    The arguments are the pressure changes over the first and second half of
+    the 3h window; their sum is the change since 3h ago.
+    """
+    first = _tendency_sign(first_half_change)
+    second = _tendency_sign(second_half_change)
+    total = _tendency_sign(first_half_change + second_half_change)
+
+    if total == 0:
+        if first > 0 and second < 0:
+            return 0
+        if first < 0 and second > 0:
+            return 5
+        return 4
+    if total > 0:
+        if second < 0:
+            return 0
+        if first <= 0:
+            return 3
+        if second == 0 or second_half_change * PRESSURE_TENDENCY_RATE_RATIO < first_half_change:
+            return 1
+        if second_half_change > first_half_change * PRESSURE_TENDENCY_RATE_RATIO:
+            return 3
+        return 2
+    if second > 0:
+        return 5
+    if first >= 0:
+        return 8
+    if second == 0 or second_half_change * PRESSURE_TENDENCY_RATE_RATIO > first_half_change:
+        return 6
+    if second_half_change < first_half_change * PRESSURE_TENDENCY_RATE_RATIO:
+        return 8
+    return 7
+
+
+def is_deepening_low(
+    tendency_code: int | None,
+    pressure_change_3h: float,
+    trend_threshold: float = PRESSURE_TREND_THRESHOLD,
+) -> bool:
+    """Return whether the tendency points at a rapidly deepening low.
+
+    That is a rapid fall over 3h, or a fall past the trend threshold that
+    accelerated over the last half of the window (tendency 8). An unknown
+    tendency (None) only counts the rapid fall.
+    """
+    if pressure_change_3h <= -DEEPENING_LOW_FALL_HPA:
+        return True
+    return tendency_code == 8 and pressure_change_3h <= -trend_threshold
 
 
 def wind_speed_factor(wind_speed_kmh: float) -> int:
@@ -400,8 +323,18 @@ def wind_speed_factor(wind_speed_kmh: float) -> int:
     return 0 if wind_speed_kmh < WIND_CALM_THRESHOLD_KMH else 1
 
 
+def wind_sector_index(wind_direction_deg: float) -> int:
+    """Return the row of ``WIND_SECTORS`` covering a direction in degrees."""
+    return bisect_left(WIND_SECTOR_EDGES, wind_direction_deg)
+
+
 def wind_factor(wind_direction_deg: float) -> int:
-    """Return wind factor used by the original template implementation."""
+    """Return wind factor used by the original template implementation.
+
+    Two comparisons beat a sector lookup for this single classification;
+    ``compute_all`` reads the factor from the shared ``WIND_SECTORS`` row.
+    NaN fails every range test: "other" wind.
+    """
     if 135 <= wind_direction_deg <= 225:
         return 2
     if wind_direction_deg >= 315 or wind_direction_deg <= 45:
@@ -411,51 +344,38 @@ def wind_factor(wind_direction_deg: float) -> int:
 
 def wind_compass_text(wind_direction_deg: float) -> str:
     """Convert degrees to a 16-point compass text."""
-    direction = wind_direction_deg % 360
-    if 11.25 < direction <= 33.75:
-        return "N"
-    if 33.75 < direction <= 56.25:
-        return "NE"
-    if 56.25 < direction <= 78.75:
-        return "ENE"
-    if 78.75 < direction <= 101.25:
-        return "E"
-    if 101.25 < direction <= 123.75:
-        return "ESE"
-    if 123.75 < direction <= 146.25:
-        return "SE"
-    if 146.25 < direction <= 168.75:
-        return "SSE"
-    if 168.75 < direction <= 191.25:
-        return "S"
-    if 191.25 < direction <= 213.75:
-        return "SSW"
-    if 213.75 < direction <= 236.25:
-        return "SW"
-    if 236.25 < direction <= 258.75:
-        return "WSW"
-    if 258.75 < direction <= 281.25:
-        return "W"
-    if 281.25 < direction <= 303.75:
-        return "WNW"
-    if 303.75 < direction <= 326.25:
-        return "NW"
-    if 326.25 < direction <= 348.75:
-        return "NNW"
-    return "N"
-
-
-def short_term_conditions(p0_hpa: float, language_index: int) -> tuple[str, str]:
-    """Return short-term conditions and pressure system text."""
+    return WIND_SECTORS[bisect_left(WIND_SECTOR_EDGES, wind_direction_deg % 360)].compass
+
+
+def _short_term_codes(p0_hpa: float) -> tuple[int, int]:
+    """Return short-term condition and pressure system indexes from p0 alone."""
     if p0_hpa < 980:
-        return SHORT_CONDITIONS[0][language_index], PRESSURE_SYSTEMS[0][language_index]
+        return 0, 0
     if p0_hpa < 1000:
-        return SHORT_CONDITIONS[1][language_index], PRESSURE_SYSTEMS[0][language_index]
+        return 1, 0
     if p0_hpa < 1020:
-        return SHORT_CONDITIONS[2][language_index], PRESSURE_SYSTEMS[1][language_index]
+        return 2, 1
     if p0_hpa < 1040:
-        return SHORT_CONDITIONS[3][language_index], PRESSURE_SYSTEMS[2][language_index]
-    return SHORT_CONDITIONS[4][language_index], PRESSURE_SYSTEMS[2][language_index]
+        return 3, 2
+    return 4, 2
+
+
+def short_term_codes(p0_hpa: float, deepening_low: bool = False) -> tuple[int, int]:
+    """Return short-term condition and pressure system indexes.
+
+    A deepening low moves the condition one step towards stormy and reports
+    a low pressure system, whatever the current level.
+    """
+    condition, system = _short_term_codes(p0_hpa)
+    if deepening_low:
+        return max(condition - 1, 0), 0
+    return condition, system
+
+
+def short_term_conditions(p0_hpa: float, texts: TextBundle, deepening_low: bool = False) -> tuple[str, str]:
+    """Return short-term conditions and pressure system text."""
+    condition, system = short_term_codes(p0_hpa, deepening_low)
+    return texts.short_conditions[condition], texts.pressure_systems[system]
 
 
 def _forecast_type_from_z(z_value: int) -> int:
@@ -481,19 +401,8 @@ def _is_summer(now: datetime, is_northern_hemisphere: bool) -> bool:
     return northern_summer if is_northern_hemisphere else not northern_summer
 
 
-def zambretti_forecast(
-    p0_hpa: float,
-    pressure_change_3h: float,
-    wind_direction_deg: float,
-    wind_speed_kmh: float,
-    is_northern_hemisphere: bool,
-    language_index: int,
-    now: datetime,
-) -> tuple[str, int, str]:
-    """Calculate Zambretti forecast text, index and letter."""
-    trend = pressure_trend_index(pressure_change_3h)
-    is_summer = _is_summer(now, is_northern_hemisphere)
-
+def _zambretti_type(p0_hpa: float, trend: int, is_summer: bool, wind_bump: int) -> int:
+    """Return the Zambretti forecast type from derived inputs."""
     if trend < 0:
         z_raw = int(round(127 - 0.12 * p0_hpa, 0))
     elif trend == 0:
@@ -505,76 +414,76 @@ def zambretti_forecast(
         if is_summer:
             z_raw += 1
 
-    z_raw += wind_factor(wind_direction_deg) * wind_speed_factor(wind_speed_kmh)
-
-    forecast_type = _forecast_type_from_z(z_raw)
-    letter = TYPE_LETTERS[forecast_type]
-    return FORECAST_TEXTS[forecast_type][language_index], forecast_type, letter
-
-
-def _apply_northern_wind_correction(z_hp: float, direction_deg: float, bar_range: float) -> float:
-    """Apply wind correction used by Negretti and Zambra implementation."""
-    if 11.25 < direction_deg <= 33.75:
-        return z_hp + 5 / 100 * bar_range
-    if 33.75 < direction_deg <= 56.25:
-        return z_hp + 4.6 / 100 * bar_range
-    if 56.25 < direction_deg <= 78.75:
-        return z_hp + 2 / 100 * bar_range
-    if 78.75 < direction_deg <= 101.25:
-        return z_hp - 0.5 / 100 * bar_range
-    if 101.25 < direction_deg <= 123.75:
-        return z_hp - 3.2 / 100 * bar_range
-    if 123.75 < direction_deg <= 146.25:
-        return z_hp - 5 / 100 * bar_range
-    if 146.25 < direction_deg <= 168.75:
-        return z_hp - 8.5 / 100 * bar_range
-    if 168.75 < direction_deg <= 191.25:
-        return z_hp - 11.2 / 100 * bar_range
-    if 191.25 < direction_deg <= 213.75:
-        return z_hp - 10 / 100 * bar_range
-    if 213.75 < direction_deg <= 236.25:
-        return z_hp - 6 / 100 * bar_range
-    if 236.25 < direction_deg <= 258.75:
-        return z_hp - 4.5 / 100 * bar_range
-    if 258.75 < direction_deg <= 281.25:
-        return z_hp - 3 / 100 * bar_range
-    if 281.25 < direction_deg <= 303.75:
-        return z_hp - 0.5 / 100 * bar_range
-    if 303.75 < direction_deg <= 326.25:
-        return z_hp + 1.5 / 100 * bar_range
-    if 326.25 < direction_deg <= 348.75:
-        return z_hp + 3 / 100 * bar_range
-    if direction_deg > 348.75:
-        return z_hp + 6 / 100 * bar_range
-    return z_hp
+    z_raw += wind_bump
 
+    return _forecast_type_from_z(z_raw)
 
-def neg_zam_forecast(
+
+def zambretti_type(
     p0_hpa: float,
     pressure_change_3h: float,
     wind_direction_deg: float,
     wind_speed_kmh: float,
     is_northern_hemisphere: bool,
-    language_index: int,
+    now: datetime,
+) -> int:
+    """Calculate the Zambretti forecast type (severity index 0..25)."""
+    return _zambretti_type(
+        p0_hpa,
+        pressure_trend_index(pressure_change_3h),
+        _is_summer(now, is_northern_hemisphere),
+        wind_factor(wind_direction_deg) if wind_speed_factor(wind_speed_kmh) else 0,
+    )
+
+
+def zambretti_forecast(
+    p0_hpa: float,
+    pressure_change_3h: float,
+    wind_direction_deg: float,
+    wind_speed_kmh: float,
+    is_northern_hemisphere: bool,
+    texts: TextBundle,
     now: datetime,
 ) -> tuple[str, int, str]:
-    """Calculate Negretti and Zambra forecast text, raw number and letter."""
-    bar_top = 1050.0
-    bar_bottom = 950.0
-    bar_range = bar_top - bar_bottom
-    constant = bar_range / 22
+    """Calculate Zambretti forecast text, index and letter."""
+    forecast_type = zambretti_type(
+        p0_hpa,
+        pressure_change_3h,
+        wind_direction_deg,
+        wind_speed_kmh,
+        is_northern_hemisphere,
+        now,
+    )
+    return texts.forecasts[forecast_type], forecast_type, TYPE_LETTERS[forecast_type]
 
-    trend = pressure_trend_index(pressure_change_3h)
-    z_hp = p0_hpa
 
-    adjusted_direction = wind_direction_deg
-    if not is_northern_hemisphere:
-        adjusted_direction = (wind_direction_deg + 180) % 360
+# Negretti and Zambra barometer scale (hPa).
+_NEG_ZAM_BAR_TOP = 1050.0
+_NEG_ZAM_BAR_BOTTOM = 950.0
+_NEG_ZAM_BAR_RANGE = _NEG_ZAM_BAR_TOP - _NEG_ZAM_BAR_BOTTOM
 
-    if wind_speed_factor(wind_speed_kmh) == 1:
-        z_hp = _apply_northern_wind_correction(z_hp, adjusted_direction, bar_range)
 
-    if _is_summer(now, is_northern_hemisphere):
+def _apply_sector_correction(z_hp: float, sector: int, bar_range: float) -> float:
+    """Apply the Negretti and Zambra correction of a ``WIND_SECTORS`` row."""
+    return z_hp + _SECTOR_CORRECTIONS[sector] * bar_range
+
+
+def _neg_zam_code(p0_hpa: float, trend: int, is_summer: bool, sector: int | None) -> tuple[int, bool]:
+    """Return the Negretti and Zambra number from derived inputs.
+
+    ``sector`` is the ``WIND_SECTORS`` row of the hemisphere-adjusted wind
+    direction, or None when the wind is calm.
+    """
+    bar_top = _NEG_ZAM_BAR_TOP
+    bar_bottom = _NEG_ZAM_BAR_BOTTOM
+    bar_range = _NEG_ZAM_BAR_RANGE
+    constant = bar_range / 22
+
+    z_hp = p0_hpa
+    if sector is not None:
+        z_hp = _apply_sector_correction(z_hp, sector, bar_range)
+
+    if is_summer:
         if trend > 0:
             z_hp += 7 / 100 * bar_range
         elif trend < 0:
@@ -584,13 +493,13 @@ def neg_zam_forecast(
         z_hp = bar_top - 1
 
     z_option = int(floor((z_hp - bar_bottom) / constant))
-    prefix = ""
+    exceptional = False
     if z_option < 0:
         z_option = 0
-        prefix = EXCEPTIONAL_TEXT[language_index]
+        exceptional = True
     elif z_option > 21:
         z_option = 21
-        prefix = EXCEPTIONAL_TEXT[language_index]
+        exceptional = True
 
     if trend > 0:
         z_num = RISE_OPT[z_option]
@@ -599,110 +508,323 @@ def neg_zam_forecast(
     else:
         z_num = STEADY_OPT[z_option]
 
-    letter = forecast_letter_from_number(z_num)
-    return prefix + FORECAST_TEXTS[z_num][language_index], z_num, letter
+    return z_num, exceptional
+
+
+def neg_zam_code(
+    p0_hpa: float,
+    pressure_change_3h: float,
+    wind_direction_deg: float,
+    wind_speed_kmh: float,
+    is_northern_hemisphere: bool,
+    now: datetime,
+) -> tuple[int, bool]:
+    """Calculate the Negretti and Zambra number and whether it is exceptional."""
+    sector = None
+    if wind_speed_factor(wind_speed_kmh) == 1:
+        adjusted_direction = wind_direction_deg
+        if not is_northern_hemisphere:
+            adjusted_direction = (wind_direction_deg + 180) % 360
+        sector = bisect_left(WIND_SECTOR_EDGES, adjusted_direction)
+
+    return _neg_zam_code(
+        p0_hpa,
+        pressure_trend_index(pressure_change_3h),
+        _is_summer(now, is_northern_hemisphere),
+        sector,
+    )
+
+
+def _neg_zam_text(z_num: int, exceptional: bool, texts: TextBundle) -> str:
+    """Return the Negretti and Zambra text, prefixed outside the barometer range."""
+    text = texts.forecasts[z_num]
+    if exceptional:
+        text = texts.exceptional + text
+    return text
+
+
+def neg_zam_forecast(
+    p0_hpa: float,
+    pressure_change_3h: float,
+    wind_direction_deg: float,
+    wind_speed_kmh: float,
+    is_northern_hemisphere: bool,
+    texts: TextBundle,
+    now: datetime,
+) -> tuple[str, int, str]:
+    """Calculate Negretti and Zambra forecast text, raw number and letter."""
+    z_num, exceptional = neg_zam_code(
+        p0_hpa,
+        pressure_change_3h,
+        wind_direction_deg,
+        wind_speed_kmh,
+        is_northern_hemisphere,
+        now,
+    )
+    return _neg_zam_text(z_num, exceptional, texts), z_num, forecast_letter_from_number(z_num)
+
+
+class ForecastInputs(NamedTuple):
+    """Inputs of one forecast update, see ``compute_all``."""
+
+    p0_hpa: float
+    pressure_change_3h: float
+    wind_direction_deg: float
+    wind_speed_kmh: float
+    is_northern_hemisphere: bool
+    now: datetime
+    deepening_low: bool = False
+
+
+class ForecastResult(NamedTuple):
+    """Every forecast output of one update, codes and texts."""
+
+    # -1 falling, 0 steady, 1 rising, and the legacy trend code and text.
+    trend: int
+    trend_code: str
+    trend_text: str
+    wind_factor: int
+    wind_speed_factor: int
+    wind_compass: str
+    short_term_condition: int
+    pressure_system: int
+    short_term_condition_text: str
+    pressure_system_text: str
+    zambretti_type: int
+    zambretti_letter: str
+    zambretti_text: str
+    neg_zam_number: int
+    neg_zam_exceptional: bool
+    neg_zam_letter: str
+    neg_zam_text: str
+
+
+def compute_all(
+    inputs: ForecastInputs,
+    texts: TextBundle,
+    trend_threshold: float = PRESSURE_TREND_THRESHOLD,
+) -> ForecastResult:
+    """Compute both models, the trend, wind and short-term outputs in one pass.
+
+    Equivalent to the separate functions, but the trend, season, wind sector
+    and wind factors are derived once and shared by both models.
+    ``trend_threshold`` overrides the 3h change that counts as rising or falling.
+    """
+    p0_hpa = inputs.p0_hpa
+    direction = inputs.wind_direction_deg
+    trend = pressure_trend_index(inputs.pressure_change_3h, trend_threshold)
+    is_summer = _is_summer(inputs.now, inputs.is_northern_hemisphere)
+    speed_factor = wind_speed_factor(inputs.wind_speed_kmh)
+
+    sector = bisect_left(WIND_SECTOR_EDGES, direction)
+    # NaN fails every range test of the legacy template: "other" wind.
+    factor = 1 if direction != direction else WIND_SECTORS[sector].factor
+    compass_sector = sector if 0 <= direction < 360 else bisect_left(WIND_SECTOR_EDGES, direction % 360)
+    correction_sector = None
+    if speed_factor == 1:
+        correction_sector = (
+            sector
+            if inputs.is_northern_hemisphere
+            else bisect_left(WIND_SECTOR_EDGES, (direction + 180) % 360)
+        )
+
+    condition, system = short_term_codes(p0_hpa, inputs.deepening_low)
+    trend_code = _TREND_CODES[trend + 1]
+    forecast_type = _zambretti_type(p0_hpa, trend, is_summer, factor * speed_factor)
+    z_num, exceptional = _neg_zam_code(p0_hpa, trend, is_summer, correction_sector)
+
+    # Positional: keyword construction of a 17-field tuple costs more than
+    # the rest of the update.
+    return ForecastResult(
+        trend,
+        _TREND_CODE_TEXTS[trend_code],
+        texts.trends[trend_code],
+        factor,
+        speed_factor,
+        WIND_SECTORS[compass_sector].compass,
+        condition,
+        system,
+        texts.short_conditions[condition],
+        texts.pressure_systems[system],
+        forecast_type,
+        TYPE_LETTERS[forecast_type],
+        texts.forecasts[forecast_type],
+        z_num,
+        exceptional,
+        forecast_letter_from_number(z_num),
+        _neg_zam_text(z_num, exceptional, texts),
+    )
+
+
+def _detail_rain_prob(forecast: tuple[int, int], zambretti_variant: bool) -> tuple[int, int]:
+    """Return the rain probabilities of a detail bucket pair."""
+    if zambretti_variant:
+        if forecast[0] == 0 and forecast[1] == 0:
+            return (0, 0)
+        if forecast[0] == 2 and forecast[1] == 1:
+            return (60, 10)
+        if forecast[0] == 1 and forecast[1] == 1:
+            return (30, 30)
+        if forecast[0] == 1 and forecast[1] == 0:
+            return (10, 0)
+        if forecast[0] == 1 and forecast[1] >= 2:
+            return (20, 60)
+        if forecast[0] == 2 and forecast[1] == 2:
+            return (50, 50)
+        if forecast[0] == 2 and forecast[1] > 2:
+            return (50, 70)
+        if forecast[0] >= 2 and forecast[1] < 2:
+            return (50, 10)
+        return (90, 90)
+
+    if forecast[0] < 2 and forecast[1] < 2:
+        return (0, 0)
+    if forecast[0] == 1 and forecast[1] >= 2:
+        return (20, 60)
+    if forecast[0] == 2 and forecast[1] == 2:
+        return (50, 50)
+    if forecast[0] == 2 and forecast[1] > 2:
+        return (50, 70)
+    return (90, 90)
+
+
+def _detail_parts(
+    mapping: dict[int, tuple[int, int]],
+    zambretti_variant: bool,
+) -> tuple[tuple[Mapping[str, object], Mapping[str, object]], ...]:
+    """Precompute the clock-independent detail payload of every code, day and night.
+
+    Index ``[code - 1][is_night]``. Payloads are shared between updates and
+    stations, so they are read-only mappings of tuples.
+    """
+    parts = []
+    for code in range(1, 26):
+        forecast = mapping.get(code, (3, 3))
+        rain_prob = _detail_rain_prob(forecast, zambretti_variant)
+        parts.append(
+            tuple(
+                MappingProxyType(
+                    {
+                        "forecast": (forecast[0], forecast[1]),
+                        "rain_prob": (rain_prob[0], rain_prob[1]),
+                        "icons": (ICON_CONDITIONS[forecast[0]][daynight], ICON_CONDITIONS[forecast[1]][daynight]),
+                    }
+                )
+                for daynight in (0, 1)
+            )
+        )
+    return tuple(parts)
+
+
+_ZAMBRETTI_DETAIL_PARTS = _detail_parts(ZAMBRETTI_FORECAST_BY_CODE, True)
+_NEG_ZAM_DETAIL_PARTS = _detail_parts(NEG_ZAM_FORECAST_BY_CODE, False)
+
+_DETAIL_FIRST_DELTA = timedelta(hours=3)
+_DETAIL_SECOND_DELTA = timedelta(hours=9)
+
+
+class _DetailCache:
+    """Detail payloads of the current wall-clock minute.
+
+    Keyed by (variant, code, night) and cleared when the minute changes;
+    time labels only depend on the minute and time zone.
+    """
+
+    __slots__ = ("minute", "payloads", "time_labels")
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self.minute: tuple[object, ...] | None = None
+        self.payloads: dict[tuple[bool, int, int], Mapping[str, object]] = {}
+        self.time_labels: tuple[tuple[str, float], tuple[str, float]] = (("", 0.0), ("", 0.0))
+
+    def set_minute(self, now: datetime) -> None:
+        """Drop the payloads of a previous minute."""
+        minute = (now.minute, now.hour, now.day, now.month, now.year, now.tzinfo)
+        if minute != self.minute:
+            self.minute = minute
+            self.payloads.clear()
+            self.time_labels = (
+                ((now + _DETAIL_FIRST_DELTA).strftime("%H:%M"), round(_DETAIL_FIRST_DELTA.total_seconds() / 60, 2)),
+                ((now + _DETAIL_SECOND_DELTA).strftime("%H:%M"), round(_DETAIL_SECOND_DELTA.total_seconds() / 60, 2)),
+            )
+
+
+_DETAIL_CACHE = _DetailCache()
 
 
 def _build_detail(
     forecast_code: int,
     is_night: bool,
     now: datetime,
-    mapping: dict[int, tuple[int, int]],
     zambretti_variant: bool,
-) -> dict[str, object]:
-    """Build detail payload with rain probabilities, icons and time windows."""
+) -> Mapping[str, object]:
+    """Return the detail payload with rain probabilities, icons and time windows.
+
+    The payload is a read-only mapping of tuples shared by every caller
+    within the same minute; copy it to get a mutable dict.
+    """
     # The legacy template uses "+1" before mapping to card detail buckets.
     # Some paths can produce 26 while our maps are 1..25, so clamp explicitly.
     normalized_code = max(1, min(25, int(forecast_code)))
-    forecast = mapping.get(normalized_code, (3, 3))
-
-    if zambretti_variant:
-        if forecast[0] == 0 and forecast[1] == 0:
-            rain_prob = (0, 0)
-        elif forecast[0] == 2 and forecast[1] == 1:
-            rain_prob = (60, 10)
-        elif forecast[0] == 1 and forecast[1] == 1:
-            rain_prob = (30, 30)
-        elif forecast[0] == 1 and forecast[1] == 0:
-            rain_prob = (10, 0)
-        elif forecast[0] == 1 and forecast[1] >= 2:
-            rain_prob = (20, 60)
-        elif forecast[0] == 2 and forecast[1] == 2:
-            rain_prob = (50, 50)
-        elif forecast[0] == 2 and forecast[1] > 2:
-            rain_prob = (50, 70)
-        elif forecast[0] >= 2 and forecast[1] < 2:
-            rain_prob = (50, 10)
-        else:
-            rain_prob = (90, 90)
-    else:
-        if forecast[0] < 2 and forecast[1] < 2:
-            rain_prob = (0, 0)
-        elif forecast[0] == 1 and forecast[1] >= 2:
-            rain_prob = (20, 60)
-        elif forecast[0] == 2 and forecast[1] == 2:
-            rain_prob = (50, 50)
-        elif forecast[0] == 2 and forecast[1] > 2:
-            rain_prob = (50, 70)
-        else:
-            rain_prob = (90, 90)
-
     daynight = 1 if is_night else 0
-    icon_now = ICON_CONDITIONS[forecast[0]][daynight]
-    icon_later = ICON_CONDITIONS[forecast[1]][daynight]
-
-    first_delta = timedelta(hours=3)
-    second_delta = timedelta(hours=9)
-    first_time = now + first_delta
-    second_time = now + second_delta
 
-    return {
-        "forecast": [forecast[0], forecast[1]],
-        "rain_prob": [rain_prob[0], rain_prob[1]],
-        "icons": (icon_now, icon_later),
-        "first_time": [first_time.strftime("%H:%M"), round(first_delta.total_seconds() / 60, 2)],
-        "second_time": [
-            second_time.strftime("%H:%M"),
-            round(second_delta.total_seconds() / 60, 2),
-        ],
-    }
+    cache = _DETAIL_CACHE
+    cache.set_minute(now)
+    key = (zambretti_variant, normalized_code, daynight)
+    payload = cache.payloads.get(key)
+    if payload is None:
+        parts = _ZAMBRETTI_DETAIL_PARTS if zambretti_variant else _NEG_ZAM_DETAIL_PARTS
+        payload = cache.payloads[key] = MappingProxyType(
+            {
+                **parts[normalized_code - 1][daynight],
+                "first_time": cache.time_labels[0],
+                "second_time": cache.time_labels[1],
+            }
+        )
+    return payload
 
 
-def zambretti_detail(forecast_type: int, is_night: bool, now: datetime) -> dict[str, object]:
+def zambretti_detail(forecast_type: int, is_night: bool, now: datetime) -> Mapping[str, object]:
     """Return detailed values for Zambretti forecast card."""
-    return _build_detail(
-        forecast_code=forecast_type + 1,
-        is_night=is_night,
-        now=now,
-        mapping=ZAMBRETTI_FORECAST_BY_CODE,
-        zambretti_variant=True,
-    )
+    return _build_detail(forecast_type + 1, is_night, now, zambretti_variant=True)
 
 
-def neg_zam_detail(z_number: int, is_night: bool, now: datetime) -> dict[str, object]:
+def neg_zam_detail(z_number: int, is_night: bool, now: datetime) -> Mapping[str, object]:
     """Return detailed values for Negretti/Zam forecast card."""
-    return _build_detail(
-        forecast_code=z_number + 1,
-        is_night=is_night,
-        now=now,
-        mapping=NEG_ZAM_FORECAST_BY_CODE,
-        zambretti_variant=False,
-    )
+    return _build_detail(z_number + 1, is_night, now, zambretti_variant=False)
+
+
+def compact_detail(detail: Mapping[str, object], is_night: bool) -> dict[str, object]:
+    """Return the numeric part of a detail payload.
+
+    Icons follow from ``ICON_CONDITIONS[forecast][night]`` and the time
+    windows are fixed offsets, so cards can rebuild them client-side.
+    """
+    return {
+        "forecast": detail["forecast"],
+        "rain_prob": detail["rain_prob"],
+        "night": int(is_night),
+    }
 
 
 def estimate_temperature_slope_c_per_hour(
-    history: Sequence[tuple[datetime, float]],
-    now: datetime,
+    timestamps: Sequence[float],
+    values: Sequence[float],
+    now: float,
     fallback_change_1h: float,
 ) -> float:
     """Estimate recent temperature slope using weighted segment averaging.
 
     The estimate uses recent segments (up to ~90 minutes), weighted by recency
     and segment duration, then blended with the legacy 1-hour delta method.
+    ``timestamps`` (epoch seconds, ascending) and ``values`` are parallel
+    sequences, typically zero-copy views of a history buffer.
     """
-    window = timedelta(minutes=90)
-    recent = [(ts, value) for ts, value in history if now - ts <= window]
-    if len(recent) < 2:
+    window_seconds = TEMPERATURE_SLOPE_WINDOW_SECONDS
+    first = bisect_left(timestamps, now - window_seconds)
+    count = len(timestamps)
+    if count - first < 2:
         return max(
             -TEMPERATURE_MAX_FORECAST_SLOPE_C_PER_H,
             min(TEMPERATURE_MAX_FORECAST_SLOPE_C_PER_H, fallback_change_1h),
@@ -710,23 +832,24 @@ def estimate_temperature_slope_c_per_hour(
 
     weighted_slope = 0.0
     weighted_total = 0.0
-    window_seconds = window.total_seconds()
-    for index in range(1, len(recent)):
-        prev_ts, prev_value = recent[index - 1]
-        curr_ts, curr_value = recent[index]
-        segment_seconds = (curr_ts - prev_ts).total_seconds()
-        if segment_seconds <= 0:
-            continue
-
-        segment_hours = segment_seconds / 3600
-        segment_slope = (curr_value - prev_value) / segment_hours
-        midpoint = prev_ts + (curr_ts - prev_ts) / 2
-        age_seconds = max(0.0, (now - midpoint).total_seconds())
-        recency_weight = max(0.2, 1.0 - (age_seconds / window_seconds))
-        duration_weight = min(1.0, segment_seconds / 1200)
-        weight = recency_weight * duration_weight
-        weighted_slope += segment_slope * weight
-        weighted_total += weight
+    prev_ts = timestamps[first]
+    prev_value = values[first]
+    for index in range(first + 1, count):
+        curr_ts = timestamps[index]
+        curr_value = values[index]
+        segment_seconds = curr_ts - prev_ts
+        if segment_seconds > 0:
+            segment_hours = segment_seconds / 3600
+            segment_slope = (curr_value - prev_value) / segment_hours
+            midpoint = prev_ts + segment_seconds / 2
+            age_seconds = max(0.0, now - midpoint)
+            recency_weight = max(0.2, 1.0 - (age_seconds / window_seconds))
+            duration_weight = min(1.0, segment_seconds / 1200)
+            weight = recency_weight * duration_weight
+            weighted_slope += segment_slope * weight
+            weighted_total += weight
+        prev_ts = curr_ts
+        prev_value = curr_value
 
     if weighted_total <= 0:
         blended_slope = fallback_change_1h
@@ -0,0 +1,478 @@
+"""Compact rolling sample buffers for Barocast HA."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from math import floor, inf
+from typing import NamedTuple
+
+from .const import (
+    COVERAGE_FULL,
+    COVERAGE_GAP,
+    COVERAGE_PARTIAL,
+    HISTORY_BUCKET_SECONDS,
+    HISTORY_MAX_GAP,
+    HISTORY_MAX_SAMPLES,
+    PRESSURE_HISTORY_WINDOW,
+    PRESSURE_HORIZON_MARGIN,
+    TEMPERATURE_CHANGE_HORIZON,
+    TEMPERATURE_HISTORY_WINDOW,
+)
+from .estimators import PressureTendencyFit, PressureTrendKalman, TemperatureSlopeEstimator
+
+
+class RingView:
+    """Read-only, zero-copy sequence view over one column of a ring buffer."""
+
+    __slots__ = ("_data", "_start", "_size", "_capacity")
+
+    def __init__(self, data: memoryview, start: int, size: int, capacity: int) -> None:
+        """Initialize the view."""
+        self._data = data
+        self._start = start
+        self._size = size
+        self._capacity = capacity
+
+    def __len__(self) -> int:
+        """Return the number of samples in view."""
+        return self._size
+
+    def __getitem__(self, index: int) -> float:
+        """Return the sample at a logical index (oldest first)."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ring view index out of range")
+        return self._data[(self._start + index) % self._capacity]
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate samples from oldest to newest."""
+        end = self._start + self._size
+        if end <= self._capacity:
+            yield from self._data[self._start : end]
+            return
+        yield from self._data[self._start :]
+        yield from self._data[: end - self._capacity]
+
+
+class HistoryBuffer:
+    """Fixed-capacity ring buffer of (epoch seconds, value) samples.
+
+    Timestamps and values live in parallel ``array('d')`` columns, so a sample
+    costs 16 bytes and no Python objects are kept per sample. Samples must be
+    appended in time order; once ``capacity`` is reached the oldest sample is
+    overwritten, which bounds memory whatever the update rate.
+    """
+
+    __slots__ = ("_capacity", "_timestamps", "_values", "_start", "_size")
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize an empty buffer."""
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self._capacity = capacity
+        self._timestamps = memoryview(array("d", bytes(8 * capacity)))
+        self._values = memoryview(array("d", bytes(8 * capacity)))
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored samples."""
+        return self._size
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        """Iterate (timestamp, value) pairs from oldest to newest."""
+        return zip(self.timestamps, self.values)
+
+    @property
+    def capacity(self) -> int:
+        """Return the maximum number of samples kept."""
+        return self._capacity
+
+    @property
+    def timestamps(self) -> RingView:
+        """Return a zero-copy view of sample timestamps (epoch seconds)."""
+        return RingView(self._timestamps, self._start, self._size, self._capacity)
+
+    @property
+    def values(self) -> RingView:
+        """Return a zero-copy view of sample values."""
+        return RingView(self._values, self._start, self._size, self._capacity)
+
+    @property
+    def first_timestamp(self) -> float:
+        """Return the timestamp of the oldest sample."""
+        if not self._size:
+            raise IndexError("history is empty")
+        return self._timestamps[self._start]
+
+    @property
+    def first_value(self) -> float:
+        """Return the value of the oldest sample."""
+        if not self._size:
+            raise IndexError("history is empty")
+        return self._values[self._start]
+
+    @property
+    def last_timestamp(self) -> float:
+        """Return the timestamp of the newest sample."""
+        if not self._size:
+            raise IndexError("history is empty")
+        return self._timestamps[(self._start + self._size - 1) % self._capacity]
+
+    @property
+    def last_value(self) -> float:
+        """Return the value of the newest sample."""
+        if not self._size:
+            raise IndexError("history is empty")
+        return self._values[(self._start + self._size - 1) % self._capacity]
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Add a sample, overwriting the oldest one when the buffer is full."""
+        if self._size == self._capacity:
+            self._start = (self._start + 1) % self._capacity
+            self._size -= 1
+        index = (self._start + self._size) % self._capacity
+        self._timestamps[index] = timestamp
+        self._values[index] = value
+        self._size += 1
+
+    def replace_last(self, value: float) -> None:
+        """Replace the value of the newest sample."""
+        if not self._size:
+            raise IndexError("history is empty")
+        self._values[(self._start + self._size - 1) % self._capacity] = value
+
+    def value_at(self, timestamp: float, max_gap: float = inf) -> tuple[float | None, str]:
+        """Return the value linearly interpolated at ``timestamp`` and its coverage.
+
+        Before the first sample the value is None and the coverage partial;
+        after the newest sample its value is held. The coverage is a gap when
+        the samples around ``timestamp`` are further apart than ``max_gap``.
+        """
+        if not self._size:
+            return None, COVERAGE_PARTIAL
+        timestamps = self.timestamps
+        index = bisect_left(timestamps, timestamp)
+        if index == self._size:
+            last_timestamp = self.last_timestamp
+            return self.last_value, COVERAGE_GAP if timestamp - last_timestamp > max_gap else COVERAGE_FULL
+        values = self.values
+        after = timestamps[index]
+        if after == timestamp:
+            return values[index], COVERAGE_FULL
+        if index == 0:
+            return None, COVERAGE_PARTIAL
+        before = timestamps[index - 1]
+        value_before = values[index - 1]
+        value = value_before + (values[index] - value_before) * (timestamp - before) / (after - before)
+        return value, COVERAGE_GAP if after - before > max_gap else COVERAGE_FULL
+
+    def index_at_or_after(self, timestamp: float) -> int:
+        """Return the logical index of the first sample not older than timestamp."""
+        return bisect_left(self.timestamps, timestamp)
+
+    def evict_before(self, cutoff: float, keep_anchor: bool = False) -> int:
+        """Drop samples older than cutoff and return how many were dropped.
+
+        With ``keep_anchor`` the newest sample older than cutoff is kept, so
+        a value can still be interpolated at the cutoff itself.
+        """
+        if not self._size or self._timestamps[self._start] >= cutoff:
+            return 0
+        count = self.index_at_or_after(cutoff) - keep_anchor
+        self._start = (self._start + count) % self._capacity
+        self._size -= count
+        return count
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        self._start = 0
+        self._size = 0
+
+
+class SampleBucket:
+    """Running mean of the samples in a fixed time bucket.
+
+    Buckets are aligned on multiples of ``seconds`` (epoch time). A bucket is
+    stored in history as one sample at the time of its first raw sample, with
+    the bucket mean as value, so sensors reporting faster than the bucket
+    length cost one history sample per bucket.
+    """
+
+    __slots__ = ("seconds", "index", "timestamp", "count", "total")
+
+    def __init__(self, seconds: float) -> None:
+        """Initialize an empty bucket."""
+        self.seconds = seconds
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the open bucket."""
+        self.index: int | None = None
+        self.timestamp = 0.0
+        self.count = 0
+        self.total = 0.0
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the bucket samples."""
+        return self.total / self.count
+
+    def add(self, timestamp: float, value: float) -> bool:
+        """Add a raw sample and return True when it opened a new bucket."""
+        index = floor(timestamp / self.seconds)
+        if index == self.index:
+            self.count += 1
+            self.total += value
+            return False
+        self.index = index
+        self.timestamp = timestamp
+        self.count = 1
+        self.total = value
+        return True
+
+
+class WindowChanges(NamedTuple):
+    """Window changes at one update and how well the history covers them."""
+
+    pressure_change: float
+    temperature_change: float | None
+    pressure_coverage: str
+    temperature_coverage: str | None
+
+
+class StationTrends(NamedTuple):
+    """Trend values derived from the rolling windows at one update."""
+
+    pressure_change: float
+    temperature_change: float | None
+    temperature_slope: float | None
+    pressure_coverage: str
+    temperature_coverage: str | None
+
+
+class StationHistory:
+    """Rolling pressure and temperature windows of one station.
+
+    This is the rolling-window part of the coordinator update (3h pressure
+    change, 1h temperature change and short-term temperature slope). It does
+    not depend on Home Assistant, so offline tools replay station data
+    through exactly the same logic.
+
+    Changes are taken against the value interpolated at exactly ``now -
+    horizon`` (binary search), and come with a coverage flag telling whether
+    the history spans the horizon without a gap longer than
+    ``max_gap_seconds``.
+
+    Readings are aggregated into fixed time buckets before entering the
+    windows, so memory and the trend/slope work depend on the window length
+    rather than on the sensor rate. Readings further apart than a bucket
+    are stored unchanged.
+
+    With ``kalman_trend`` the 3h pressure change is the smoothed rate of a
+    ``PressureTrendKalman`` fed with every closed pressure bucket instead of
+    the difference with the oldest sample; the window is still kept for
+    persistence and seeding.
+
+    ``pressure_horizons`` (hours) extends the pressure retention to the
+    longest horizon plus ``PRESSURE_HORIZON_MARGIN``; the changes over every
+    horizon, including the 3h one, are then read from that single buffer
+    with interpolated lookups.
+    """
+
+    __slots__ = (
+        "pressure",
+        "temperature",
+        "temperature_slope",
+        "pressure_bucket",
+        "temperature_bucket",
+        "pressure_trend",
+        "pressure_tendency",
+        "pressure_horizons",
+        "pressure_retention",
+        "max_gap",
+    )
+
+    def __init__(
+        self,
+        capacity: int = HISTORY_MAX_SAMPLES,
+        bucket_seconds: float = HISTORY_BUCKET_SECONDS,
+        kalman_trend: bool = False,
+        pressure_horizons: Sequence[int] = (),
+        max_gap_seconds: float = HISTORY_MAX_GAP.total_seconds(),
+    ) -> None:
+        """Initialize empty windows."""
+        self.pressure = HistoryBuffer(capacity)
+        self.temperature = HistoryBuffer(capacity)
+        self.temperature_slope = TemperatureSlopeEstimator()
+        self.pressure_bucket = SampleBucket(bucket_seconds)
+        self.temperature_bucket = SampleBucket(bucket_seconds)
+        self.pressure_trend = PressureTrendKalman() if kalman_trend else None
+        self.pressure_tendency = PressureTendencyFit()
+        self.pressure_horizons = tuple(sorted(set(pressure_horizons)))
+        # Seconds of pressure kept in the buffer.
+        self.pressure_retention = PRESSURE_HISTORY_WINDOW.total_seconds()
+        if self.pressure_horizons:
+            self.pressure_retention = max(
+                self.pressure_retention,
+                self.pressure_horizons[-1] * 3600 + PRESSURE_HORIZON_MARGIN.total_seconds(),
+            )
+        self.max_gap = max_gap_seconds
+
+    def update(self, timestamp: float, p0: float, temperature: float | None) -> StationTrends:
+        """Add the current readings and return the resulting trends."""
+        changes = self.update_windows(timestamp, p0, temperature)
+        return StationTrends(
+            changes.pressure_change,
+            changes.temperature_change,
+            self.update_slope(timestamp, temperature, changes.temperature_change),
+            changes.pressure_coverage,
+            changes.temperature_coverage,
+        )
+
+    def update_windows(self, timestamp: float, p0: float, temperature: float | None) -> WindowChanges:
+        """Add the readings to the rolling windows and return their changes."""
+        _ingest(self.pressure, self.pressure_bucket, timestamp, p0, self.pressure_retention)
+        # The tendency fits mirror the newest (possibly still open) bucket.
+        tendency = self.pressure_tendency
+        if tendency.last_timestamp == self.pressure.last_timestamp:
+            tendency.replace_last(self.pressure.last_value)
+        else:
+            tendency.add(self.pressure.last_timestamp, self.pressure.last_value)
+        pressure_change, pressure_coverage = self._pressure_change(timestamp, p0)
+        if temperature is None:
+            self.temperature.clear()
+            self.temperature_bucket.reset()
+            return WindowChanges(pressure_change, None, pressure_coverage, None)
+
+        _ingest(
+            self.temperature,
+            self.temperature_bucket,
+            timestamp,
+            temperature,
+            TEMPERATURE_HISTORY_WINDOW.total_seconds(),
+        )
+        temperature_change, temperature_coverage = _change_from_history(
+            self.temperature,
+            temperature,
+            timestamp - TEMPERATURE_CHANGE_HORIZON.total_seconds(),
+            self.max_gap,
+        )
+        return WindowChanges(pressure_change, temperature_change, pressure_coverage, temperature_coverage)
+
+    def seed_pressure(self, timestamp: float, p0: float) -> None:
+        """Add a past pressure reading through the same bucket aggregation as live ones."""
+        _ingest(self.pressure, self.pressure_bucket, timestamp, p0, self.pressure_retention)
+
+    def seed_temperature(self, timestamp: float, temperature: float) -> None:
+        """Add a past temperature reading through the same bucket aggregation as live ones."""
+        _ingest(
+            self.temperature,
+            self.temperature_bucket,
+            timestamp,
+            temperature,
+            TEMPERATURE_HISTORY_WINDOW.total_seconds(),
+        )
+
+    def pressure_half_changes(self, timestamp: float) -> tuple[float, float] | None:
+        """Return the pressure changes over both halves of the 3h window.
+
+        Each change is a least-squares slope over the samples of its half
+        times the half length, read from the running sums of
+        ``pressure_tendency``. The tendency is unknown (None) unless the
+        history fully covers the start and the middle of the window, so a
+        half is never extrapolated from a few samples minutes apart.
+        """
+        history = self.pressure
+        half = PRESSURE_HISTORY_WINDOW.total_seconds() / 2
+        for since in (timestamp - 2 * half, timestamp - half):
+            if history.value_at(since, self.max_gap)[1] != COVERAGE_FULL:
+                return None
+        return self.pressure_tendency.half_changes(timestamp)
+
+    def pressure_horizon_changes(self, timestamp: float, p0: float) -> tuple[float | None, ...]:
+        """Return the pressure change over each horizon.
+
+        A change is None unless the history fully covers its horizon: while
+        the history is shorter, or when the lookup falls in a gap longer
+        than ``max_gap_seconds`` (downtime is never interpolated across).
+        """
+        history = self.pressure
+        changes: list[float | None] = []
+        for hours in self.pressure_horizons:
+            past, coverage = history.value_at(timestamp - hours * 3600, self.max_gap)
+            changes.append(p0 - past if coverage == COVERAGE_FULL else None)
+        return tuple(changes)
+
+    def _pressure_change(self, timestamp: float, p0: float) -> tuple[float, str]:
+        """Return the 3h pressure change of the configured trend estimator and its coverage."""
+        change, coverage = _change_from_history(
+            self.pressure,
+            p0,
+            timestamp - PRESSURE_HISTORY_WINDOW.total_seconds(),
+            self.max_gap,
+        )
+        if self.pressure_trend is None:
+            return change, coverage
+        # The estimator is fed closed buckets only, so its smoothing does not
+        # depend on the update rate.
+        history = self.pressure
+        trend = self.pressure_trend
+        if len(history) > 1 and (trend.timestamp is None or history.timestamps[-2] > trend.timestamp):
+            trend.update(history.timestamps[-2], history.values[-2])
+        return trend.change(PRESSURE_HISTORY_WINDOW.total_seconds() / 3600), coverage
+
+    def update_slope(
+        self,
+        timestamp: float,
+        temperature: float | None,
+        temperature_change: float | None,
+    ) -> float | None:
+        """Feed the slope estimator and return the short-term temperature slope."""
+        if temperature is None or temperature_change is None or not self.temperature:
+            self.temperature_slope.reset()
+            return None
+        # The estimator mirrors the newest (possibly still open) bucket.
+        bucket_timestamp = self.temperature.last_timestamp
+        if self.temperature_slope.last_timestamp == bucket_timestamp:
+            self.temperature_slope.replace_last(self.temperature.last_value)
+        else:
+            self.temperature_slope.add(bucket_timestamp, self.temperature.last_value)
+        return self.temperature_slope.slope(timestamp, temperature_change)
+
+
+def _ingest(
+    history: HistoryBuffer,
+    bucket: SampleBucket,
+    timestamp: float,
+    value: float,
+    max_age_seconds: float,
+) -> None:
+    """Aggregate a reading into its bucket, store the bucket and prune old samples."""
+    if bucket.add(timestamp, value) or not history or history.last_timestamp != bucket.timestamp:
+        history.append(bucket.timestamp, bucket.mean)
+    else:
+        history.replace_last(bucket.mean)
+    history.evict_before(timestamp - max_age_seconds, keep_anchor=True)
+
+
+def _change_from_history(
+    history: HistoryBuffer,
+    current: float,
+    since: float,
+    max_gap: float,
+) -> tuple[float, str]:
+    """Return the change since ``since`` and the coverage of that lookup.
+
+    When the history starts later, the change since its oldest sample is
+    returned with a partial coverage.
+    """
+    past, coverage = history.value_at(since, max_gap)
+    if past is not None:
+        return current - past, coverage
+    if not history:
+        return 0.0, coverage
+    return current - history.first_value, coverage
@@ -0,0 +1,157 @@
+"""Shared recompute scheduler for Barocast HA stations."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from math import floor
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, StateMachine, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import SCHEDULER_BATCH_WINDOW_SECONDS
+
+if TYPE_CHECKING:
+    from .coordinator import BarocastHACoordinator
+
+_MISSING = object()
+
+
+class StateReader:
+    """Source states read once per batch and shared by every station."""
+
+    __slots__ = ("_states", "_cache", "_numbers")
+
+    def __init__(self, states: StateMachine) -> None:
+        """Initialize an empty cache over the state machine."""
+        self._states = states
+        self._cache: dict[str, State | None] = {}
+        self._numbers: dict[str, float | None] = {}
+
+    def state(self, entity_id: str) -> State | None:
+        """Return the state of an entity."""
+        state = self._cache.get(entity_id, _MISSING)
+        if state is _MISSING:
+            state = self._cache[entity_id] = self._states.get(entity_id)
+        return state  # type: ignore[return-value]
+
+    def number(self, entity_id: str) -> float | None:
+        """Return the state of an entity as float, None when missing or not numeric."""
+        value = self._numbers.get(entity_id, _MISSING)
+        if value is not _MISSING:
+            return value  # type: ignore[return-value]
+        state = self.state(entity_id)
+        try:
+            value = float(state.state) if state is not None else None
+        except (TypeError, ValueError):
+            value = None
+        self._numbers[entity_id] = value
+        return value
+
+
+class BarocastScheduler:
+    """Run the recomputes of every configured station from one timer.
+
+    Periodic runs are aligned on multiples of each station's interval, so
+    stations sharing an interval are due together; event-driven requests are
+    debounced per station. Every station due within a short window is
+    computed in the same event loop callback with one shared ``StateReader``.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._stations: dict[str, BarocastHACoordinator] = {}
+        self._due: dict[str, float] = {}
+        self._cancel_timer: CALLBACK_TYPE | None = None
+        self._timer_due: float | None = None
+
+    def __len__(self) -> int:
+        """Return the number of scheduled stations."""
+        return len(self._stations)
+
+    @callback
+    def async_add(self, coordinator: BarocastHACoordinator) -> CALLBACK_TYPE:
+        """Schedule a station and return a callback that removes it."""
+        entry_id = coordinator.config_entry.entry_id
+        self._stations[entry_id] = coordinator
+        self._due[entry_id] = self._next_periodic(coordinator, self.hass.loop.time())
+        self._async_arm()
+
+        @callback
+        def _async_remove() -> None:
+            self.async_remove(coordinator)
+
+        return _async_remove
+
+    @callback
+    def async_remove(self, coordinator: BarocastHACoordinator) -> None:
+        """Stop scheduling a station; removing it twice is harmless."""
+        entry_id = coordinator.config_entry.entry_id
+        self._stations.pop(entry_id, None)
+        self._due.pop(entry_id, None)
+        self._async_arm()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop every station and cancel the pending timer."""
+        self._stations.clear()
+        self._due.clear()
+        self._async_cancel()
+
+    @callback
+    def async_request(self, coordinator: BarocastHACoordinator, delay: float) -> None:
+        """Run a station within ``delay`` seconds; earlier requests win."""
+        entry_id = coordinator.config_entry.entry_id
+        if entry_id not in self._stations:
+            return
+        due = self.hass.loop.time() + delay
+        if due < self._due[entry_id]:
+            self._due[entry_id] = due
+            self._async_arm()
+
+    @staticmethod
+    def _next_periodic(coordinator: BarocastHACoordinator, after: float) -> float:
+        """Return the first multiple of the station interval after a loop time."""
+        interval = coordinator.refresh_interval.total_seconds()
+        return (floor(after / interval) + 1) * interval
+
+    @callback
+    def _async_arm(self) -> None:
+        """Point the timer at the earliest due station."""
+        if not self._due:
+            self._async_cancel()
+            return
+        next_due = min(self._due.values())
+        if self._timer_due is not None and self._timer_due <= next_due:
+            return
+        self._async_cancel()
+        self._timer_due = next_due
+        self._cancel_timer = async_call_later(
+            self.hass, max(0.0, next_due - self.hass.loop.time()), self._async_run_due
+        )
+
+    @callback
+    def _async_cancel(self) -> None:
+        """Cancel the pending timer."""
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+        self._cancel_timer = None
+        self._timer_due = None
+
+    @callback
+    def _async_run_due(self, _now: datetime) -> None:
+        """Recompute every due station with shared state reads."""
+        # Timers may fire marginally early: run what the timer was armed for.
+        now = max(self.hass.loop.time(), self._timer_due or 0.0)
+        self._cancel_timer = None
+        self._timer_due = None
+        horizon = now + SCHEDULER_BATCH_WINDOW_SECONDS
+        reader = StateReader(self.hass.states)
+        for entry_id, due in list(self._due.items()):
+            if due > horizon:
+                continue
+            coordinator = self._stations[entry_id]
+            self._due[entry_id] = self._next_periodic(coordinator, max(now, due))
+            coordinator.async_refresh_from_scheduler(reader)
+        self._async_arm()
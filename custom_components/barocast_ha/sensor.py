@@ -5,16 +5,42 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorEntityDescription
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfPressure, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfPressure, UnitOfTemperature, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import ATTRIBUTE_MODE_UNRECORDED, CONF_ATTRIBUTE_MODE, DEFAULT_ATTRIBUTE_MODE, DOMAIN
 from .coordinator import BarocastHACoordinator, BarocastHAData
+from .timings import STAGE_TOTAL
+
+# Detail attributes that only move with the wall clock ("now + 3h" labels).
+# They are refreshed whenever another value of the entity changes.
+CLOCK_ONLY_ATTRIBUTES = frozenset({"first_time", "second_time"})
+
+# Translated texts (and the lists embedding them), icons and time labels of
+# the legacy payload. Numeric values (p0, deltas, slope, the detail
+# "forecast" and "rain_prob" codes) stay recorded for history graphs.
+HEAVY_ATTRIBUTES = frozenset(
+    {
+        "wind_direction",
+        "forecast_short_term",
+        "forecast_zambretti",
+        "forecast_neg_zam",
+        "forecast_pressure_trend",
+        "forecast_temp_short",
+        "icons",
+        *CLOCK_ONLY_ATTRIBUTES,
+    }
+)
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -22,6 +48,7 @@ class BarocastSensorDescription(SensorEntityDescription):
     """Describes Barocast HA sensor entities."""
 
     data_key: str
+    horizon_hours: int | None = None
 
 
 SENSOR_DESCRIPTIONS: tuple[BarocastSensorDescription, ...] = (
@@ -73,6 +100,57 @@ SENSOR_DESCRIPTIONS: tuple[BarocastSensorDescription, ...] = (
     ),
 )
 
+# Only created when update timings are enabled in the options.
+UPDATE_TIME_DESCRIPTION = BarocastSensorDescription(
+    key="update_time",
+    name="Barocast forecast update time",
+    data_key="update_time",
+    device_class=SensorDeviceClass.DURATION,
+    native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+    state_class=SensorStateClass.MEASUREMENT,
+    entity_category=EntityCategory.DIAGNOSTIC,
+    entity_registry_enabled_default=False,
+    icon="mdi:timer-outline",
+)
+
+
+def _pressure_horizon_description(hours: int) -> BarocastSensorDescription:
+    """Describe the pressure change sensor of one configured horizon."""
+    return BarocastSensorDescription(
+        key=f"pressure_change_{hours}h",
+        name=f"Barocast forecast pressure change {hours}h",
+        data_key="pressure_change_horizon",
+        horizon_hours=hours,
+        native_unit_of_measurement=UnitOfPressure.HPA,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:chart-line",
+    )
+
+
+# Device class and unit of the extremes sensors, by tracked quantity.
+EXTREMES_QUANTITIES = {
+    "pressure": (SensorDeviceClass.ATMOSPHERIC_PRESSURE, UnitOfPressure.HPA),
+    "temperature": (SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS),
+}
+
+
+def _extremes_descriptions(windows: list[int]) -> tuple[BarocastSensorDescription, ...]:
+    """Describe the rolling min/max sensors of each window and the daily high/low."""
+    suffixes = [f"{kind}_{hours}h" for hours in windows for kind in ("min", "max")]
+    suffixes += ["daily_low", "daily_high"]
+    return tuple(
+        BarocastSensorDescription(
+            key=f"{quantity}_{suffix}",
+            name=f"Barocast forecast {quantity} {suffix.replace('_', ' ')}",
+            data_key="extreme",
+            device_class=device_class,
+            native_unit_of_measurement=unit,
+            state_class=SensorStateClass.MEASUREMENT,
+        )
+        for quantity, (device_class, unit) in EXTREMES_QUANTITIES.items()
+        for suffix in suffixes
+    )
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -81,10 +159,20 @@ async def async_setup_entry(
 ) -> None:
     """Set up Barocast HA sensors."""
     coordinator: BarocastHACoordinator = entry.runtime_data
+    attribute_mode = entry.options.get(
+        CONF_ATTRIBUTE_MODE, entry.data.get(CONF_ATTRIBUTE_MODE, DEFAULT_ATTRIBUTE_MODE)
+    )
+    sensor_class = BarocastUnrecordedSensor if attribute_mode == ATTRIBUTE_MODE_UNRECORDED else BarocastSensor
 
-    async_add_entities(
-        BarocastSensor(coordinator, entry, description) for description in SENSOR_DESCRIPTIONS
+    descriptions = SENSOR_DESCRIPTIONS + tuple(
+        _pressure_horizon_description(hours) for hours in coordinator.history.pressure_horizons
     )
+    if coordinator.extremes:
+        descriptions += _extremes_descriptions(coordinator.extremes_windows)
+    if coordinator.timings is not None:
+        descriptions = (*descriptions, UPDATE_TIME_DESCRIPTION)
+
+    async_add_entities(sensor_class(coordinator, entry, description) for description in descriptions)
 
 
 class BarocastSensor(CoordinatorEntity[BarocastHACoordinator], SensorEntity):
@@ -103,13 +191,32 @@ class BarocastSensor(CoordinatorEntity[BarocastHACoordinator], SensorEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._written_signature: tuple[Any, ...] | None = None
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, entry.entry_id)},
-            name="Barocast HA",
+            name=entry.title,
             manufacturer="Community",
             model="Zambretti/Negretti",
         )
 
+    def _state_signature(self) -> tuple[Any, ...]:
+        """Return the parts of the entity state that warrant a state write."""
+        attributes = self.extra_state_attributes
+        if attributes is not None:
+            attributes = {
+                key: value for key, value in attributes.items() if key not in CLOCK_ONLY_ATTRIBUTES
+            }
+        return (self.available, self.native_value, attributes)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the snapshot changed for this entity."""
+        signature = self._state_signature()
+        if signature == self._written_signature:
+            return
+        self._written_signature = signature
+        self.async_write_ha_state()
+
     @property
     def native_value(self) -> Any:
         """Return sensor state."""
@@ -131,6 +238,13 @@ class BarocastSensor(CoordinatorEntity[BarocastHACoordinator], SensorEntity):
             return data.pressure_change
         if self.entity_description.data_key == "temperature_change":
             return data.temperature_change
+        if self.entity_description.data_key == "pressure_change_horizon":
+            return data.pressure_changes.get(self.entity_description.horizon_hours)
+        if self.entity_description.data_key == "extreme":
+            extreme = data.extremes.get(self.entity_description.key)
+            return extreme[0] if extreme is not None else None
+        if self.entity_description.data_key == "update_time" and self.coordinator.timings is not None:
+            return self.coordinator.timings.last_total_ms
         return None
 
     @property
@@ -144,8 +258,20 @@ class BarocastSensor(CoordinatorEntity[BarocastHACoordinator], SensorEntity):
         # so existing Lovelace YAML cards keep working without migration.
         if self.entity_description.data_key == "main":
             return data.main_attributes
+        # Detail payloads are shared by every station: hand out copies.
         if self.entity_description.data_key == "zambretti_detail":
-            return data.zambretti_attributes
+            return dict(data.zambretti_attributes)
         if self.entity_description.data_key == "neg_zam_detail":
-            return data.neg_zam_attributes
+            return dict(data.neg_zam_attributes)
+        if self.entity_description.data_key == "extreme":
+            extreme = data.extremes.get(self.entity_description.key)
+            return {"time": extreme[1]} if extreme is not None else None
+        if self.entity_description.data_key == "update_time" and self.coordinator.timings is not None:
+            return self.coordinator.timings.stage_summary(STAGE_TOTAL)
         return None
+
+
+class BarocastUnrecordedSensor(BarocastSensor):
+    """Barocast HA sensor whose heavy attributes are excluded from the recorder."""
+
+    _unrecorded_attributes = HEAVY_ATTRIBUTES
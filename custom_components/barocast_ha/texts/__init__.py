@@ -0,0 +1,45 @@
+"""Per-language forecast text bundles for Barocast HA.
+
+Each language lives in its own module (named after its language code) and
+is only imported when a station uses it. Adding a language means adding a
+module here and its code to ``LANGUAGE_CODES``.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import NamedTuple
+
+from ..const import DEFAULT_LANGUAGE, LANGUAGE_INDEX
+
+
+class TextBundle(NamedTuple):
+    """Forecast texts of one language, indexed by engine codes."""
+
+    # Indexed by the condition code of ``short_term_codes``.
+    short_conditions: tuple[str, ...]
+    # Indexed by the pressure system code of ``short_term_codes``.
+    pressure_systems: tuple[str, ...]
+    # Indexed by Zambretti type / Negretti number (0..25).
+    forecasts: tuple[str, ...]
+    # Prefix of Negretti forecasts outside the barometer range.
+    exceptional: str
+    # Falling, rising, steady (legacy trend codes "0", "1", "2").
+    trends: tuple[str, ...]
+
+
+_bundles: dict[str, TextBundle] = {}
+
+
+def get_text_bundle(language_code: str) -> TextBundle:
+    """Return the texts of a language, falling back to the default language.
+
+    The first call for a language imports its module; call it from an
+    executor thread before using the bundle from the event loop.
+    """
+    if language_code not in LANGUAGE_INDEX:
+        language_code = DEFAULT_LANGUAGE
+    bundle = _bundles.get(language_code)
+    if bundle is None:
+        bundle = _bundles[language_code] = importlib.import_module(f"{__name__}.{language_code}").BUNDLE
+    return bundle
@@ -0,0 +1,54 @@
+"""German forecast texts."""
+
+from __future__ import annotations
+
+from . import TextBundle
+
+BUNDLE = TextBundle(
+    short_conditions=(
+        "stürmisch",
+        "regnerisch",
+        "wechselhaft",
+        "sonnig",
+        "sehr trocken",
+    ),
+    pressure_systems=(
+        "Tiefdruckgebiet",
+        "Normal",
+        "Hochdruckgebiet",
+    ),
+    forecasts=(
+        "Beständiges Schönwetter!",
+        "Schönes Wetter!",
+        "Es wird schöner.",
+        "Schön, wird wechselhaft.",
+        "Schön, Regenschauer möglich.",
+        "Heiter bis wolkig, Besserung zu erwarten.",
+        "Heiter bis wolkig, anfangs evtl. Schauer.",
+        "Heiter bis wolkig, später Regen.",
+        "Anfangs noch Schauer, dann Besserung.",
+        "Wechselhaft mit Schauern",
+        "Heiter bis wolkig, vereinzelt Regen.",
+        "Unbeständig, später Aufklarung.",
+        "Unbeständig, evtl. Besserung.",
+        "Regnerisch mit heiteren Phasen.",
+        "Regnerisch, wird unbeständiger.",
+        "Wechselhaft mit etwas Regen.",
+        "Unbeständig mit heiteren Phasen.",
+        "Unbeständig, später Regen.",
+        "Unbeständig mit etwas Regen.",
+        "Wechselhaft und regnerisch",
+        "Gelegentlich Regen, Verschlechterung.",
+        "Zuweilen Regen, sehr unbeständig.",
+        "Häufiger Regen.",
+        "Regen, sehr unbeständig.",
+        "Stürmisch, evtl. Besserung.",
+        "Stürmisch mit viel Regen.",
+    ),
+    exceptional="außergewöhnliches Wetter,",
+    trends=(
+        "fallend",
+        "steigend",
+        "stabil",
+    ),
+)
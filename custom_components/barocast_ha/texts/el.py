@@ -0,0 +1,54 @@
+"""Greek forecast texts."""
+
+from __future__ import annotations
+
+from . import TextBundle
+
+BUNDLE = TextBundle(
+    short_conditions=(
+        "θυελλώδης",
+        "Βροχερός",
+        "Μεταβλητός",
+        "Ηλιόλουστος",
+        "Πολύ ξηρός",
+    ),
+    pressure_systems=(
+        "σύστημα χαμηλής πίεσης",
+        "φυσιολογικός",
+        "σύστημα υψηλής πίεσης",
+    ),
+    forecasts=(
+        "Σταθερός καλός καιρός!",
+        "Ωραίος καιρός!",
+        "Θα καλυτερεύσει.",
+        "Μεταβλητός.",
+        "Πιθανή βροχή.",
+        "Αίθριος έως νεφελώδης, αναμένεται βελτίωση.",
+        "Αίθριος έως συννεφιασμένος, πιθανώς βροχές στην αρχή.",
+        "Αίθριος έως συννεφιασμένος, αργότερα βροχή.",
+        "Βροχόπτωση στην αρχή και μετά βελτίωση.",
+        "Εναλλαγή με βροχόπτωση.",
+        "Αίθριος έως συννεφιασμένος, κατά διαστήματα βροχή.",
+        "Ασταθής, αργότερα καθάρος.",
+        "Ασταθής, πιθανώς βελτίωση.",
+        "Καθαρός με διαστήματα βροχής.",
+        "Βροχερό, όλο και πιο ασταθές.",
+        "Αλλάζει με λίγη βροχή.",
+        "Άστατα, μικρά καθαρά διαστήματα",
+        "Άστατη, αργότερα βροχή.",
+        "Άστατος με λίγη βροχή.",
+        "Μεταβλητός και βροχερός.",
+        "Περιστασιακές βροχές, επιδείνωση.",
+        "Βροχή κατά περιόδους, πολύ ασταθής.",
+        "Συχνή βροχή.",
+        "Βροχή, πολύ ασταθής.",
+        "Θυελλώδης, πιθανώς βελτίωση.",
+        "Καταιγίδα με πολλές βροχές.",
+    ),
+    exceptional="Εξαιρετικός καιρός,",
+    trends=(
+        "πέφτοντας",
+        "αυξανόμενη",
+        "σταθερή",
+    ),
+)
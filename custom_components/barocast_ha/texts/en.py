@@ -0,0 +1,54 @@
+"""English forecast texts."""
+
+from __future__ import annotations
+
+from . import TextBundle
+
+BUNDLE = TextBundle(
+    short_conditions=(
+        "Stormy",
+        "Rainy",
+        "Mixed",
+        "Sunny",
+        "Extra Dry",
+    ),
+    pressure_systems=(
+        "Low Pressure System",
+        "Normal",
+        "High Pressure System",
+    ),
+    forecasts=(
+        "Settled Fine",
+        "Fine",
+        "Becoming Fine",
+        "Fine, Becoming Less Settled",
+        "Fine, Possibly Showers",
+        "Fairly Fine, Improving",
+        "Fairly Fine, Possibly Showers, Early",
+        "Fairly Fine, Showery Later",
+        "Showery Early, Improving",
+        "Changeable, Mending",
+        "Fairly Fine, Showers Likely",
+        "Rather Unsettled, Clearing Later",
+        "Unsettled, Probably Improving",
+        "Showery, Bright Intervals",
+        "Showery, Becoming More Unsettled",
+        "Changeable, Some Rain",
+        "Unsettled, Short Fine Intervals",
+        "Unsettled, Rain Later",
+        "Unsettled, Rain At Times",
+        "Very Unsettled, Finer At Times",
+        "Rain At Times, Worse Later",
+        "Rain At Times, Becoming Very Unsettled",
+        "Rain At Frequent Intervals",
+        "Very Unsettled, Rain",
+        "Stormy, Possibly Improving",
+        "Stormy, Much Rain",
+    ),
+    exceptional="Exceptional Weather,",
+    trends=(
+        "Falling",
+        "Rising",
+        "Steady",
+    ),
+)
@@ -0,0 +1,54 @@
+"""French forecast texts."""
+
+from __future__ import annotations
+
+from . import TextBundle
+
+BUNDLE = TextBundle(
+    short_conditions=(
+        "Orageux",
+        "Pluvieux",
+        "Variable",
+        "Ensoleillé",
+        "Très Sec",
+    ),
+    pressure_systems=(
+        "Système de basse pression",
+        "Normal",
+        "Système de haute pression",
+    ),
+    forecasts=(
+        "Beau temps stable!",
+        "Beau temps!",
+        "Le temps s'améliore.",
+        "Beau, devient instable.",
+        "Beau, averses possibles.",
+        "Éclaircies avec nuages, amélioration attendue.",
+        "Éclaircies avec nuages, averses possibles au début.",
+        "Éclaircies avec nuages, pluie plus tard.",
+        "Averses au début, puis amélioration.",
+        "Variable avec averses.",
+        "Éclaircies avec nuages, averses probables.",
+        "Instable, éclaircies plus tard.",
+        "Instable, amélioration possible.",
+        "Pluvieux avec éclaircies.",
+        "Pluvieux, devient plus instable.",
+        "Variable avec un peu de pluie.",
+        "Instable avec courtes éclaircies.",
+        "Instable, pluie plus tard.",
+        "Instable avec quelques pluies.",
+        "Variable et pluvieux.",
+        "Pluie occasionnelle, dégradation ensuite.",
+        "Pluie par moments, devient très instable.",
+        "Pluie fréquente.",
+        "Très instable, pluie.",
+        "Orageux, amélioration possible.",
+        "Orageux avec beaucoup de pluie.",
+    ),
+    exceptional="Temps exceptionnel,",
+    trends=(
+        "en baisse",
+        "en hausse",
+        "stable",
+    ),
+)
@@ -0,0 +1,54 @@
+"""Italian forecast texts."""
+
+from __future__ import annotations
+
+from . import TextBundle
+
+BUNDLE = TextBundle(
+    short_conditions=(
+        "Tempestoso",
+        "Piovoso",
+        "Variabile",
+        "Soleggiato",
+        "Molto Secco",
+    ),
+    pressure_systems=(
+        "Bassa Pressione",
+        "Normale",
+        "Zona Alta Pressione",
+    ),
+    forecasts=(
+        "Bel tempo stabile!",
+        "Bel tempo!",
+        "Miglioramento in corso.",
+        "Bello, ma diventa instabile.",
+        "Bello, possibili rovesci.",
+        "Sereno con nuvole, miglioramento atteso.",
+        "Sereno con nuvole, possibili rovesci all'inizio.",
+        "Sereno con nuvole, pioggia in arrivo.",
+        "Rovesci iniziali, poi miglioramento.",
+        "Variabile con rovesci.",
+        "Sereno con nuvole, pioggia probabile.",
+        "Instabile, schiarite più tardi.",
+        "Instabile, probabile miglioramento.",
+        "Rovesci con schiarite.",
+        "Rovesci, sempre più instabile.",
+        "Variabile con qualche pioggia.",
+        "Instabile con brevi schiarite.",
+        "Instabile, pioggia più tardi.",
+        "Instabile con qualche pioggia.",
+        "Variabile e piovoso.",
+        "Pioggia occasionale, peggiora più tardi.",
+        "Pioggia a tratti, molto instabile.",
+        "Pioggia frequente.",
+        "Molto instabile, pioggia.",
+        "Tempestoso, possibile miglioramento.",
+        "Tempestoso con molta pioggia.",
+    ),
+    exceptional="Tempo eccezionale,",
+    trends=(
+        "in calo",
+        "in aumento",
+        "stabile",
+    ),
+)
@@ -0,0 +1,84 @@
+"""Per-stage timing of Barocast HA forecast updates."""
+
+from __future__ import annotations
+
+from collections import deque
+from time import perf_counter_ns
+from typing import Any
+
+from .const import UPDATE_TIMINGS_WINDOW
+
+STAGE_STATE_READS = "state_reads"
+STAGE_SEA_LEVEL = "sea_level"
+STAGE_HISTORY = "history"
+STAGE_SLOPE = "slope"
+STAGE_FORECAST = "forecast"
+STAGE_DETAILS = "details"
+STAGE_TOTAL = "total"
+
+UPDATE_STAGES = (
+    STAGE_STATE_READS,
+    STAGE_SEA_LEVEL,
+    STAGE_HISTORY,
+    STAGE_SLOPE,
+    STAGE_FORECAST,
+    STAGE_DETAILS,
+    STAGE_TOTAL,
+)
+
+PERCENTILES = (50, 90, 99)
+
+
+class UpdateTimings:
+    """Rolling per-stage durations of the most recent updates.
+
+    ``start`` opens an update, each ``mark`` closes the stage running since
+    the previous call and ``finish`` records the whole update. Durations are
+    kept in nanoseconds in bounded deques; percentiles are only computed when
+    a summary is requested.
+    """
+
+    __slots__ = ("_samples", "_started", "_last")
+
+    def __init__(self, window: int = UPDATE_TIMINGS_WINDOW) -> None:
+        """Initialize empty windows."""
+        self._samples: dict[str, deque[int]] = {stage: deque(maxlen=window) for stage in UPDATE_STAGES}
+        self._started = 0
+        self._last = 0
+
+    def start(self) -> None:
+        """Start timing an update."""
+        self._started = self._last = perf_counter_ns()
+
+    def mark(self, stage: str) -> None:
+        """Record the stage that ran since the previous mark."""
+        now = perf_counter_ns()
+        self._samples[stage].append(now - self._last)
+        self._last = now
+
+    def finish(self) -> None:
+        """Record the duration of the whole update."""
+        self._samples[STAGE_TOTAL].append(perf_counter_ns() - self._started)
+
+    @property
+    def last_total_ms(self) -> float | None:
+        """Return the duration of the last complete update in milliseconds."""
+        totals = self._samples[STAGE_TOTAL]
+        return round(totals[-1] / 1e6, 3) if totals else None
+
+    def stage_summary(self, stage: str) -> dict[str, Any]:
+        """Return sample count, percentiles and maximum of one stage (ms)."""
+        samples = sorted(self._samples[stage])
+        summary: dict[str, Any] = {"samples": len(samples)}
+        if not samples:
+            return summary
+        for percentile in PERCENTILES:
+            # Nearest-rank percentile.
+            rank = max(0, -(-percentile * len(samples) // 100) - 1)
+            summary[f"p{percentile}_ms"] = round(samples[rank] / 1e6, 3)
+        summary["max_ms"] = round(samples[-1] / 1e6, 3)
+        return summary
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Return the summary of every stage."""
+        return {stage: self.stage_summary(stage) for stage in UPDATE_STAGES}
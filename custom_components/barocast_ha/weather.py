@@ -0,0 +1,192 @@
+"""Weather platform for Barocast HA integration."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.components.weather import (
+    ATTR_CONDITION_CLEAR_NIGHT,
+    ATTR_CONDITION_CLOUDY,
+    ATTR_CONDITION_LIGHTNING_RAINY,
+    ATTR_CONDITION_PARTLYCLOUDY,
+    ATTR_CONDITION_POURING,
+    ATTR_CONDITION_RAINY,
+    ATTR_CONDITION_SUNNY,
+    Forecast,
+    SingleCoordinatorWeatherEntity,
+    WeatherEntityFeature,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfPressure, UnitOfSpeed, UnitOfTemperature
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.sun import is_up
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, WEATHER_FORECAST_HOURS, WEATHER_TEMPERATURE_HORIZON_HOURS
+from .coordinator import BarocastHACoordinator, BarocastHAData
+from .forecast_engine import short_temperature_forecast
+
+# Weather conditions of the detail buckets (see ICON_CONDITIONS), by day.
+CONDITION_BY_BUCKET = (
+    ATTR_CONDITION_SUNNY,
+    ATTR_CONDITION_PARTLYCLOUDY,
+    ATTR_CONDITION_RAINY,
+    ATTR_CONDITION_CLOUDY,
+    ATTR_CONDITION_RAINY,
+    ATTR_CONDITION_POURING,
+    ATTR_CONDITION_LIGHTNING_RAINY,
+)
+
+# The detail windows are centred on +3h and +9h; hours from this offset on
+# use the second window.
+SECOND_WINDOW_FROM_HOURS = 6
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Barocast HA weather entity."""
+    async_add_entities([BarocastWeather(entry.runtime_data, entry)])
+
+
+def _condition(bucket: int, is_night: bool) -> str:
+    """Return the weather condition of a detail bucket."""
+    if bucket == 0 and is_night:
+        return ATTR_CONDITION_CLEAR_NIGHT
+    return CONDITION_BY_BUCKET[bucket]
+
+
+class BarocastWeather(SingleCoordinatorWeatherEntity[BarocastHACoordinator]):
+    """Current conditions and 0-12 h hourly forecast of a station.
+
+    Conditions come from the Zambretti detail windows and precipitation
+    probabilities average both models. The hourly list is only built when a
+    forecast subscriber asks for it and is reused until the next snapshot.
+    """
+
+    _attr_has_entity_name = True
+    _attr_name = None
+    _attr_supported_features = WeatherEntityFeature.FORECAST_HOURLY
+    _attr_native_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_native_pressure_unit = UnitOfPressure.HPA
+    _attr_native_wind_speed_unit = UnitOfSpeed.KILOMETERS_PER_HOUR
+
+    def __init__(self, coordinator: BarocastHACoordinator, entry: ConfigEntry) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{entry.entry_id}_weather"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.title,
+            manufacturer="Community",
+            model="Zambretti/Negretti",
+        )
+        self._written_signature: tuple[Any, ...] | None = None
+        self._hourly_source: BarocastHAData | None = None
+        self._hourly: list[Forecast] | None = None
+
+    def _state_signature(self) -> tuple[Any, ...]:
+        """Return the parts of the entity state that warrant a state write."""
+        return (
+            self.available,
+            self.condition,
+            self.native_temperature,
+            self.native_pressure,
+            self.native_wind_speed,
+            self.wind_bearing,
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state when it changed and push forecasts to subscribers."""
+        signature = self._state_signature()
+        if signature != self._written_signature:
+            self._written_signature = signature
+            self.async_write_ha_state()
+        # Only computes forecasts for forecast types that have subscribers.
+        # A background task: forecast pushes must not hold up entry setup or unload.
+        self.coordinator.config_entry.async_create_background_task(
+            self.hass,
+            self.async_update_listeners(None),
+            f"{DOMAIN} {self.coordinator.config_entry.entry_id} forecast update",
+        )
+
+    @property
+    def condition(self) -> str | None:
+        """Return the current condition."""
+        data = self.coordinator.data
+        if data is None:
+            return None
+        return _condition(data.zambretti_attributes["forecast"][0], data.is_night)
+
+    @property
+    def native_temperature(self) -> float | None:
+        """Return the temperature."""
+        data = self.coordinator.data
+        return data.temperature if data is not None else None
+
+    @property
+    def native_pressure(self) -> float | None:
+        """Return the sea-level pressure."""
+        data = self.coordinator.data
+        return data.pressure if data is not None else None
+
+    @property
+    def native_wind_speed(self) -> float | None:
+        """Return the wind speed."""
+        data = self.coordinator.data
+        return data.wind_speed if data is not None else None
+
+    @property
+    def wind_bearing(self) -> float | None:
+        """Return the wind bearing."""
+        data = self.coordinator.data
+        return data.wind_bearing if data is not None else None
+
+    @callback
+    def _async_forecast_hourly(self) -> list[Forecast] | None:
+        """Return the hourly forecast, built once per snapshot."""
+        data = self.coordinator.data
+        if data is None:
+            return None
+        if data is not self._hourly_source:
+            self._hourly = self._build_hourly(data)
+            self._hourly_source = data
+        return self._hourly
+
+    def _build_hourly(self, data: BarocastHAData) -> list[Forecast]:
+        """Spread the two detail windows and the temperature trend over hours."""
+        buckets = data.zambretti_attributes["forecast"]
+        rain = [
+            round((zambretti + neg_zam) / 2)
+            for zambretti, neg_zam in zip(
+                data.zambretti_attributes["rain_prob"], data.neg_zam_attributes["rain_prob"]
+            )
+        ]
+        start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+
+        forecast: list[Forecast] = []
+        for hour in range(WEATHER_FORECAST_HOURS + 1):
+            when = start + timedelta(hours=hour)
+            window = 0 if hour < SECOND_WINDOW_FROM_HOURS else 1
+            is_night = data.is_night if hour == 0 else not is_up(self.hass, when)
+            temperature: Any = data.temperature if hour == 0 else None
+            if hour and data.temperature is not None and hour <= WEATHER_TEMPERATURE_HORIZON_HOURS:
+                temperature, _ = short_temperature_forecast(
+                    data.temperature, data.temperature_change, hour * 60, 0, data.temperature_slope
+                )
+            forecast.append(
+                Forecast(
+                    datetime=when.isoformat(),
+                    condition=_condition(buckets[window], is_night),
+                    precipitation_probability=rain[window],
+                    native_temperature=temperature,
+                    is_daytime=not is_night,
+                )
+            )
+        return forecast
@@ -0,0 +1,28 @@
+"""Import Barocast HA engine modules without Home Assistant.
+
+The integration package ``__init__`` imports Home Assistant. Offline tools only
+need the pure-Python modules (engine, histories, estimators), so they are
+loaded through a bare package object that skips ``__init__``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.machinery
+from pathlib import Path
+import sys
+import types
+from typing import Any
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "barocast_ha"
+PACKAGE_NAME = "barocast_ha_offline"
+
+
+def load(module: str) -> Any:
+    """Import ``module`` from the integration package without Home Assistant."""
+    if PACKAGE_NAME not in sys.modules:
+        package = types.ModuleType(PACKAGE_NAME)
+        package.__path__ = [str(PACKAGE_DIR)]
+        package.__spec__ = importlib.machinery.ModuleSpec(PACKAGE_NAME, None, is_package=True)
+        sys.modules[PACKAGE_NAME] = package
+    return importlib.import_module(f"{PACKAGE_NAME}.{module}")
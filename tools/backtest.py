@@ -0,0 +1,485 @@
+"""Replay exported sensor history through the Barocast forecast pipeline.
+
+Input files are read row by row (CSV or JSONL, by extension) and replayed the
+way the coordinator runs: at every tick the latest source values are reduced
+to sea level, pushed through the rolling windows (``StationHistory``) and both
+forecast models. One forecast row is written per tick. When the input has
+rain observations, the rain probabilities of both models are scored against
+rain observed during the following hours.
+
+Two layouts are accepted:
+- wide: ``timestamp`` plus ``pressure``, ``temperature``, ``wind_speed``,
+  ``wind_direction`` and ``rain`` columns (missing columns are fine);
+- long, as exported from the recorder/history: ``entity_id``, ``state`` and
+  ``last_changed``; entities are mapped to fields with ``--pressure-entity``,
+  ``--temperature-entity``, etc.
+
+Rows must be sorted by time (sort long exports on ``last_changed`` first).
+Naive timestamps are read in ``--timezone``; a rain value above 0 means rain.
+
+Usage:
+  python tools/backtest.py station.csv [other.jsonl ...] [--output-dir DIR]
+      [--jobs N] [--interval 300] [--trend-threshold 1.6] [--kalman-trend]
+      [--rain-horizon 12]
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+import csv
+from dataclasses import dataclass, field
+from datetime import datetime, tzinfo
+import json
+from pathlib import Path
+import sys
+from typing import Any, TextIO
+from zoneinfo import ZoneInfo
+
+from _offline import load
+
+const = load("const")
+engine = load("forecast_engine")
+history = load("history")
+texts = load("texts")
+
+FIELDS = ("pressure", "temperature", "wind_speed", "wind_direction", "rain")
+TIME_COLUMNS = ("timestamp", "time", "last_changed", "last_updated")
+OUTPUT_COLUMNS = (
+    "timestamp",
+    "p0",
+    "pressure_change_3h",
+    "pressure_tendency",
+    "pressure_coverage",
+    "temperature",
+    "temperature_change_1h",
+    "temperature_trend_slope_1h",
+    "zambretti_type",
+    "zambretti_letter",
+    "zambretti_rain_prob",
+    "neg_zam_number",
+    "neg_zam_letter",
+    "neg_zam_rain_prob",
+    "zambretti_text",
+    "neg_zam_text",
+)
+MODELS = ("zambretti", "neg_zam")
+# Positions of the scored rain probabilities in a forecast row.
+RAIN_PROB_COLUMNS = tuple(OUTPUT_COLUMNS.index(f"{model}_rain_prob") for model in MODELS)
+
+
+@dataclass(frozen=True)
+class ReplayOptions:
+    """Station settings and replay parameters (picklable for worker processes)."""
+
+    interval: float = float(const.DEFAULT_UPDATE_INTERVAL_SECONDS)
+    pressure_is_sea_level: bool = const.DEFAULT_PRESSURE_IS_SEA_LEVEL
+    altitude: float = const.DEFAULT_ALTITUDE
+    is_northern_hemisphere: bool = True
+    language: str = const.DEFAULT_LANGUAGE
+    timezone: str = "UTC"
+    rain_horizon_hours: float = 12.0
+    trend_threshold: float = const.PRESSURE_TREND_THRESHOLD
+    kalman_trend: bool = const.DEFAULT_KALMAN_TREND
+    entity_fields: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class ScoreCard:
+    """Brier score and 50% contingency table of one model."""
+
+    count: int = 0
+    brier_sum: float = 0.0
+    hits: int = 0
+    misses: int = 0
+    false_alarms: int = 0
+    correct_negatives: int = 0
+
+    def add(self, probability: float, rained: bool) -> None:
+        """Score one forecast."""
+        self.count += 1
+        self.brier_sum += (probability - rained) ** 2
+        if probability >= 0.5:
+            if rained:
+                self.hits += 1
+            else:
+                self.false_alarms += 1
+        elif rained:
+            self.misses += 1
+        else:
+            self.correct_negatives += 1
+
+    def merge(self, other: ScoreCard) -> None:
+        """Add the counts of another card."""
+        self.count += other.count
+        self.brier_sum += other.brier_sum
+        self.hits += other.hits
+        self.misses += other.misses
+        self.false_alarms += other.false_alarms
+        self.correct_negatives += other.correct_negatives
+
+    def describe(self) -> str:
+        """Return a one-line summary."""
+        if not self.count:
+            return "no scored forecasts"
+        accuracy = (self.hits + self.correct_negatives) / self.count
+        detected = self.hits + self.misses
+        alarms = self.hits + self.false_alarms
+        pod = f"{self.hits / detected:.3f}" if detected else "n/a"
+        far = f"{self.false_alarms / alarms:.3f}" if alarms else "n/a"
+        return (
+            f"n={self.count} brier={self.brier_sum / self.count:.4f} accuracy={accuracy:.3f} "
+            f"pod={pod} far={far}"
+        )
+
+
+class RainScorer:
+    """Score forecasts against rain observed within the following horizon.
+
+    Forecasts wait in issue order until their horizon has been fully
+    observed; rain timestamps older than the oldest pending forecast are
+    dropped, so memory stays bounded by the horizon.
+    """
+
+    def __init__(self, horizon_seconds: float) -> None:
+        """Initialize the scorer."""
+        self.horizon = horizon_seconds
+        self.has_rain_data = False
+        self.cards = {model: ScoreCard() for model in MODELS}
+        self._pending: deque[tuple[float, tuple[float, ...]]] = deque()
+        self._rain: deque[float] = deque()
+
+    def observe(self, timestamp: float, value: float | None) -> None:
+        """Record a rain observation."""
+        if value is None:
+            return
+        self.has_rain_data = True
+        if value > 0:
+            self._rain.append(timestamp)
+
+    def issue(self, timestamp: float, probabilities: tuple[float, ...]) -> None:
+        """Queue a forecast issued at timestamp."""
+        if self.horizon > 0:
+            self._pending.append((timestamp, probabilities))
+
+    def settle(self, observed_until: float) -> None:
+        """Score forecasts whose horizon ends before observed_until."""
+        pending, rain = self._pending, self._rain
+        while pending and pending[0][0] + self.horizon <= observed_until:
+            issued, probabilities = pending.popleft()
+            while rain and rain[0] <= issued:
+                rain.popleft()
+            if not self.has_rain_data:
+                continue
+            rained = bool(rain) and rain[0] <= issued + self.horizon
+            for model, probability in zip(MODELS, probabilities):
+                self.cards[model].add(probability, rained)
+
+
+@dataclass
+class ReplaySummary:
+    """Result of one replayed file."""
+
+    name: str
+    rows: int = 0
+    ticks: int = 0
+    skipped_ticks: int = 0
+    cards: dict[str, ScoreCard] = field(default_factory=lambda: {model: ScoreCard() for model in MODELS})
+
+
+class StationReplay:
+    """Coordinator update logic driven by recorded values instead of live states."""
+
+    def __init__(self, options: ReplayOptions, tz: tzinfo) -> None:
+        """Initialize an empty station."""
+        self.options = options
+        self.tz = tz
+        self.texts = texts.get_text_bundle(options.language)
+        self.history = history.StationHistory(
+            kalman_trend=options.kalman_trend,
+            max_gap_seconds=max(const.HISTORY_MAX_GAP.total_seconds(), 2 * options.interval),
+        )
+        self.latest: dict[str, float | None] = {}
+
+    def tick(self, timestamp: float) -> tuple[Any, ...] | None:
+        """Compute one forecast row, or None when pressure is unavailable."""
+        pressure_raw = self.latest.get("pressure")
+        if pressure_raw is None:
+            return None
+        temperature = self.latest.get("temperature")
+        wind_speed = self.latest.get("wind_speed")
+        wind_direction = self.latest.get("wind_direction")
+        wind_speed = 0.0 if wind_speed is None else wind_speed
+        wind_direction = 0.0 if wind_direction is None else wind_direction
+        correction_temperature = (
+            temperature if temperature is not None else const.TEMPERATURE_STANDARD_ATMOSPHERE_C
+        )
+
+        options = self.options
+        p0 = (
+            pressure_raw
+            if options.pressure_is_sea_level
+            else engine.pressure_to_sea_level(pressure_raw, correction_temperature, options.altitude)
+        )
+        trends = self.history.update(timestamp, p0, temperature)
+        pressure_change, temperature_change, temperature_slope = trends[:3]
+        half_changes = self.history.pressure_half_changes(timestamp)
+        pressure_tendency = engine.pressure_tendency_code(*half_changes) if half_changes is not None else None
+
+        now = datetime.fromtimestamp(timestamp, self.tz)
+        forecast = engine.compute_all(
+            engine.ForecastInputs(p0, pressure_change, wind_direction, wind_speed, options.is_northern_hemisphere, now),
+            self.texts,
+            options.trend_threshold,
+        )
+        zambretti_type = forecast.zambretti_type
+        neg_zam_number = forecast.neg_zam_number
+        zambretti_rain = max(engine.zambretti_detail(zambretti_type, False, now)["rain_prob"])
+        neg_zam_rain = max(engine.neg_zam_detail(neg_zam_number, False, now)["rain_prob"])
+
+        return (
+            now.isoformat(),
+            round(p0, 1),
+            round(pressure_change, 2),
+            pressure_tendency,
+            trends.pressure_coverage,
+            round(temperature, 1) if temperature is not None else "",
+            round(temperature_change, 2) if temperature_change is not None else "",
+            round(temperature_slope, 2) if temperature_slope is not None else "",
+            zambretti_type,
+            forecast.zambretti_letter,
+            zambretti_rain,
+            neg_zam_number,
+            forecast.neg_zam_letter,
+            neg_zam_rain,
+            forecast.zambretti_text,
+            forecast.neg_zam_text,
+        )
+
+
+def _parse_value(raw: Any) -> float | None:
+    """Return a float reading, None for unknown/unavailable values."""
+    if raw is None or raw == "":
+        return None
+    try:
+        value = float(raw)
+    except (TypeError, ValueError):
+        return None
+    return value if value == value else None
+
+
+def _parse_timestamp(raw: Any, tz: tzinfo) -> float | None:
+    """Return epoch seconds from an epoch number or an ISO 8601 string."""
+    if isinstance(raw, (int, float)):
+        return float(raw)
+    if not isinstance(raw, str) or not raw:
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        pass
+    try:
+        moment = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=tz)
+    return moment.timestamp()
+
+
+def iter_rows(path: Path, handle: TextIO) -> Iterator[dict[str, Any]]:
+    """Yield rows of a CSV or JSONL file one at a time."""
+    if path.suffix.lower() in (".jsonl", ".ndjson", ".json"):
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+        return
+    yield from csv.DictReader(handle)
+
+
+def iter_updates(
+    rows: Iterable[dict[str, Any]],
+    options: ReplayOptions,
+    tz: tzinfo,
+) -> Iterator[tuple[float, dict[str, float | None]]]:
+    """Yield (timestamp, field updates) from wide or long rows, in time order."""
+    last_timestamp = float("-inf")
+    for line_number, row in enumerate(rows, start=1):
+        raw_time = next((row[column] for column in TIME_COLUMNS if row.get(column) not in (None, "")), None)
+        timestamp = _parse_timestamp(raw_time, tz)
+        if timestamp is None:
+            continue
+        if timestamp < last_timestamp:
+            raise ValueError(f"row {line_number} is older than the previous row; sort the input by time")
+        last_timestamp = timestamp
+
+        if "entity_id" in row:
+            field_name = options.entity_fields.get(row["entity_id"])
+            if field_name is None:
+                continue
+            yield timestamp, {field_name: _parse_value(row.get("state"))}
+        else:
+            yield timestamp, {name: _parse_value(row[name]) for name in FIELDS if name in row}
+
+
+def replay(
+    updates: Iterable[tuple[float, dict[str, float | None]]],
+    options: ReplayOptions,
+    tz: tzinfo,
+    writer: Any | None,
+    summary: ReplaySummary,
+) -> None:
+    """Run the station over updates, writing forecast rows and scoring them."""
+    station = StationReplay(options, tz)
+    scorer = RainScorer(options.rain_horizon_hours * 3600)
+    interval = options.interval
+    next_tick: float | None = None
+    last_timestamp: float | None = None
+
+    def _tick(timestamp: float) -> None:
+        summary.ticks += 1
+        row = station.tick(timestamp)
+        if row is None:
+            summary.skipped_ticks += 1
+            return
+        if writer is not None:
+            writer.writerow(row)
+        scorer.issue(timestamp, tuple(row[column] / 100 for column in RAIN_PROB_COLUMNS))
+
+    for timestamp, values in updates:
+        summary.rows += 1
+        if interval > 0:
+            # Ticks see every value recorded up to and including their time.
+            if next_tick is None:
+                next_tick = (timestamp // interval + 1) * interval
+            while next_tick < timestamp:
+                _tick(next_tick)
+                next_tick += interval
+        station.latest.update(values)
+        if "rain" in values:
+            scorer.observe(timestamp, values["rain"])
+        scorer.settle(timestamp)
+        if interval <= 0 and timestamp != last_timestamp:
+            _tick(timestamp)
+        last_timestamp = timestamp
+
+    if interval > 0 and next_tick is not None and last_timestamp is not None and next_tick == last_timestamp:
+        _tick(next_tick)
+    if last_timestamp is not None:
+        # Forecasts whose horizon runs past the end of the data stay unscored.
+        scorer.settle(last_timestamp)
+    summary.cards = scorer.cards
+
+
+def backtest_file(path: str, options: ReplayOptions, output_dir: str | None) -> ReplaySummary:
+    """Replay one file; forecast rows go to output_dir or stdout."""
+    source = Path(path)
+    tz = ZoneInfo(options.timezone)
+    summary = ReplaySummary(name=source.name)
+    with source.open(newline="", encoding="utf-8") as handle:
+        updates = iter_updates(iter_rows(source, handle), options, tz)
+        if output_dir is None:
+            writer = csv.writer(sys.stdout)
+            writer.writerow(OUTPUT_COLUMNS)
+            replay(updates, options, tz, writer, summary)
+            return summary
+        target = Path(output_dir) / f"{source.stem}.forecast.csv"
+        with target.open("w", newline="", encoding="utf-8") as output:
+            writer = csv.writer(output)
+            writer.writerow(OUTPUT_COLUMNS)
+            replay(updates, options, tz, writer, summary)
+    return summary
+
+
+def main() -> int:
+    """Parse arguments, run every file and print scores to stderr."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("inputs", nargs="+", help="CSV or JSONL files, one station per file")
+    parser.add_argument("--output-dir", help="write <input>.forecast.csv files here instead of stdout")
+    parser.add_argument("--jobs", type=int, default=1, help="worker processes for several files")
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=ReplayOptions.interval,
+        help="seconds between ticks; 0 recomputes on every row",
+    )
+    parser.add_argument(
+        "--trend-threshold",
+        type=float,
+        default=ReplayOptions.trend_threshold,
+        help="3h pressure change counted as rising or falling (hPa)",
+    )
+    parser.add_argument(
+        "--kalman-trend",
+        action="store_true",
+        help="derive the 3h pressure change from the Kalman trend estimator",
+    )
+    parser.add_argument(
+        "--rain-horizon",
+        type=float,
+        default=ReplayOptions.rain_horizon_hours,
+        help="hours after a forecast in which observed rain counts; 0 disables scoring",
+    )
+    parser.add_argument(
+        "--altitude",
+        type=float,
+        default=None,
+        help="station altitude in m; pressure is reduced to sea level when given",
+    )
+    parser.add_argument("--southern", action="store_true", help="station is in the southern hemisphere")
+    parser.add_argument("--language", default=ReplayOptions.language, choices=const.LANGUAGE_CODES)
+    parser.add_argument("--timezone", default=ReplayOptions.timezone, help="zone of naive timestamps and seasons")
+    for name in FIELDS:
+        parser.add_argument(f"--{name.replace('_', '-')}-entity", help=f"entity_id of {name} in long exports")
+    args = parser.parse_args()
+
+    if args.jobs > 1 and args.output_dir is None and len(args.inputs) > 1:
+        parser.error("--jobs with several inputs requires --output-dir")
+    if args.output_dir is not None:
+        Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+
+    options = ReplayOptions(
+        interval=args.interval,
+        pressure_is_sea_level=args.altitude is None,
+        altitude=args.altitude or 0.0,
+        is_northern_hemisphere=not args.southern,
+        language=args.language,
+        timezone=args.timezone,
+        rain_horizon_hours=args.rain_horizon,
+        trend_threshold=args.trend_threshold,
+        kalman_trend=args.kalman_trend,
+        entity_fields={
+            entity_id: name
+            for name in FIELDS
+            if (entity_id := getattr(args, f"{name}_entity"))
+        },
+    )
+
+    if args.jobs > 1 and len(args.inputs) > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            count = len(args.inputs)
+            summaries = list(executor.map(backtest_file, args.inputs, [options] * count, [args.output_dir] * count))
+    else:
+        summaries = [backtest_file(path, options, args.output_dir) for path in args.inputs]
+
+    totals = {model: ScoreCard() for model in MODELS}
+    for summary in summaries:
+        print(
+            f"{summary.name}: {summary.rows} rows, {summary.ticks} ticks "
+            f"({summary.skipped_ticks} without pressure)",
+            file=sys.stderr,
+        )
+        for model in MODELS:
+            totals[model].merge(summary.cards[model])
+            print(f"  {model}: {summary.cards[model].describe()}", file=sys.stderr)
+    if len(summaries) > 1:
+        print(f"all stations (trend threshold {options.trend_threshold}):", file=sys.stderr)
+        for model in MODELS:
+            print(f"  {model}: {totals[model].describe()}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,398 @@
+"""Benchmark suite for the forecast engine, rolling histories and coordinator update.
+
+Cases:
+- ``engine.<function>``: every public function of ``forecast_engine`` over a
+  fixed set of random inputs (a missing case is reported as an error);
+- ``history.*``: steady-state append + pruning, ``StationHistory.update``,
+  an update followed by ``pressure_half_changes`` and ``RollingExtremes`` at several buffer sizes;
+- ``coordinator.*``: the full ``_async_update_data`` path against a small
+  fake state machine (skipped when Home Assistant is not installed).
+
+Results are nanoseconds per call (best of ``--repeat`` runs), printed and
+optionally written as JSON. ``--compare`` checks them against a saved
+baseline and exits with 1 when a case is slower than ``--tolerance`` percent.
+
+Usage:
+  python tools/benchmark.py [--output current.json] [--compare baseline.json]
+      [--tolerance 10] [--filter engine.] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable, Sequence
+from datetime import datetime, timedelta
+import importlib
+import inspect
+import json
+from pathlib import Path
+import platform
+import random
+import sys
+import timeit
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+from _offline import PACKAGE_DIR, load
+
+const = load("const")
+engine = load("forecast_engine")
+estimators = load("estimators")
+history = load("history")
+texts = load("texts")
+
+SAMPLE_COUNT = 1000
+HISTORY_SIZES = (128, 1024, 8192)
+RESULTS_VERSION = 1
+
+
+def _engine_cases(rng: random.Random) -> dict[str, tuple[Callable[..., Any], list[tuple[Any, ...]]]]:
+    """Return (function, argument tuples) for every public engine function."""
+    now = datetime(2026, 4, 15, 12, 0)
+    p0 = [rng.uniform(960, 1050) for _ in range(SAMPLE_COUNT)]
+    change = [rng.uniform(-4, 4) for _ in range(SAMPLE_COUNT)]
+    direction = [rng.uniform(0, 360) for _ in range(SAMPLE_COUNT)]
+    speed = [rng.choice((0.0, rng.uniform(1, 40))) for _ in range(SAMPLE_COUNT)]
+    bundles = [texts.get_text_bundle(code) for code in const.LANGUAGE_CODES]
+    language = [rng.choice(bundles) for _ in range(SAMPLE_COUNT)]
+    forecast_args = [
+        (p0[i], change[i], direction[i], speed[i], bool(i % 2), language[i], now) for i in range(SAMPLE_COUNT)
+    ]
+    code_args = [(p0[i], change[i], direction[i], speed[i], bool(i % 2), now) for i in range(SAMPLE_COUNT)]
+    detail = engine.zambretti_detail(4, False, now)
+    slope_times = [float(t) for t in range(0, 5400, 300)]
+    slope_values = [10 + 0.01 * t / 60 + rng.uniform(-0.2, 0.2) for t in slope_times]
+
+    return {
+        "compact_detail": (engine.compact_detail, [(detail, bool(i % 2)) for i in range(SAMPLE_COUNT)]),
+        "compute_all": (
+            engine.compute_all,
+            [(engine.ForecastInputs(*args[:5], now), args[5]) for args in forecast_args],
+        ),
+        "estimate_temperature_slope_c_per_hour": (
+            engine.estimate_temperature_slope_c_per_hour,
+            [(slope_times, slope_values, 5400.0, 0.5)],
+        ),
+        "forecast_letter_from_number": (
+            engine.forecast_letter_from_number,
+            [(rng.randrange(26),) for _ in range(SAMPLE_COUNT)],
+        ),
+        "get_language_index": (
+            engine.get_language_index,
+            [(rng.choice(const.LANGUAGE_CODES),) for _ in range(SAMPLE_COUNT)],
+        ),
+        "is_deepening_low": (
+            engine.is_deepening_low,
+            [(rng.randrange(9), value) for value in change],
+        ),
+        "neg_zam_detail": (
+            engine.neg_zam_detail,
+            [(rng.randrange(26), bool(i % 2), now) for i in range(SAMPLE_COUNT)],
+        ),
+        "neg_zam_code": (engine.neg_zam_code, code_args),
+        "neg_zam_forecast": (engine.neg_zam_forecast, forecast_args),
+        "pressure_tendency_code": (
+            engine.pressure_tendency_code,
+            [(rng.uniform(-3, 3), rng.uniform(-3, 3)) for _ in range(SAMPLE_COUNT)],
+        ),
+        "pressure_to_sea_level": (
+            engine.pressure_to_sea_level,
+            [(p0[i], rng.uniform(-10, 30), rng.uniform(0, 1500)) for i in range(SAMPLE_COUNT)],
+        ),
+        "pressure_trend_index": (engine.pressure_trend_index, [(value,) for value in change]),
+        "pressure_trend_output": (engine.pressure_trend_output, list(zip(change, language))),
+        "short_temperature_forecast": (
+            engine.short_temperature_forecast,
+            [
+                (rng.uniform(-10, 30), rng.uniform(-2, 2), 180.0, 540.0, rng.uniform(-3, 3))
+                for _ in range(SAMPLE_COUNT)
+            ],
+        ),
+        "short_term_codes": (engine.short_term_codes, [(value,) for value in p0]),
+        "short_term_conditions": (engine.short_term_conditions, list(zip(p0, language))),
+        "wind_compass_text": (engine.wind_compass_text, [(value,) for value in direction]),
+        "wind_factor": (engine.wind_factor, [(value,) for value in direction]),
+        "wind_sector_index": (engine.wind_sector_index, [(value,) for value in direction]),
+        "wind_speed_factor": (engine.wind_speed_factor, [(value,) for value in speed]),
+        "zambretti_detail": (
+            engine.zambretti_detail,
+            [(rng.randrange(26), bool(i % 2), now) for i in range(SAMPLE_COUNT)],
+        ),
+        "zambretti_forecast": (engine.zambretti_forecast, forecast_args),
+        "zambretti_type": (engine.zambretti_type, code_args),
+    }
+
+
+def _public_engine_functions() -> list[str]:
+    """Return the names of public functions defined in the engine module."""
+    return sorted(
+        name
+        for name, function in inspect.getmembers(engine, inspect.isfunction)
+        if not name.startswith("_") and function.__module__ == engine.__name__
+    )
+
+
+def _time_per_call(run: Callable[[], object], calls: int, repeat: int) -> float:
+    """Return the best time per call in nanoseconds."""
+    timer = timeit.Timer(run)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / (number * calls) * 1e9
+
+
+def bench_engine(results: dict[str, float], repeat: int, selected: Callable[[str], bool]) -> list[str]:
+    """Benchmark engine functions and return the ones without a case."""
+    cases = _engine_cases(random.Random(42))
+    for name, (function, samples) in sorted(cases.items()):
+        key = f"engine.{name}"
+        if not selected(key):
+            continue
+
+        def run(function: Callable[..., Any] = function, samples: Sequence[tuple[Any, ...]] = samples) -> None:
+            for args in samples:
+                function(*args)
+
+        results[key] = _time_per_call(run, len(samples), repeat)
+    return [name for name in _public_engine_functions() if name not in cases]
+
+
+def bench_history(results: dict[str, float], repeat: int, selected: Callable[[str], bool]) -> None:
+    """Benchmark steady-state history updates at several buffer sizes."""
+    window = const.PRESSURE_HISTORY_WINDOW.total_seconds()
+    for size in HISTORY_SIZES:
+        key = f"history.append_evict[n={size}]"
+        if selected(key):
+            buffer = history.HistoryBuffer(size)
+            step = window / size
+            clock = [0.0]
+            for _ in range(size):
+                clock[0] += step
+                buffer.append(clock[0], 1013.0)
+
+            def run(buffer: Any = buffer, step: float = step, clock: list[float] = clock) -> None:
+                clock[0] += step
+                buffer.append(clock[0], 1013.0)
+                buffer.evict_before(clock[0] - window)
+
+            results[key] = _time_per_call(run, 1, repeat)
+
+        key = f"history.station_update[n={size}]"
+        if selected(key):
+            station = history.StationHistory(size)
+            step = window / size
+            rng = random.Random(size)
+            clock = [0.0]
+            for _ in range(size):
+                clock[0] += step
+                station.update(clock[0], 1013.0 + rng.uniform(-1, 1), 12.0 + rng.uniform(-1, 1))
+
+            def run(station: Any = station, step: float = step, clock: list[float] = clock) -> None:
+                clock[0] += step
+                station.update(clock[0], 1013.0, 12.0)
+
+            results[key] = _time_per_call(run, 1, repeat)
+
+        key = f"history.pressure_half_changes[n={size}]"
+        if selected(key):
+            # One tick: ingest a sample, which moves the fits, then read them.
+            station = history.StationHistory(size, bucket_seconds=window / size)
+            step = window / size
+            rng = random.Random(size)
+            clock = [0.0]
+            for _ in range(size):
+                clock[0] += step
+                station.update_windows(clock[0], 1013.0 + rng.uniform(-1, 1), None)
+
+            def run(station: Any = station, step: float = step, clock: list[float] = clock) -> None:
+                clock[0] += step
+                station.update_windows(clock[0], 1013.0, None)
+                station.pressure_half_changes(clock[0])
+
+            results[key] = _time_per_call(run, 1, repeat)
+
+        key = f"history.extremes_update[n={size}]"
+        if selected(key):
+            # Random walk: add, evict and read two windows of the retained span.
+            extremes = estimators.RollingExtremes()
+            step = window / size
+            rng = random.Random(size)
+            state = [0.0, 1013.0]
+            for _ in range(size):
+                state[0] += step
+                state[1] += rng.uniform(-0.1, 0.1)
+                extremes.add(state[0], state[1])
+
+            def run(extremes: Any = extremes, step: float = step, state: list[float] = state, rng: Any = rng) -> None:
+                state[0] += step
+                state[1] += rng.uniform(-0.1, 0.1)
+                extremes.add(state[0], state[1])
+                extremes.evict_before(state[0] - window)
+                extremes.minimum(state[0] - window / 2)
+                extremes.maximum(state[0] - window / 2)
+                extremes.minimum(state[0] - window)
+                extremes.maximum(state[0] - window)
+
+            results[key] = _time_per_call(run, 1, repeat)
+
+
+class _FakeStates:
+    """Minimal stand-in for ``hass.states``."""
+
+    def __init__(self, values: dict[str, str]) -> None:
+        """Initialize states from entity_id -> state strings."""
+        self._states = {
+            entity_id: SimpleNamespace(entity_id=entity_id, state=value, name=entity_id)
+            for entity_id, value in values.items()
+        }
+
+    def get(self, entity_id: str) -> Any:
+        """Return the state object of an entity."""
+        return self._states.get(entity_id)
+
+
+class _NullStore:
+    """Store stand-in that drops scheduled writes."""
+
+    def async_delay_save(self, data_func: Callable[[], Any], delay: float = 0) -> None:
+        """Ignore the write."""
+
+
+async def _run_inline(function: Callable[..., Any], *args: Any) -> Any:
+    """Stand-in for ``hass.async_add_executor_job`` running the job inline."""
+    return function(*args)
+
+
+def _run_coroutine(coroutine: Any) -> Any:
+    """Run a coroutine that never suspends, without an event loop."""
+    try:
+        coroutine.send(None)
+    except StopIteration as result:
+        return result.value
+    raise RuntimeError("coroutine suspended")
+
+
+def bench_coordinator(results: dict[str, float], repeat: int, selected: Callable[[str], bool]) -> str | None:
+    """Benchmark the coordinator update; return a reason when skipped."""
+    sys.path.insert(0, str(PACKAGE_DIR.parent.parent))
+    try:
+        from homeassistant import config_entries
+    except ImportError:
+        return "Home Assistant is not installed"
+    coordinator_module = importlib.import_module("custom_components.barocast_ha.coordinator")
+
+    states = _FakeStates(
+        {
+            "sensor.pressure": "1008.4",
+            "sensor.temperature": "14.2",
+            "sensor.wind_speed": "12.0",
+            "sensor.wind_direction": "230",
+            "sun.sun": "above_horizon",
+        }
+    )
+    hass = SimpleNamespace(states=states, data={}, async_add_executor_job=_run_inline)
+    variants = (
+        ("scalar", {}),
+        ("compact", {"attribute_mode": "compact"}),
+    )
+    for variant, options in variants:
+        key = f"coordinator.update_data[{variant}]"
+        if not selected(key):
+            continue
+        entry = SimpleNamespace(
+            entry_id=f"bench_{variant}",
+            title="Barocast HA",
+            data={
+                "pressure_entity": "sensor.pressure",
+                "temperature_entity": "sensor.temperature",
+                "wind_speed_entity": "sensor.wind_speed",
+                "wind_direction_entity": "sensor.wind_direction",
+                "pressure_is_sea_level": False,
+                "altitude": 250.0,
+                **options,
+            },
+            options={},
+            async_on_unload=lambda _: None,
+        )
+        config_entries.current_entry.set(entry)
+        with patch.object(coordinator_module, "_history_store", lambda *_: _NullStore()):
+            coordinator = coordinator_module.BarocastHACoordinator(hass, entry, SimpleNamespace())
+        _run_coroutine(coordinator.async_prepare_engine())
+
+        # Fill the windows as a long-running instance would have them.
+        start = datetime.now() - timedelta(hours=3)
+        for minute in range(0, 180, 5):
+            timestamp = (start + timedelta(minutes=minute)).timestamp()
+            coordinator._history.update(timestamp, 1010.0 - minute / 100, 14.0 + minute / 300)
+
+        results[key] = _time_per_call(lambda: _run_coroutine(coordinator._async_update_data()), 1, repeat)
+    return None
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], tolerance: float) -> int:
+    """Print the comparison with a baseline and return the number of regressions."""
+    regressions = 0
+    for key in sorted(set(results) | set(baseline)):
+        if key not in results or key not in baseline:
+            print(f"{key:48s} {'only in ' + ('baseline' if key in baseline else 'current'):>30s}")
+            continue
+        ratio = results[key] / baseline[key]
+        marker = ""
+        if ratio > 1 + tolerance / 100:
+            regressions += 1
+            marker = "  REGRESSION"
+        elif ratio < 1 - tolerance / 100:
+            marker = "  faster"
+        print(f"{key:48s} {baseline[key]:10.1f} -> {results[key]:10.1f} ns  x{ratio:5.2f}{marker}")
+    return regressions
+
+
+def main() -> int:
+    """Run the suite, write results and compare them with a baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="baseline JSON written by a previous --output")
+    parser.add_argument("--tolerance", type=float, default=10.0, help="allowed slowdown in percent")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs per case (best is kept)")
+    args = parser.parse_args()
+
+    def selected(key: str) -> bool:
+        return args.filter in key
+
+    results: dict[str, float] = {}
+    missing = bench_engine(results, args.repeat, selected)
+    bench_history(results, args.repeat, selected)
+    skipped = bench_coordinator(results, args.repeat, selected)
+
+    for key, value in results.items():
+        print(f"{key:48s} {value:10.1f} ns/call")
+    if skipped:
+        print(f"coordinator cases skipped: {skipped}")
+    if missing:
+        print(f"error: no benchmark case for engine functions: {', '.join(missing)}", file=sys.stderr)
+
+    if args.output:
+        payload = {
+            "version": RESULTS_VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }
+        Path(args.output).write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    regressions = 0
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        if baseline.get("version") != RESULTS_VERSION:
+            print(f"error: unsupported baseline version {baseline.get('version')}", file=sys.stderr)
+            return 2
+        print(f"\ncomparison with {args.compare} (tolerance {args.tolerance:g}%):")
+        reference = {key: value for key, value in baseline["results"].items() if selected(key)}
+        regressions = compare(results, reference, args.tolerance)
+        print(f"{regressions} regression(s)")
+
+    return 1 if regressions or missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Exhaustive equivalence check of ``compute_all`` against the separate engine functions.
+
+Every p0 step (900.0..1100.0 hPa by 0.1), trend, season, hemisphere, calm
+flag and wind direction interval of ``WIND_SECTORS`` (its edges and a point
+inside each interval) is evaluated with ``compute_all`` and with the
+separate trend, wind, short-term, ``zambretti_forecast`` and
+``neg_zam_forecast`` functions; any difference is reported.
+
+Usage: python tools/check_compute_all.py
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+import sys
+import time
+
+from _offline import load
+
+engine = load("forecast_engine")
+texts = load("texts").get_text_bundle("en")
+
+
+def _directions() -> list[float]:
+    """Return directions covering every wind sector row and boundary."""
+    edges = engine.WIND_SECTOR_EDGES
+    directions = [0.0, -10.0, 359.9, 360.0, 400.0, float("nan")]
+    directions.extend(edges)
+    directions.extend((low + high) / 2 for low, high in zip(edges, edges[1:]))
+    return directions
+
+
+def _separate_outputs(args: tuple) -> tuple:
+    """Return the outputs of ``compute_all`` from the separate engine functions."""
+    p0_hpa, change, direction = args[:3]
+    return (
+        engine.pressure_trend_output(change, texts),
+        engine.wind_factor(direction),
+        engine.wind_compass_text(direction),
+        engine.short_term_conditions(p0_hpa, texts),
+        engine.zambretti_forecast(*args),
+        engine.neg_zam_forecast(*args),
+    )
+
+
+def _fused_outputs(result: tuple) -> tuple:
+    """Return the ``_separate_outputs`` view of a ``ForecastResult``."""
+    return (
+        (result.trend_text, result.trend_code),
+        result.wind_factor,
+        result.wind_compass,
+        (result.short_term_condition_text, result.pressure_system_text),
+        (result.zambretti_text, result.zambretti_type, result.zambretti_letter),
+        (result.neg_zam_text, result.neg_zam_number, result.neg_zam_letter),
+    )
+
+
+def main() -> int:
+    """Run the check and return a process exit code."""
+    started = time.perf_counter()
+    directions = _directions()
+    mismatches = 0
+    checked = 0
+    for deci_hpa in range(9000, 11001):
+        p0_hpa = deci_hpa / 10
+        for change in (-2.0, -1.6, 0.0, 1.6, 2.0):
+            for now in (datetime(2026, 1, 15), datetime(2026, 7, 15)):
+                for is_northern in (True, False):
+                    for wind_speed in (0.0, 10.0):
+                        for direction in directions:
+                            args = (p0_hpa, change, direction, wind_speed, is_northern, texts, now)
+                            inputs = engine.ForecastInputs(p0_hpa, change, direction, wind_speed, is_northern, now)
+                            checked += 1
+                            expected = _separate_outputs(args)
+                            actual = _fused_outputs(engine.compute_all(inputs, texts))
+                            if expected != actual:
+                                mismatches += 1
+                                if mismatches <= 20:
+                                    print(f"compute_all mismatch for {args}: {expected} != {actual}")
+
+    elapsed = time.perf_counter() - started
+    print(f"checked {checked} input combinations in {elapsed:.0f} s, {mismatches} mismatches")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
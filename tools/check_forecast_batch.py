@@ -0,0 +1,119 @@
+"""Exhaustive equivalence check of ``forecast_batch`` against the scalar engine.
+
+Every p0 step (900.0..1100.0 hPa by 0.1), trend, season, hemisphere, calm
+flag and wind direction interval of ``WIND_SECTORS`` (its edges, their
+neighbouring floats and a point inside each interval) is evaluated with
+``forecast_batch`` and with ``zambretti_type`` and ``neg_zam_code``. The
+vectorized wind helpers (``wind_sector_indices``, ``wind_factor_batch`` and
+``wind_compass_batch``) are compared with ``wind_sector_index``,
+``wind_factor`` and ``wind_compass_text`` over the same directions plus a
+0.05 degree sweep of -720..720. Any difference is reported.
+
+Requires NumPy. Usage: python tools/check_forecast_batch.py
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+import math
+import sys
+import time
+
+import numpy as np
+
+from _offline import load
+
+engine = load("forecast_engine")
+batch = load("forecast_batch")
+
+MAX_REPORTED = 20
+
+
+def _directions() -> list[float]:
+    """Return directions covering every wind sector row and boundary."""
+    edges = engine.WIND_SECTOR_EDGES
+    directions = [0.0, -10.0, 359.9, 360.0, 400.0, float("nan")]
+    for edge in edges:
+        directions.extend((math.nextafter(edge, -math.inf), edge, math.nextafter(edge, math.inf)))
+    directions.extend((low + high) / 2 for low, high in zip(edges, edges[1:]))
+    return directions
+
+
+def check_wind_helpers(directions: list[float]) -> tuple[int, int]:
+    """Compare the vectorized wind helpers with the scalar ones."""
+    sweep = [step / 20 for step in range(-14400, 14401)]
+    values = directions + sweep
+    pairs = (
+        ("wind_sector_indices", batch.wind_sector_indices, engine.wind_sector_index),
+        ("wind_factor_batch", batch.wind_factor_batch, engine.wind_factor),
+        ("wind_compass_batch", batch.wind_compass_batch, engine.wind_compass_text),
+    )
+    mismatches = 0
+    for name, vectorized, scalar in pairs:
+        results = vectorized(np.array(values)).tolist()
+        for direction, actual in zip(values, results):
+            expected = scalar(direction)
+            if expected != actual:
+                mismatches += 1
+                if mismatches <= MAX_REPORTED:
+                    print(f"{name} mismatch for {direction!r}: {expected!r} != {actual!r}")
+    return len(pairs) * len(values), mismatches
+
+
+def check_forecasts(directions: list[float]) -> tuple[int, int]:
+    """Compare ``forecast_batch`` with the scalar forecasts, one p0 sweep per combination."""
+    p0_values = [deci_hpa / 10 for deci_hpa in range(9000, 11001)]
+    p0 = np.array(p0_values)
+    ones = np.ones_like(p0)
+    checked = 0
+    mismatches = 0
+    for change in (-2.0, -1.6, 0.0, 1.6, 2.0):
+        for now in (datetime(2026, 1, 15), datetime(2026, 7, 15)):
+            timestamps = np.full(p0.shape, np.datetime64(now))
+            for is_northern in (True, False):
+                for wind_speed in (0.0, 10.0):
+                    for direction in directions:
+                        result = batch.forecast_batch(
+                            p0, change * ones, direction * ones, wind_speed * ones, timestamps, is_northern
+                        )
+                        actual_rows = zip(
+                            result.zambretti_type.tolist(),
+                            result.zambretti_letter.tolist(),
+                            result.neg_zam_number.tolist(),
+                            result.neg_zam_letter.tolist(),
+                            result.neg_zam_exceptional.tolist(),
+                        )
+                        for p0_hpa, actual in zip(p0_values, actual_rows):
+                            args = (p0_hpa, change, direction, wind_speed, is_northern, now)
+                            forecast_type = engine.zambretti_type(*args)
+                            z_number, exceptional = engine.neg_zam_code(*args)
+                            expected = (
+                                forecast_type,
+                                engine.TYPE_LETTERS[forecast_type],
+                                z_number,
+                                engine.forecast_letter_from_number(z_number),
+                                exceptional,
+                            )
+                            checked += 1
+                            if expected != actual:
+                                mismatches += 1
+                                if mismatches <= MAX_REPORTED:
+                                    print(f"forecast_batch mismatch for {args}: {expected} != {actual}")
+    return checked, mismatches
+
+
+def main() -> int:
+    """Run the checks and return a process exit code."""
+    started = time.perf_counter()
+    directions = _directions()
+    wind_checked, wind_mismatches = check_wind_helpers(directions)
+    forecast_checked, forecast_mismatches = check_forecasts(directions)
+    elapsed = time.perf_counter() - started
+    print(f"checked {wind_checked} wind helper values, {wind_mismatches} mismatches")
+    print(f"checked {forecast_checked} forecast combinations, {forecast_mismatches} mismatches")
+    print(f"done in {elapsed:.0f} s")
+    return 1 if wind_mismatches or forecast_mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())